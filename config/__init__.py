@@ -4,9 +4,57 @@
 
 from .settings import (
     UPBIT_API_BASE_URL,
+    UPBIT_WEBSOCKET_URL,
     API_ENDPOINTS,
     REQUEST_TIMEOUT,
     MAX_RETRIES,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_MAX_ELAPSED,
+    RETRY_JITTER,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_POOL_BLOCK,
+    HTTP_KEEP_ALIVE,
+    API_TRANSPORT,
+    RATE_LIMIT_ENABLED,
+    RATE_LIMITS,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_BLOCK_SECONDS,
+    CACHE_DIR,
+    MARKET_CATALOG_PATH,
+    MARKET_CATALOG_TTL,
+    MARKET_CATALOG_RETRY_INTERVAL,
+    PRICE_CACHE_ENABLED,
+    PRICE_CACHE_TTL,
+    PRICE_CACHE_MAX_STALENESS,
+    PRICE_CACHE_WAIT_TIMEOUT,
+    PRICE_BATCH_ENABLED,
+    PRICE_BATCH_WINDOW,
+    PRICE_BATCH_MAX_SIZE,
+    PRICE_BATCH_WAIT_TIMEOUT,
+    PRICE_HUB_SOURCE,
+    PRICE_HUB_POLL_INTERVAL,
+    PRICE_HUB_SNAPSHOT_TIMEOUT,
+    CANDLES_MAX_PER_REQUEST,
+    HISTORY_MAX_CONCURRENCY,
+    RESAMPLE_TIMEFRAMES,
+    DCA_FEE_RATE,
+    CANDLE_STORE_ENABLED,
+    CANDLE_STORE_PATH,
+    CANDLE_ARCHIVE_DIR,
+    JSON_BACKEND,
+    API_CASSETTE_MODE,
+    API_CASSETTE_PATH,
+    API_CASSETTE_REPLAY_LATENCY,
+    METRICS_ENABLED,
+    METRICS_LATENCY_BUCKETS,
+    WEBSOCKET_PING_INTERVAL,
+    WEBSOCKET_RECONNECT_DELAY,
+    WEBSOCKET_MAX_RECONNECT_DELAY,
+    ASYNC_MAX_CONCURRENCY,
     CURRENCY_FORMAT,
     PERCENTAGE_FORMAT,
     DATETIME_FORMAT,
@@ -14,14 +62,63 @@ from .settings import (
     DEFAULT_CRYPTOS,
     DEFAULT_PRICE_CHANGE_THRESHOLD,
     DEFAULT_MONITORING_CYCLES,
-    MONITORING_INTERVAL
+    MONITORING_INTERVAL,
+    PRICE_ALERT_USE_STREAM
 )
 
 __all__ = [
     'UPBIT_API_BASE_URL',
+    'UPBIT_WEBSOCKET_URL',
     'API_ENDPOINTS',
     'REQUEST_TIMEOUT',
     'MAX_RETRIES',
+    'RETRY_BASE_DELAY',
+    'RETRY_MAX_DELAY',
+    'RETRY_MAX_ELAPSED',
+    'RETRY_JITTER',
+    'CIRCUIT_BREAKER_FAILURE_THRESHOLD',
+    'CIRCUIT_BREAKER_RECOVERY_TIMEOUT',
+    'HTTP_POOL_CONNECTIONS',
+    'HTTP_POOL_MAXSIZE',
+    'HTTP_POOL_BLOCK',
+    'HTTP_KEEP_ALIVE',
+    'API_TRANSPORT',
+    'RATE_LIMIT_ENABLED',
+    'RATE_LIMITS',
+    'RATE_LIMIT_BURST',
+    'RATE_LIMIT_BLOCK_SECONDS',
+    'CACHE_DIR',
+    'MARKET_CATALOG_PATH',
+    'MARKET_CATALOG_TTL',
+    'MARKET_CATALOG_RETRY_INTERVAL',
+    'PRICE_CACHE_ENABLED',
+    'PRICE_CACHE_TTL',
+    'PRICE_CACHE_MAX_STALENESS',
+    'PRICE_CACHE_WAIT_TIMEOUT',
+    'PRICE_BATCH_ENABLED',
+    'PRICE_BATCH_WINDOW',
+    'PRICE_BATCH_MAX_SIZE',
+    'PRICE_BATCH_WAIT_TIMEOUT',
+    'PRICE_HUB_SOURCE',
+    'PRICE_HUB_POLL_INTERVAL',
+    'PRICE_HUB_SNAPSHOT_TIMEOUT',
+    'CANDLES_MAX_PER_REQUEST',
+    'HISTORY_MAX_CONCURRENCY',
+    'RESAMPLE_TIMEFRAMES',
+    'DCA_FEE_RATE',
+    'CANDLE_STORE_ENABLED',
+    'CANDLE_STORE_PATH',
+    'CANDLE_ARCHIVE_DIR',
+    'JSON_BACKEND',
+    'API_CASSETTE_MODE',
+    'API_CASSETTE_PATH',
+    'API_CASSETTE_REPLAY_LATENCY',
+    'METRICS_ENABLED',
+    'METRICS_LATENCY_BUCKETS',
+    'WEBSOCKET_PING_INTERVAL',
+    'WEBSOCKET_RECONNECT_DELAY',
+    'WEBSOCKET_MAX_RECONNECT_DELAY',
+    'ASYNC_MAX_CONCURRENCY',
     'CURRENCY_FORMAT',
     'PERCENTAGE_FORMAT',
     'DATETIME_FORMAT',
@@ -29,5 +126,6 @@ __all__ = [
     'DEFAULT_CRYPTOS',
     'DEFAULT_PRICE_CHANGE_THRESHOLD',
     'DEFAULT_MONITORING_CYCLES',
-    'MONITORING_INTERVAL'
+    'MONITORING_INTERVAL',
+    'PRICE_ALERT_USE_STREAM'
 ]
\ No newline at end of file
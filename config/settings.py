@@ -3,13 +3,17 @@
 업비트 API 관련 설정 및 상수 정의
 """
 
+import os
+
 # 업비트 API 기본 설정
 UPBIT_API_BASE_URL = "https://api.upbit.com/v1"
+UPBIT_WEBSOCKET_URL = "wss://api.upbit.com/websocket/v1"
 
 # API 엔드포인트
 API_ENDPOINTS = {
     "ticker": f"{UPBIT_API_BASE_URL}/ticker",
     "candles_days": f"{UPBIT_API_BASE_URL}/candles/days",
+    "candles_minutes": f"{UPBIT_API_BASE_URL}/candles/minutes/1",
     "market_all": f"{UPBIT_API_BASE_URL}/market/all"
 }
 
@@ -17,6 +21,102 @@ API_ENDPOINTS = {
 REQUEST_TIMEOUT = 10  # 초
 MAX_RETRIES = 3
 
+# 재시도 정책 설정 (429, 5xx, 연결 실패만 재시도)
+RETRY_BASE_DELAY = 0.5  # 초 (첫 재시도 대기, 이후 2배씩 증가)
+RETRY_MAX_DELAY = 8.0  # 초 (재시도 한 번의 최대 대기)
+RETRY_MAX_ELAPSED = 20.0  # 초 (첫 시도부터 포기까지의 최대 시간)
+RETRY_JITTER = 0.5  # 대기 시간을 무작위로 줄이는 비율 (0~1)
+
+# 회로 차단기 설정
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # 연속 실패 횟수
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 30.0  # 초 (차단 후 복구 확인까지 대기)
+
+# HTTP 연결 풀 설정
+HTTP_POOL_CONNECTIONS = 4  # 캐싱할 호스트별 연결 풀 개수
+HTTP_POOL_MAXSIZE = 16  # 호스트당 최대 동시 연결 수
+HTTP_POOL_BLOCK = True  # 연결이 모두 사용 중이면 반환될 때까지 대기
+HTTP_KEEP_ALIVE = True  # keep-alive 연결 재사용
+
+# API 요청 전송 방식 ('session': keep-alive 연결 풀 / 'plain': 요청마다 새 연결)
+API_TRANSPORT = os.environ.get("UPBIT_API_TRANSPORT", "session")
+
+# 요청 속도 제한 설정 (업비트 시세 API는 그룹별 초당 10회)
+RATE_LIMIT_ENABLED = True
+RATE_LIMITS = {  # 그룹별 초당 요청 수 (버스트 포함 1초 구간에 10회를 넘지 않도록 설정)
+    "ticker": 8,
+    "candles": 8,
+    "market": 8,
+    "default": 8
+}
+RATE_LIMIT_BURST = 2  # 그룹별 최대 연속 요청 수
+RATE_LIMIT_BLOCK_SECONDS = 1.0  # 429 또는 남은 요청 0 응답시 그룹 차단 시간(초)
+
+# 로컬 캐시 설정
+CACHE_DIR = os.environ.get(
+    "UPBIT_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "upbit-analyzer")
+)
+
+# 마켓 목록 캐시 설정
+MARKET_CATALOG_PATH = os.path.join(CACHE_DIR, "market_all.json")
+MARKET_CATALOG_TTL = 6 * 60 * 60  # 초 (6시간)
+MARKET_CATALOG_RETRY_INTERVAL = 60  # 초 (조회 실패 후 재시도 간격)
+
+# 현재가 캐시 설정
+PRICE_CACHE_ENABLED = True
+PRICE_CACHE_TTL = 1.0  # 초 (이 시간 동안은 같은 마켓을 다시 조회하지 않음)
+PRICE_CACHE_MAX_STALENESS = 30.0  # 초 (조회 실패시 이전 가격을 허용하는 최대 시간)
+PRICE_CACHE_WAIT_TIMEOUT = REQUEST_TIMEOUT * MAX_RETRIES  # 초 (진행 중인 조회 대기 한도)
+
+# 현재가 요청 묶음 처리 설정 (get_single_price 요청을 모아 한 번의 티커 요청으로 조회)
+PRICE_BATCH_ENABLED = False
+PRICE_BATCH_WINDOW = 0.005  # 초 (첫 요청 후 다른 요청을 기다리는 시간)
+PRICE_BATCH_MAX_SIZE = 100  # 한 번에 조회할 최대 마켓 수
+PRICE_BATCH_WAIT_TIMEOUT = REQUEST_TIMEOUT * MAX_RETRIES  # 초 (묶음 조회 결과 대기 한도)
+
+# 가격 허브 설정 (프로세스 내 구독자들이 하나의 상위 시세원을 공유)
+PRICE_HUB_SOURCE = "poll"  # 'poll': 현재가 API 주기 조회 / 'stream': WebSocket 체결 시세
+PRICE_HUB_POLL_INTERVAL = 1.0  # 초
+PRICE_HUB_SNAPSHOT_TIMEOUT = 5.0  # 일회성 현재가 조회(snapshot)의 최대 대기 시간(초)
+
+# 과거 데이터 조회 설정
+CANDLES_MAX_PER_REQUEST = 200  # 업비트 캔들 API 요청당 최대 개수
+HISTORY_MAX_CONCURRENCY = 4  # 페이지 동시 조회 수
+
+# 분봉 리샘플링 설정 (1분봉 한 번 받아 모든 시간 단위 캔들을 로컬에서 생성)
+RESAMPLE_TIMEFRAMES = ("5m", "15m", "1h", "4h", "1d", "1w")
+
+# 적립식 투자(DCA) 백테스트 설정
+DCA_FEE_RATE = 0.0005  # 업비트 KRW 마켓 거래 수수료율 (0.05%)
+
+# 캔들 저장소 설정
+CANDLE_STORE_ENABLED = True
+CANDLE_STORE_PATH = os.path.join(CACHE_DIR, "candles.sqlite3")
+
+# 캔들 아카이브 설정 (마켓/캔들 단위별 고정 길이 바이너리 파일, mmap으로 읽음)
+CANDLE_ARCHIVE_DIR = os.path.join(CACHE_DIR, "candle_archive")
+
+# JSON 디코딩 설정 ('auto': orjson이 설치되어 있으면 사용, 'json': 표준 라이브러리만 사용)
+JSON_BACKEND = os.environ.get("UPBIT_JSON_BACKEND", "auto")
+
+# API 기록/재생(cassette) 설정
+# 'off': 실제 API 사용 / 'record': 실제 응답을 파일에 기록 / 'replay': 기록된 응답만 사용 (네트워크 없음)
+API_CASSETTE_MODE = os.environ.get("UPBIT_CASSETTE_MODE", "off")
+API_CASSETTE_PATH = os.environ.get("UPBIT_CASSETTE_PATH", os.path.join(CACHE_DIR, "cassette.jsonl.gz"))
+API_CASSETTE_REPLAY_LATENCY = os.environ.get("UPBIT_CASSETTE_REPLAY_LATENCY", "0") == "1"  # 기록된 지연 재현
+
+# API 지표 수집 설정 (비활성화시 수집 비용 없음)
+METRICS_ENABLED = os.environ.get("UPBIT_METRICS_ENABLED", "0") == "1"
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # 초
+
+# WebSocket 스트리밍 설정
+WEBSOCKET_PING_INTERVAL = 30.0  # 초 (이 시간 동안 메시지가 없으면 ping 전송)
+WEBSOCKET_RECONNECT_DELAY = 1.0  # 초 (첫 재연결 대기, 이후 2배씩 증가)
+WEBSOCKET_MAX_RECONNECT_DELAY = 30.0  # 초
+
+# 비동기 클라이언트 설정
+ASYNC_MAX_CONCURRENCY = 16  # 이벤트 루프당 동시 요청 수 (연결 풀 크기와 맞춤)
+
 # 출력 포맷 설정
 CURRENCY_FORMAT = "{:,.0f}"
 PERCENTAGE_FORMAT = "{:.2f}"
@@ -35,4 +135,5 @@ DEFAULT_CRYPTOS = [
 # 알림 시스템 기본 설정
 DEFAULT_PRICE_CHANGE_THRESHOLD = 0.05  # 5% 변동률
 DEFAULT_MONITORING_CYCLES = 10  # 기본 모니터링 횟수
-MONITORING_INTERVAL = 5  # 초 (실제 구현시 사용)
\ No newline at end of file
+MONITORING_INTERVAL = 5  # 초 (실제 구현시 사용)
+PRICE_ALERT_USE_STREAM = True  # True면 WebSocket 체결 시세, False면 폴링 현재가로 모니터링
\ No newline at end of file
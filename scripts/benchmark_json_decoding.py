@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+API 응답 디코딩 벤치마크
+전체 KRW 마켓 티커 응답과 200개 일봉 응답을 기준으로
+전체 파싱(json / orjson)과 필요한 필드만 읽는 디코더의 시간과 메모리 사용량을 비교
+
+사용법:
+    python scripts/benchmark_json_decoding.py
+    python scripts/benchmark_json_decoding.py --markets 250 --repeat 500
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Any
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.json_decoder import decode_ticker_prices, decode_candle_closes
+from tests.helpers.test_data_generator import TestDataGenerator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def build_payloads(market_count: int) -> Dict[str, bytes]:
+    """업비트 응답과 같은 형식(공백 없는 JSON)의 티커/일봉 응답 바이트를 생성"""
+    tickers = [
+        TestDataGenerator.generate_ticker_data(f"KRW-COIN{i}", 1000.0 + i)
+        for i in range(market_count)
+    ]
+    candles = TestDataGenerator.generate_candle_data("KRW-BTC", 200)
+    return {
+        "ticker": json.dumps(tickers, separators=(",", ":")).encode("utf-8"),
+        "candles": json.dumps(candles, separators=(",", ":")).encode("utf-8")
+    }
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """함수의 1회 평균 실행 시간(ms)과 최대 메모리 사용량(KB)을 측정"""
+    seconds = min(timeit.repeat(func, number=repeat, repeat=3)) / repeat
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"ms": seconds * 1000, "peak_kb": peak / 1024}
+
+
+def run_benchmark(market_count: int, repeat: int) -> List[Dict[str, Any]]:
+    payloads = build_payloads(market_count)
+    ticker, candles = payloads["ticker"], payloads["candles"]
+
+    cases = [
+        ("ticker", "json.loads + dict", lambda: {
+            item["market"]: float(item["trade_price"]) for item in json.loads(ticker)
+        }),
+        ("ticker", "decode_ticker_prices", lambda: decode_ticker_prices(ticker)),
+        ("candles", "json.loads + dict", lambda: [
+            (item["candle_date_time_kst"], float(item["trade_price"])) for item in json.loads(candles)
+        ]),
+        ("candles", "decode_candle_closes", lambda: decode_candle_closes(candles)),
+    ]
+    if orjson is not None:
+        cases.insert(1, ("ticker", "orjson.loads + dict", lambda: {
+            item["market"]: float(item["trade_price"]) for item in orjson.loads(ticker)
+        }))
+        cases.insert(4, ("candles", "orjson.loads + dict", lambda: [
+            (item["candle_date_time_kst"], float(item["trade_price"])) for item in orjson.loads(candles)
+        ]))
+
+    results = []
+    for payload_name, name, func in cases:
+        result = measure(func, repeat)
+        result.update({"payload": payload_name, "name": name, "bytes": len(payloads[payload_name])})
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 응답 디코딩 벤치마크")
+    parser.add_argument("--markets", type=int, default=200, help="티커 응답의 마켓 수 (기본값: 200)")
+    parser.add_argument("--repeat", type=int, default=200, help="측정 반복 횟수 (기본값: 200)")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.markets, args.repeat)
+
+    print(f"\n⏱️  API 응답 디코딩 벤치마크 (티커 {args.markets}개 마켓, 일봉 200개)")
+    print("=" * 72)
+    print(f"{'응답':<8} {'방식':<26} {'크기(KB)':>10} {'시간(ms)':>10} {'메모리(KB)':>12}")
+    print("-" * 72)
+    for result in results:
+        print(f"{result['payload']:<8} {result['name']:<26} {result['bytes'] / 1024:>10.1f} "
+              f"{result['ms']:>10.3f} {result['peak_kb']:>12.1f}")
+    print("=" * 72)
+    if orjson is None:
+        print("ℹ️  orjson이 설치되어 있지 않아 표준 json만 비교했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+API 전송 방식(transport) 벤치마크
+로컬 가짜 업비트 서버에 같은 작업(현재가 조회 + 과거 일봉 조회)을 전송 방식별로 실행하여
+소요 시간과 요청 수를 비교 (캐시와 캔들 저장소는 끄고 매번 서버에 요청)
+
+사용법:
+    python scripts/benchmark_transports.py
+    python scripts/benchmark_transports.py --rounds 50 --latency uniform:0.005:0.02
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import API_ENDPOINTS
+from utils import api_client
+from utils.rate_limiter import RateLimiter, set_rate_limiter
+from utils.transport import TRANSPORTS, create_transport
+from tests.helpers.fake_upbit_server import FakeUpbitServer, parse_latency
+
+MARKETS = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-ADA", "KRW-DOGE"]
+
+
+def run_workload(transport, rounds: int, history_days: int) -> None:
+    """현재가 일괄 조회, 단일 현재가 조회, 과거 일봉 조회를 rounds번 반복"""
+    for _ in range(rounds):
+        api_client.get_current_prices(MARKETS, transport)
+        api_client.get_single_price(MARKETS[0], transport)
+        api_client.get_historical_data(MARKETS[0], history_days, transport)
+
+
+def run_benchmark(names: List[str], rounds: int, history_days: int, latency: str) -> List[Dict[str, Any]]:
+    # 전송 방식만 비교하도록 캐시, 저장소, 속도 제한을 끔
+    api_client.PRICE_CACHE_ENABLED = False
+    api_client.PRICE_BATCH_ENABLED = False
+    api_client.CANDLE_STORE_ENABLED = False
+    set_rate_limiter(RateLimiter({"default": 100000}, burst=100000))
+
+    results = []
+    with FakeUpbitServer(latency=parse_latency(latency)) as server:
+        API_ENDPOINTS.update(server.api_endpoints())
+        for name in names:
+            transport = create_transport(name)
+            run_workload(transport, 1, history_days)  # 연결 준비
+            before = server.request_count()
+
+            started = time.perf_counter()
+            run_workload(transport, rounds, history_days)
+            elapsed = time.perf_counter() - started
+            transport.close()
+
+            requests_sent = server.request_count() - before
+            results.append({
+                "name": name,
+                "seconds": elapsed,
+                "requests": requests_sent,
+                "ms_per_request": elapsed / requests_sent * 1000 if requests_sent else 0.0
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 전송 방식 벤치마크")
+    parser.add_argument("--transports", default=",".join(TRANSPORTS),
+                        help=f"비교할 전송 방식 (기본값: {','.join(TRANSPORTS)})")
+    parser.add_argument("--rounds", type=int, default=20, help="작업 반복 횟수 (기본값: 20)")
+    parser.add_argument("--days", type=int, default=400, help="과거 일봉 조회 일수 (기본값: 400)")
+    parser.add_argument("--latency", default="0", help="가짜 서버 응답 지연 (예: 0.01, uniform:0.005:0.02)")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.transports.split(","), args.rounds, args.days, args.latency)
+
+    print(f"\n⏱️  API 전송 방식 벤치마크 ({args.rounds}회 반복, 지연 {args.latency})")
+    print("=" * 56)
+    print(f"{'전송 방식':<12} {'요청 수':>8} {'전체(s)':>10} {'요청당(ms)':>12}")
+    print("-" * 56)
+    for result in results:
+        print(f"{result['name']:<12} {result['requests']:>8} {result['seconds']:>10.3f} "
+              f"{result['ms_per_request']:>12.3f}")
+    print("=" * 56)
+
+
+if __name__ == "__main__":
+    main()
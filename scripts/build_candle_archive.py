@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+캔들 아카이브 구축 스크립트
+KRW 마켓 전체(또는 지정한 마켓)의 일봉/1분봉을 바이너리 캔들 아카이브에 받아 두고,
+이미 받은 마켓은 마지막 캔들 이후만 추가로 받음
+
+사용법:
+    python scripts/build_candle_archive.py --unit days --count 1825
+    python scripts/build_candle_archive.py --unit minutes/1 --count 10080 --markets KRW-BTC,KRW-ETH
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.api_client import CANDLE_UNITS, sync_candle_archive
+from utils.candle_archive import get_candle_archive
+from utils.market_catalog import get_markets_by_quote
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캔들 아카이브 구축")
+    parser.add_argument("--unit", default="days", choices=list(CANDLE_UNITS), help="캔들 단위 (기본값: days)")
+    parser.add_argument("--count", type=int, default=5 * 365, help="보관할 캔들 수 (기본값: 1825)")
+    parser.add_argument("--markets", default="", help="쉼표로 구분한 마켓 코드 (기본값: KRW 마켓 전체)")
+    args = parser.parse_args()
+
+    markets = [market for market in args.markets.split(",") if market] or get_markets_by_quote("KRW")
+    if not markets:
+        print("❌ 마켓 목록을 불러오지 못했습니다.")
+        return
+
+    archive = get_candle_archive()
+    print(f"📦 캔들 아카이브 구축: {len(markets)}개 마켓, {args.unit} {args.count}개 → {archive.root}")
+
+    started = time.perf_counter()
+    failed = []
+    for index, market in enumerate(markets, 1):
+        written = sync_candle_archive(market, args.count, args.unit)
+        if written is None:
+            failed.append(market)
+            continue
+        info = archive.info(market, args.unit)
+        print(f"  [{index}/{len(markets)}] {market}: +{written}개 (총 {info.record_count}개)")
+
+    print(f"\n✅ 완료 ({time.perf_counter() - started:.1f}초)")
+    if failed:
+        print(f"⚠️  실패한 마켓: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
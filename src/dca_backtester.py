@@ -0,0 +1,277 @@
+"""
+적립식 투자(DCA) 백테스터
+일정 금액을 N일마다 매수했다면 지금 얼마가 되었는지 일봉 전체를 한 번에 계산
+(누적 수량, 평균 매수가, 일별 손익 곡선, 최종 수익률)
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (직접 실행시)
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from config.settings import DCA_FEE_RATE, DEFAULT_CRYPTOS
+from utils.candle_series import CandleSeries
+from utils.market_catalog import find_unknown_markets, get_markets_by_quote
+from utils.format_utils import (
+    format_currency,
+    format_percentage,
+    format_crypto_amount,
+    create_table_header,
+    create_table_row
+)
+from src.return_matrix import SECONDS_PER_DAY, load_histories
+
+
+def backtest_dca(historical_data: Union[List[Dict], CandleSeries], amount: float, interval_days: int = 7,
+                 fee_rate: float = DCA_FEE_RATE, market: Optional[str] = None) -> Dict[str, Any]:
+    """
+    일봉 데이터 전체 기간에 적립식 투자를 적용한 결과를 계산 (네트워크 요청 없음)
+
+    첫 일봉부터 interval_days일마다 그날 일봉 종가로 amount원어치를 매수하며,
+    예정일에 거래가 없으면 다음 첫 거래일에 매수. 수수료는 매수 금액에서 차감
+
+    Args:
+        historical_data (List[Dict] | CandleSeries): 일봉 데이터 (get_historical_data 결과 또는 시계열)
+        amount (float): 회당 매수 금액 (수수료 포함)
+        interval_days (int): 매수 간격 (일)
+        fee_rate (float): 거래 수수료율 (기본값: 0.05%)
+        market (str, optional): 마켓 코드 (기본값: 일봉의 market 필드)
+
+    Returns:
+        Dict[str, Any]: 계산 결과
+            - buy_count, total_invested, total_fee, total_quantity, average_cost (수수료 포함 평균 매수가)
+            - final_price, final_value, profit_loss, return_rate
+            - timestamps, quantity_curve, invested_curve, value_curve, pnl_curve (일봉별 array)
+    """
+    if not isinstance(historical_data, CandleSeries):
+        historical_data = CandleSeries.from_candles(historical_data, market)
+    market = market or historical_data.market
+
+    if amount <= 0 or interval_days < 1 or not 0 <= fee_rate < 1:
+        return {
+            'success': False,
+            'error_message': '매수 금액은 0보다, 매수 간격은 1일 이상, 수수료율은 0~1 사이여야 합니다.',
+            'market': market
+        }
+    if not historical_data:
+        return {
+            'success': False,
+            'error_message': '일봉 데이터가 없습니다.',
+            'market': market
+        }
+
+    timestamps, closes = historical_data.timestamps, historical_data.close
+    count = len(timestamps)
+
+    # 1) 매수 예정일마다 그날 또는 다음 첫 거래일의 위치를 이진 탐색
+    buys = array('d', bytes(8 * count))
+    schedule = range(timestamps[0], timestamps[-1] + 1, interval_days * SECONDS_PER_DAY)
+    for scheduled in schedule:
+        buys[bisect_left(timestamps, scheduled)] += amount
+
+    # 2) 일봉별 매수 수량과 누적값을 한 번에 계산
+    net = 1 - fee_rate
+    bought = [spent * net / close if spent and close else 0.0 for spent, close in zip(buys, closes)]
+    quantity_curve = array('d', accumulate(bought))
+    invested_curve = array('d', accumulate(buys))
+    value_curve = array('d', map(float.__mul__, quantity_curve, closes))
+    pnl_curve = array('d', map(float.__sub__, value_curve, invested_curve))
+
+    total_invested = invested_curve[-1]
+    total_quantity = quantity_curve[-1]
+    profit_loss = pnl_curve[-1]
+
+    return {
+        'success': True,
+        'error_message': '',
+        'market': market,
+        'coin_name': market.split('-')[1] if '-' in market else market,
+        'start_date': historical_data[0].kst_date,
+        'end_date': historical_data[-1].kst_date,
+        'interval_days': interval_days,
+        'amount': amount,
+        'fee_rate': fee_rate,
+        'buy_count': len(schedule),
+        'total_invested': total_invested,
+        'total_fee': total_invested * fee_rate,
+        'total_quantity': total_quantity,
+        'average_cost': total_invested / total_quantity if total_quantity else 0.0,
+        'final_price': closes[-1],
+        'final_value': value_curve[-1],
+        'profit_loss': profit_loss,
+        'return_rate': profit_loss / total_invested * 100 if total_invested else 0.0,
+        'is_profit': profit_loss > 0,
+        'timestamps': timestamps,
+        'quantity_curve': quantity_curve,
+        'invested_curve': invested_curve,
+        'value_curve': value_curve,
+        'pnl_curve': pnl_curve
+    }
+
+
+def backtest_dca_markets(markets: Optional[Sequence[str]] = None, days: int = 365, amount: float = 100000,
+                         interval_days: int = 7, fee_rate: float = DCA_FEE_RATE) -> Dict[str, Dict[str, Any]]:
+    """
+    여러 마켓(기본값: KRW 마켓 전체)의 최근 days일 적립식 투자를 한 번에 백테스트
+    일봉은 마켓마다 한 번씩 동시에 조회하며, 캔들 저장소에 있으면 새 일봉만 받음
+
+    Args:
+        markets (Sequence[str], optional): 마켓 코드 리스트 (기본값: 모든 KRW 마켓)
+        days (int): 백테스트 기간 (일)
+        amount (float): 회당 매수 금액
+        interval_days (int): 매수 간격 (일)
+        fee_rate (float): 거래 수수료율
+
+    Returns:
+        Dict[str, Dict]: 마켓별 backtest_dca 결과 (일봉 조회에 실패한 마켓은 제외)
+    """
+    markets = list(markets) if markets is not None else get_markets_by_quote("KRW")
+    if not markets:
+        print("❌ 백테스트할 마켓이 없습니다.")
+        return {}
+
+    print(f"📡 {len(markets)}개 마켓의 최근 {days}일 데이터 조회 중...")
+    histories = load_histories(markets, days)
+    failed = [market for market in markets if market not in histories]
+    if failed:
+        print(f"⚠️  과거 데이터를 받지 못한 마켓 {len(failed)}개를 제외했습니다.")
+
+    return {
+        market: backtest_dca(series, amount, interval_days, fee_rate, market)
+        for market, series in histories.items()
+    }
+
+
+def print_dca_result(result: Dict[str, Any]) -> None:
+    """
+    적립식 투자 백테스트 결과를 출력
+
+    Args:
+        result (Dict): backtest_dca의 결과
+    """
+    if not result['success']:
+        print(f"\n❌ 계산 실패: {result['error_message']}")
+        return
+
+    profit_emoji = "📈" if result['is_profit'] else "📉"
+    profit_sign = "+" if result['is_profit'] else ""
+
+    print("\n" + "="*70)
+    print(f"{profit_emoji} {result['coin_name']} 적립식 투자 백테스트 결과")
+    print("="*70)
+    print(f"📅 기간: {result['start_date']} ~ {result['end_date']} ({result['interval_days']}일마다 매수)")
+    print(f"💰 회당 매수 금액: {format_currency(result['amount'])} × {result['buy_count']}회")
+
+    print("\n🔢 투자 분석:")
+    print(f"   총 투자 금액: {format_currency(result['total_invested'])} (수수료 {format_currency(result['total_fee'])})")
+    print(f"   누적 수량: {format_crypto_amount(result['total_quantity'])}")
+    print(f"   평균 매수가: {format_currency(result['average_cost'])}")
+    print(f"   최종 가격: {format_currency(result['final_price'])}")
+    print(f"   현재 가치: {format_currency(result['final_value'])}")
+
+    pnl_curve = result['pnl_curve']
+    print("\n💵 손익 분석:")
+    print(f"   손익 금액: {profit_sign}{format_currency(result['profit_loss'])}")
+    print(f"   수익률: {profit_sign}{format_percentage(result['return_rate'])}")
+    print(f"   기간 중 최대 이익: {format_currency(max(pnl_curve))} / 최대 손실: {format_currency(min(pnl_curve))}")
+    print("="*70)
+
+
+def print_dca_ranking(results: Dict[str, Dict[str, Any]], limit: int = 20) -> None:
+    """
+    마켓별 적립식 투자 수익률 순위를 표로 출력
+
+    Args:
+        results (Dict[str, Dict]): backtest_dca_markets의 결과
+        limit (int): 출력할 최대 마켓 수
+    """
+    ranked = sorted((r for r in results.values() if r['success']), key=lambda r: r['return_rate'], reverse=True)
+    if not ranked:
+        print("❌ 출력할 결과가 없습니다.")
+        return
+
+    columns = ['순위', '암호화폐', '총투자', '현재가치', '평균매수가', '수익률']
+    widths = [6, 10, 14, 14, 14, 10]
+    alignments = ['center', 'center', 'right', 'right', 'right', 'center']
+
+    print(f"\n📋 적립식 투자 수익률 순위 (상위 {min(limit, len(ranked))}개 / 전체 {len(ranked)}개)")
+    print(create_table_header(columns, widths))
+    for rank, result in enumerate(ranked[:limit], 1):
+        profit_sign = "+" if result['is_profit'] else ""
+        values = [
+            str(rank),
+            result['coin_name'],
+            format_currency(result['total_invested']),
+            format_currency(result['final_value']),
+            format_currency(result['average_cost']),
+            f"{profit_sign}{format_percentage(result['return_rate'])}"
+        ]
+        print(create_table_row(values, widths, alignments))
+
+
+def get_user_dca_settings() -> Optional[Dict[str, Any]]:
+    """
+    사용자로부터 적립식 투자 조건을 입력받는 함수
+
+    Returns:
+        Dict[str, Any]: 설정 정보 (market이 None이면 KRW 마켓 전체)
+        None: 입력 실패시
+    """
+    print("\n📝 적립식 투자 백테스트 설정을 입력해주세요")
+    print("-" * 50)
+
+    try:
+        example = DEFAULT_CRYPTOS[0]
+        market = input(f"마켓 코드 입력 (예: {example}, 비워두면 KRW 마켓 전체): ").strip().upper() or None
+        if market is not None and (not market.startswith('KRW-') or find_unknown_markets([market])):
+            print(f"❌ 존재하지 않는 KRW 마켓입니다: {market}")
+            return None
+
+        days = int(input("백테스트 기간 (일, 기본값 365): ").strip() or 365)
+        interval_days = int(input("매수 간격 (일, 기본값 7): ").strip() or 7)
+        amount = float(input("회당 매수 금액 (원, 기본값 100000): ").strip() or 100000)
+        if days < 1 or interval_days < 1 or amount <= 0:
+            print("❌ 기간과 매수 간격은 1일 이상, 매수 금액은 0보다 커야 합니다.")
+            return None
+
+        return {'market': market, 'days': days, 'interval_days': interval_days, 'amount': amount}
+
+    except ValueError:
+        print("❌ 숫자를 입력해주세요.")
+        return None
+    except KeyboardInterrupt:
+        print("\n❌ 설정이 취소되었습니다.")
+        return None
+
+
+def run_dca_backtester():
+    """
+    적립식 투자 백테스터 실행 함수
+    """
+    settings = get_user_dca_settings()
+    if settings is None:
+        print("❌ 설정을 완료하지 못했습니다.")
+        return
+
+    markets = [settings['market']] if settings['market'] else None
+    results = backtest_dca_markets(markets, settings['days'], settings['amount'], settings['interval_days'])
+
+    if settings['market']:
+        result = results.get(settings['market'])
+        if result is None:
+            print(f"❌ {settings['market']} 과거 데이터 조회에 실패했습니다.")
+            return
+        print_dca_result(result)
+    else:
+        print_dca_ranking(results)
+
+
+if __name__ == "__main__":
+    run_dca_backtester()
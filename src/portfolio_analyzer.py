@@ -11,7 +11,8 @@ if __name__ == "__main__":
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from typing import Dict, List, Any
-from utils.api_client import get_current_prices
+from utils.price_hub import get_price_hub
+from utils.market_catalog import find_unknown_markets
 from utils.format_utils import (
     format_currency,
     format_percentage,
@@ -24,7 +25,8 @@ from config.settings import DEFAULT_CRYPTOS
 
 def get_current_prices_api(markets: List[str]) -> Dict[str, float]:
     """
-    업비트 API를 통해 현재가를 조회하는 함수
+    가격 허브를 통해 현재가를 조회하는 함수
+    (같은 마켓을 구독 중인 다른 모듈과 업비트 현재가 조회를 공유)
 
     Args:
         markets (List[str]): 조회할 마켓 코드 리스트 ['KRW-BTC', 'KRW-ETH']
@@ -35,7 +37,7 @@ def get_current_prices_api(markets: List[str]) -> Dict[str, float]:
     print(f"📡 {len(markets)}개 암호화폐의 현재가를 조회 중...")
 
     try:
-        prices = get_current_prices(markets)
+        prices = get_price_hub().snapshot(markets)
 
         if not prices:
             print("❌ 현재가 조회에 실패했습니다.")
@@ -76,6 +78,12 @@ def validate_portfolio(portfolio: Dict[str, float]) -> bool:
             print(f"❌ 지원하지 않는 마켓: {market} (KRW 마켓만 지원)")
             return False
 
+    # 상장되지 않은 마켓은 현재가 조회 전에 거부
+    unknown_markets = find_unknown_markets(list(portfolio.keys()))
+    if unknown_markets:
+        print(f"❌ 존재하지 않는 마켓: {', '.join(unknown_markets)}")
+        return False
+
     return True
 
 
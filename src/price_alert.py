@@ -11,14 +11,17 @@ import time
 if __name__ == "__main__":
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from typing import Optional, Dict, Tuple, Any
-from utils.api_client import get_single_price
+from typing import Optional, Dict, List, Tuple, Any
+from utils.api_client import get_single_price, get_resampled_series
+from utils.price_hub import SOURCE_POLL, SOURCE_STREAM, get_price_hub
+from utils.market_catalog import find_unknown_markets
 from utils.date_utils import get_current_time
 from utils.format_utils import format_currency, format_percentage
 from config.settings import (
     DEFAULT_CRYPTOS,
     DEFAULT_PRICE_CHANGE_THRESHOLD,
-    DEFAULT_MONITORING_CYCLES
+    DEFAULT_MONITORING_CYCLES,
+    PRICE_ALERT_USE_STREAM
 )
 
 
@@ -41,6 +44,31 @@ def get_single_price_api(market: str) -> Optional[float]:
         return None
 
 
+def get_recent_price_range(market: str, timeframe: str = "1h", count: int = 24) -> Optional[Tuple[float, float]]:
+    """
+    최근 캔들 구간의 최고가와 최저가를 조회하는 함수
+    (1분봉을 받아 로컬에서 리샘플링한 캔들을 사용하므로 다른 시간 단위 조회와 분봉을 공유)
+
+    Args:
+        market (str): 마켓 코드 (예: 'KRW-BTC')
+        timeframe (str): 캔들 시간 단위 (기본값: '1h')
+        count (int): 캔들 수 (기본값: 24, 최근 24시간)
+
+    Returns:
+        Tuple[float, float]: (최고가, 최저가)
+        None: 조회 실패시
+    """
+    try:
+        series = get_resampled_series(market, timeframe, count)
+    except Exception as e:
+        print(f"❌ 캔들 조회 오류 ({market}): {e}")
+        return None
+
+    if not series:
+        return None
+    return max(series.high), min(series.low)
+
+
 def calculate_target_prices(current_price: float, threshold: float = None) -> Tuple[float, float]:
     """
     현재가를 기준으로 상한가와 하한가를 계산
@@ -96,6 +124,10 @@ def validate_market_code(market: str) -> bool:
     if len(market.split('-')) != 2:
         return False
 
+    # 상장되지 않은 마켓은 현재가 조회 전에 거부
+    if find_unknown_markets([market]):
+        return False
+
     return True
 
 
@@ -191,8 +223,85 @@ def display_monitoring_status(cycle: int, total_cycles: int, current_time: str,
         print(f"          💥 알림 발생! 변동률: {format_percentage(alert_result['percentage_change'])}")
 
 
+def monitor_price_updates(market: str, target_high: float, target_low: float,
+                          cycles: int, interval: int, use_stream: bool,
+                          monitoring_data: List[Dict[str, Any]]) -> int:
+    """
+    가격 허브가 보내 주는 가격으로 가격을 모니터링하는 함수
+
+    WebSocket 체결 시세(use_stream=True) 또는 폴링 현재가 허브를 구독해 가격이 올 때마다
+    알림 조건을 확인하고, 상태 출력과 기록은 interval초 구간마다 한 번
+    (새 알림이 발생하면 추가로 출력)만 수행
+
+    Args:
+        market (str): 모니터링할 마켓 코드
+        target_high (float): 상한가
+        target_low (float): 하한가
+        cycles (int): 모니터링 구간 수
+        interval (int): 구간 길이(초)
+        use_stream (bool): True면 WebSocket 체결 시세, False면 폴링 현재가
+        monitoring_data (List[Dict[str, Any]]): 구간별 모니터링 기록을 추가할 리스트
+            (구간의 마지막 가격, 구간 중 알림 여부와 마지막 알림 종류)
+
+    Returns:
+        int: 알림 발생 횟수 (정상 → 알림 상태로 바뀐 횟수, 같은 알림 상태가 이어지면 한 번만 집계)
+    """
+    alerts_triggered = 0
+    previous_alert_type = 'normal'
+    started_at = time.monotonic()
+    hub = get_price_hub(SOURCE_STREAM if use_stream else SOURCE_POLL)
+
+    # 상한/하한을 잠깐 넘는 가격도 놓치지 않도록 갱신을 덮어쓰지 않고 모두 받음
+    with hub.subscribe([market], conflate=False) as subscription:
+        for cycle in range(1, cycles + 1):
+            cycle_end = started_at + cycle * interval
+            record: Optional[Dict[str, Any]] = None
+
+            while True:
+                remaining = cycle_end - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                update = subscription.get(timeout=remaining)
+                if update is None:
+                    break
+
+                current_time = get_current_time()
+                alert_result = check_price_alert_condition(update.price, target_high, target_low)
+                newly_triggered = (alert_result['alert_triggered']
+                                   and alert_result['alert_type'] != previous_alert_type)
+                previous_alert_type = alert_result['alert_type']
+
+                if newly_triggered:
+                    alerts_triggered += 1
+
+                if record is None or newly_triggered:
+                    display_monitoring_status(cycle, cycles, current_time, update.price, alert_result)
+
+                if record is None:
+                    record = {
+                        'cycle': cycle,
+                        'time': current_time,
+                        'price': update.price,
+                        'alert_triggered': False,
+                        'alert_type': 'normal'
+                    }
+                    monitoring_data.append(record)
+                record['time'] = current_time
+                record['price'] = update.price
+                if alert_result['alert_triggered']:
+                    record['alert_triggered'] = True
+                    record['alert_type'] = alert_result['alert_type']
+
+            if record is None:
+                print(f"[{get_current_time()}] ({cycle:2d}/{cycles}) ❌ 가격 수신 없음")
+
+    return alerts_triggered
+
+
 def price_alert_system(market: str, target_high: float, target_low: float,
-                       cycles: int = DEFAULT_MONITORING_CYCLES, interval: int = 5) -> Dict[str, Any]:
+                       cycles: int = DEFAULT_MONITORING_CYCLES, interval: int = 5,
+                       use_stream: bool = PRICE_ALERT_USE_STREAM) -> Dict[str, Any]:
     """
     가격 알림 시스템 메인 함수
 
@@ -202,6 +311,8 @@ def price_alert_system(market: str, target_high: float, target_low: float,
         target_low (float): 하한가
         cycles (int): 모니터링 횟수
         interval (int): 모니터링 간격(초)
+        use_stream (bool): True면 WebSocket 체결 시세, False면 폴링 현재가를 받아
+                           cycles × interval초 동안 받은 모든 가격을 확인
 
     Returns:
         Dict[str, Any]: 모니터링 결과
@@ -217,45 +328,15 @@ def price_alert_system(market: str, target_high: float, target_low: float,
 
     coin_name = get_coin_name(market)
     alerts_triggered = 0
-    monitoring_data = []
+    monitoring_data: List[Dict[str, Any]] = []
 
     # 모니터링 정보 출력
     display_monitoring_info(market, coin_name, target_high, target_low, cycles, interval)
 
     try:
-        for cycle in range(1, cycles + 1):
-            current_time = get_current_time()
-
-            # 현재가 조회
-            current_price = get_single_price_api(market)
-
-            if current_price is None:
-                print(f"[{current_time}] ({cycle:2d}/{cycles}) ❌ 가격 조회 실패")
-                continue
-
-            # 알림 조건 확인
-            alert_result = check_price_alert_condition(current_price, target_high, target_low)
-
-            # 상태 출력
-            display_monitoring_status(cycle, cycles, current_time, current_price, alert_result)
-
-            # 모니터링 데이터 기록
-            monitoring_record = {
-                'cycle': cycle,
-                'time': current_time,
-                'price': current_price,
-                'alert_triggered': alert_result['alert_triggered'],
-                'alert_type': alert_result['alert_type']
-            }
-            monitoring_data.append(monitoring_record)
-
-            # 알림 발생 카운트
-            if alert_result['alert_triggered']:
-                alerts_triggered += 1
-
-            # 마지막 사이클이 아니면 대기
-            if cycle < cycles:
-                time.sleep(interval)
+        alerts_triggered = monitor_price_updates(
+            market, target_high, target_low, cycles, interval, use_stream, monitoring_data
+        )
 
     except KeyboardInterrupt:
         print(f"\n❌ 모니터링이 사용자에 의해 중단되었습니다.")
@@ -297,12 +378,13 @@ def price_alert_system(market: str, target_high: float, target_low: float,
     }
 
 
-def get_user_alert_settings() -> Dict[str, Any]:
+def get_user_alert_settings() -> Optional[Dict[str, Any]]:
     """
     사용자로부터 알림 설정을 입력받는 함수
 
     Returns:
         Dict[str, Any]: 사용자 설정
+        None: 입력 오류 또는 조회 실패시
     """
     print("\n📋 가격 알림 설정을 입력해주세요")
     print("-" * 40)
@@ -334,8 +416,9 @@ def get_user_alert_settings() -> Dict[str, Any]:
         print(f"\n목표가 설정 방식을 선택하세요:")
         print(f"1. 자동 설정 (현재가 ±5%)")
         print(f"2. 직접 입력")
+        print("3. 최근 24시간 고가/저가 돌파")
 
-        choice = input("선택 (1-2): ").strip()
+        choice = input("선택 (1-3): ").strip()
 
         if choice == '1':
             # 자동 설정
@@ -366,6 +449,18 @@ def get_user_alert_settings() -> Dict[str, Any]:
                 except ValueError:
                     print("❌ 숫자를 입력해주세요.")
 
+        elif choice == '3':
+            # 1시간봉 24개의 고가/저가
+            price_range = get_recent_price_range(market_input)
+            if price_range is None:
+                print("❌ 최근 캔들 조회에 실패했습니다.")
+                return None
+
+            target_high, target_low = price_range
+            print("✅ 최근 24시간 기준:")
+            print(f"   상한가: {format_currency(target_high)}")
+            print(f"   하한가: {format_currency(target_low)}")
+
         else:
             print("❌ 잘못된 선택입니다.")
             return None
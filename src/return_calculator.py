@@ -10,10 +10,12 @@ import os
 if __name__ == "__main__":
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any, Tuple
-from utils.api_client import get_historical_data, get_single_price
-from utils.date_utils import get_date_days_ago, format_date, parse_upbit_datetime
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, List, Any, Tuple, Union
+from utils.api_client import get_current_prices, get_historical_data, get_single_price
+from utils.candle_series import KST, CandleSeries, to_timestamp
+from utils.market_catalog import find_unknown_markets
+from utils.date_utils import get_date_days_ago, format_date
 from utils.format_utils import (
     format_currency,
     format_percentage,
@@ -22,6 +24,8 @@ from utils.format_utils import (
     create_table_row
 )
 from config.settings import DEFAULT_CRYPTOS
+from src.return_matrix import HISTORY_MARGIN_DAYS, SECONDS_PER_DAY, load_histories
+from src.dca_backtester import run_dca_backtester
 
 
 def get_historical_data_api(market: str, days_count: int) -> Optional[List[Dict]]:
@@ -72,106 +76,138 @@ def get_single_price_api(market: str) -> Optional[float]:
         return None
 
 
-def find_investment_date_price(historical_data: List[Dict], days_ago: int) -> Optional[Tuple[float, str]]:
+def parse_investment_date(value: Union[str, date, datetime]) -> date:
     """
-    지정한 일수 전의 가격을 찾아 반환
+    투자 일자를 KST 날짜로 변환
 
     Args:
-        historical_data (List[Dict]): 일봉 데이터
-        days_ago (int): 며칠 전
+        value (str | date | datetime): 'YYYY-MM-DD' 문자열, date,
+                                       또는 datetime (시간대가 없으면 KST, 있으면 KST로 변환한 날짜)
+
+    Returns:
+        date: KST 날짜 (업비트 일봉의 candle_date_time_kst 날짜와 같은 기준)
+
+    Raises:
+        ValueError: 날짜 형식이 잘못된 경우
+    """
+    if isinstance(value, datetime):
+        return value.astimezone(KST).date() if value.tzinfo else value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value.strip())
+
+
+def find_investment_date_price(historical_data: Union[List[Dict], CandleSeries],
+                               days_ago: Optional[int] = None,
+                               investment_date: Optional[Union[str, date, datetime]] = None
+                               ) -> Optional[Tuple[float, str]]:
+    """
+    지정한 일수 전 또는 지정한 날짜의 가격을 찾아 반환 (날짜 기준 이진 탐색)
+
+    - days_ago: 가장 최근 일봉을 1일 전으로 보고 (days_ago - 1)일 앞선 날짜의 일봉,
+                그 날 거래가 없으면 직전 거래일 일봉
+    - investment_date: 그 날짜(KST)의 일봉, 그 날 거래가 없으면 다음 첫 거래일 일봉
+
+    Args:
+        historical_data (List[Dict] | CandleSeries): 일봉 데이터 (API 응답 리스트 또는 시계열)
+        days_ago (int, optional): 며칠 전
+        investment_date (str | date | datetime, optional): 투자 일자 (지정하면 days_ago 대신 사용)
 
     Returns:
         Tuple[float, str]: (가격, 날짜) 또는 None
     """
-    if not historical_data or days_ago < 1:
+    if not historical_data:
         return None
-
-    # 데이터 길이 확인
-    if len(historical_data) < days_ago:
-        print(f"⚠️  요청한 기간({days_ago}일)의 데이터가 부족합니다. 사용 가능: {len(historical_data)}일")
+    if investment_date is None and (days_ago is None or days_ago < 1):
         return None
 
     try:
-        # 업비트 API는 최신순으로 데이터를 반환하므로 인덱스 days_ago-1 사용
-        target_data = historical_data[days_ago - 1]
-
-        # 필요한 데이터 추출
-        candle_date = target_data.get('candle_date_time_kst', '')
-        trade_price = target_data.get('trade_price', 0)
-
-        if not trade_price:
-            print(f"❌ {days_ago}일 전 가격 데이터가 유효하지 않습니다.")
+        if not isinstance(historical_data, CandleSeries):
+            historical_data = CandleSeries.from_candles(historical_data)
+
+        if investment_date is not None:
+            target_date = parse_investment_date(investment_date)
+            target_data = historical_data.at_or_before(target_date)
+            if target_data is None or target_data.timestamp != to_timestamp(target_date):
+                target_data = historical_data.first_after(target_date)
+            if target_data is None:
+                print(f"⚠️  {target_date} 이후의 일봉 데이터가 없습니다.")
+                return None
+        else:
+            # 중간에 빠진 날이 있어도 위치가 아니라 날짜로 찾음 (days_ago는 위에서 확인함)
+            assert days_ago is not None
+            latest = historical_data[-1].timestamp
+            target_data = historical_data.at_or_before(latest - (days_ago - 1) * SECONDS_PER_DAY)
+            if target_data is None:
+                print(f"⚠️  요청한 기간({days_ago}일)의 데이터가 부족합니다. 사용 가능: {len(historical_data)}일")
+                return None
+
+        if not target_data.close:
+            print(f"❌ {target_data.kst_date} 가격 데이터가 유효하지 않습니다.")
             return None
 
-        # 날짜 형식 변환
-        formatted_date = candle_date.split('T')[0] if 'T' in candle_date else candle_date
-
-        return float(trade_price), formatted_date
+        return target_data.close, target_data.kst_date
 
     except (IndexError, KeyError, ValueError) as e:
         print(f"❌ 투자 시점 가격 추출 오류: {e}")
         return None
 
 
-def calculate_investment_return(market: str, days_ago: int, investment_amount: float) -> Dict[str, Any]:
+def _validate_investment(market: str, days_ago: Optional[int], investment_amount: float,
+                         investment_date: Optional[Union[str, date, datetime]] = None
+                         ) -> Tuple[int, Optional[date], Optional[str]]:
     """
-    투자 수익률을 계산하는 메인 함수
-
-    Args:
-        market (str): 마켓 코드
-        days_ago (int): 투자 시점 (며칠 전)
-        investment_amount (float): 투자 금액
+    투자 조건을 검증하고 투자 일자를 며칠 전으로 환산
 
     Returns:
-        Dict[str, Any]: 계산 결과
+        Tuple: (며칠 전, 투자 일자, 오류 메시지) - 검증에 실패하면 (0, None, 오류 메시지)
     """
-    print(f"\n🔍 {market} {days_ago}일 전 투자 시나리오 분석 시작...")
+    if not market or find_unknown_markets([market]):
+        return 0, None, f'존재하지 않는 마켓입니다: {market}'
 
-    # 1. 입력 데이터 검증
-    if days_ago < 1:
-        return {
-            'success': False,
-            'error_message': '투자 시점은 1일 이상이어야 합니다.',
-            'market': market
-        }
+    target_date = None
+    if investment_date is not None:
+        try:
+            target_date = parse_investment_date(investment_date)
+        except (ValueError, TypeError):
+            return 0, None, f'잘못된 투자 일자입니다: {investment_date}'
+
+        today = datetime.now(KST).date()
+        if target_date > today:
+            return 0, None, '투자 일자는 오늘 이전이어야 합니다.'
+        days_ago = (today - target_date).days + 1
+
+    if days_ago is None or days_ago < 1:
+        return 0, None, '투자 시점은 1일 이상이어야 합니다.'
 
     if investment_amount <= 0:
-        return {
-            'success': False,
-            'error_message': '투자 금액은 0보다 커야 합니다.',
-            'market': market
-        }
+        return 0, None, '투자 금액은 0보다 커야 합니다.'
 
-    # 2. 과거 데이터 조회
-    historical_data = get_historical_data_api(market, days_ago + 5)  # 여유분 포함
-    if not historical_data:
-        return {
-            'success': False,
-            'error_message': '과거 데이터 조회에 실패했습니다.',
-            'market': market
-        }
+    return days_ago, target_date, None
 
-    # 3. 투자 시점 가격 추출
-    investment_data = find_investment_date_price(historical_data, days_ago)
-    if not investment_data:
-        return {
-            'success': False,
-            'error_message': f'{days_ago}일 전 가격 데이터를 찾을 수 없습니다.',
-            'market': market
-        }
 
-    investment_price, investment_date = investment_data
+def _compute_investment_return(market: str, series: CandleSeries, current_price: float, days_ago: int,
+                               investment_amount: float, investment_date: Optional[date],
+                               when: str) -> Dict[str, Any]:
+    """
+    이미 받은 일봉과 현재가로 투자 수익률을 계산 (네트워크 요청 없음)
 
-    # 4. 현재가 조회
-    current_price = get_single_price_api(market)
-    if current_price is None:
+    Returns:
+        Dict[str, Any]: calculate_investment_return과 같은 형식의 결과
+    """
+    # 투자 시점 가격 추출
+    investment_data = find_investment_date_price(series, days_ago, investment_date)
+    if not investment_data:
         return {
             'success': False,
-            'error_message': '현재가 조회에 실패했습니다.',
+            'error_message': f'{when} 가격 데이터를 찾을 수 없습니다.',
             'market': market
         }
 
-    # 5. 수익률 계산
+    investment_price, purchase_date = investment_data
+    # 실제 매수한 일봉부터 최근 일봉까지의 일수 (최근 일봉 = 1일 전)
+    days_ago = (date.fromisoformat(series[-1].kst_date) - date.fromisoformat(purchase_date)).days + 1
+
     try:
         # 구매 수량 = 투자 금액 ÷ 투자 시점 가격
         purchase_quantity = investment_amount / investment_price
@@ -195,7 +231,7 @@ def calculate_investment_return(market: str, days_ago: int, investment_amount: f
             'error_message': '',
             'market': market,
             'coin_name': coin_name,
-            'investment_date': investment_date,
+            'investment_date': purchase_date,
             'investment_amount': investment_amount,
             'investment_price': investment_price,
             'purchase_quantity': purchase_quantity,
@@ -222,6 +258,58 @@ def calculate_investment_return(market: str, days_ago: int, investment_amount: f
         }
 
 
+def calculate_investment_return(market: str, days_ago: Optional[int], investment_amount: float,
+                                investment_date: Optional[Union[str, date, datetime]] = None) -> Dict[str, Any]:
+    """
+    투자 수익률을 계산하는 메인 함수
+
+    Args:
+        market (str): 마켓 코드
+        days_ago (int, optional): 투자 시점 (며칠 전, investment_date를 지정하면 무시)
+        investment_amount (float): 투자 금액
+        investment_date (str | date | datetime, optional): 투자 일자 (KST 날짜, 예: '2024-01-15')
+
+    Returns:
+        Dict[str, Any]: 계산 결과 (days_ago는 투자 일자부터 최근 일봉까지의 일수)
+    """
+    when = f"{investment_date}" if investment_date is not None else f"{days_ago}일 전"
+    print(f"\n🔍 {market} {when} 투자 시나리오 분석 시작...")
+
+    # 1. 입력 데이터 검증
+    days, target_date, error_message = _validate_investment(
+        market, days_ago, investment_amount, investment_date
+    )
+    if error_message:
+        return {
+            'success': False,
+            'error_message': error_message,
+            'market': market
+        }
+
+    # 2. 과거 데이터 조회
+    historical_data = get_historical_data_api(market, days + HISTORY_MARGIN_DAYS)  # 여유분 포함
+    if not historical_data:
+        return {
+            'success': False,
+            'error_message': '과거 데이터 조회에 실패했습니다.',
+            'market': market
+        }
+    series = CandleSeries.from_candles(historical_data, market)
+
+    # 3. 현재가 조회
+    current_price = get_single_price_api(market)
+    if current_price is None:
+        return {
+            'success': False,
+            'error_message': '현재가 조회에 실패했습니다.',
+            'market': market
+        }
+
+    # 4. 투자 시점 가격 추출 및 수익률 계산
+    return _compute_investment_return(market, series, current_price, days,
+                                      investment_amount, target_date, when)
+
+
 def calculate_annual_return_rate(return_rate: float, days: int) -> float:
     """
     연간 수익률(복리)을 계산
@@ -335,16 +423,26 @@ def get_user_investment_settings() -> Optional[Dict[str, Any]]:
             print("❌ KRW 마켓만 지원합니다.")
             return None
 
-        # 투자 시점 입력
+        if find_unknown_markets([market_input]):
+            print(f"❌ 존재하지 않는 마켓입니다: {market_input}")
+            return None
+
+        # 투자 시점 입력 (며칠 전 또는 날짜)
+        investment_date = None
         while True:
             try:
-                days_ago = int(input(f"투자 시점 입력 (며칠 전, 1-365): "))
+                when = input(f"투자 시점 입력 (며칠 전 1-365 또는 날짜 YYYY-MM-DD): ").strip()
+                if '-' in when:
+                    investment_date = parse_investment_date(when)
+                    days_ago = None
+                    break
+                days_ago = int(when)
                 if not 1 <= days_ago <= 365:
                     print("❌ 1일에서 365일 사이로 입력해주세요.")
                     continue
                 break
             except ValueError:
-                print("❌ 숫자를 입력해주세요.")
+                print("❌ 숫자 또는 YYYY-MM-DD 형식의 날짜를 입력해주세요.")
 
         # 투자 금액 입력
         while True:
@@ -360,6 +458,7 @@ def get_user_investment_settings() -> Optional[Dict[str, Any]]:
         return {
             'market': market_input,
             'days_ago': days_ago,
+            'investment_date': investment_date,
             'investment_amount': investment_amount
         }
 
@@ -403,34 +502,67 @@ def get_preset_investment_scenarios() -> List[Dict[str, Any]]:
     ]
 
 
-def compare_multiple_scenarios(scenarios: List[Dict[str, Any]]) -> None:
+def compare_multiple_scenarios(scenarios: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     여러 투자 시나리오를 비교 분석
 
+    시나리오를 마켓별로 묶어 마켓마다 가장 긴 기간의 일봉을 한 번만 받고(마켓끼리는 동시에 조회),
+    현재가는 한 번의 티커 요청으로 받아 모든 시나리오를 계산
+
     Args:
         scenarios (List[Dict]): 시나리오 리스트
+
+    Returns:
+        List[Dict]: 계산에 성공한 시나리오 결과 (시나리오 순서)
     """
     print(f"\n🔍 다중 시나리오 비교 분석")
     print(f"=" * 80)
 
-    results = []
-
+    # 1. 시나리오 검증 및 마켓별 필요 일수 계산
+    prepared = []
+    days_by_market: Dict[str, int] = {}
     for scenario in scenarios:
-        print(f"\n📊 {scenario['name']} 분석 중...")
-        result = calculate_investment_return(
-            market=scenario['market'],
-            days_ago=scenario['days_ago'],
-            investment_amount=scenario['investment_amount']
+        market = scenario['market']
+        days_ago, investment_date, error_message = _validate_investment(
+            market, scenario.get('days_ago'), scenario['investment_amount'], scenario.get('investment_date')
         )
+        if error_message:
+            print(f"❌ {scenario['name']} 분석 실패: {error_message}")
+            continue
+        prepared.append((scenario, days_ago, investment_date))
+        days_by_market[market] = max(days_by_market.get(market, 0), days_ago + HISTORY_MARGIN_DAYS)
+
+    # 2. 마켓별 일봉은 한 번씩 동시에, 현재가는 한 번에 조회
+    histories: Dict[str, CandleSeries] = {}
+    current_prices: Dict[str, float] = {}
+    if days_by_market:
+        print(f"📡 {len(days_by_market)}개 마켓의 과거 데이터와 현재가 조회 중...")
+        histories = load_histories(days_by_market.keys(), days_by_market)
+        current_prices = get_current_prices(list(histories))
+
+    # 3. 시나리오별 계산 (네트워크 요청 없음)
+    results = []
+    for scenario, days_ago, investment_date in prepared:
+        print(f"\n📊 {scenario['name']} 분석 중...")
+        market = scenario['market']
+        when = f"{investment_date}" if investment_date is not None else f"{days_ago}일 전"
 
-        if result['success']:
-            results.append(result)
+        if market not in histories:
+            error_message = '과거 데이터 조회에 실패했습니다.'
+        elif market not in current_prices:
+            error_message = '현재가 조회에 실패했습니다.'
         else:
-            print(f"❌ {scenario['name']} 분석 실패: {result['error_message']}")
+            result = _compute_investment_return(market, histories[market], current_prices[market], days_ago,
+                                                scenario['investment_amount'], investment_date, when)
+            if result['success']:
+                results.append(result)
+                continue
+            error_message = result['error_message']
+        print(f"❌ {scenario['name']} 분석 실패: {error_message}")
 
     if not results:
         print("❌ 비교할 수 있는 결과가 없습니다.")
-        return
+        return results
 
     # 결과 테이블 출력
     print(f"\n📋 시나리오 비교 결과")
@@ -482,6 +614,8 @@ def compare_multiple_scenarios(scenarios: List[Dict[str, Any]]) -> None:
     print(f"\n🏆 최고 수익률: {best_result['coin_name']} {format_percentage(best_result['return_rate'])}")
     print(f"📉 최저 수익률: {worst_result['coin_name']} {format_percentage(worst_result['return_rate'])}")
 
+    return results
+
 
 def run_return_calculator():
     """
@@ -497,9 +631,10 @@ def run_return_calculator():
     print(f"1. 단일 시나리오 계산 (직접 입력)")
     print(f"2. 프리셋 시나리오 비교")
     print(f"3. 커스텀 다중 시나리오")
+    print(f"4. 적립식 투자(DCA) 백테스트")
 
     try:
-        choice = input("선택 (1-3): ").strip()
+        choice = input("선택 (1-4): ").strip()
 
         if choice == '1':
             # 단일 시나리오
@@ -511,7 +646,8 @@ def run_return_calculator():
             result = calculate_investment_return(
                 market=settings['market'],
                 days_ago=settings['days_ago'],
-                investment_amount=settings['investment_amount']
+                investment_amount=settings['investment_amount'],
+                investment_date=settings['investment_date']
             )
 
             print_investment_result(result)
@@ -538,8 +674,9 @@ def run_return_calculator():
                 if settings is None:
                     break
 
+                when = settings['investment_date'] or f"{settings['days_ago']}일전"
                 scenarios.append({
-                    'name': f"시나리오{i+1}: {settings['market']} {settings['days_ago']}일전",
+                    'name': f"시나리오{i+1}: {settings['market']} {when}",
                     **settings
                 })
 
@@ -553,6 +690,10 @@ def run_return_calculator():
             else:
                 print("❌ 입력된 시나리오가 없습니다.")
 
+        elif choice == '4':
+            # 적립식 투자 백테스트
+            run_dca_backtester()
+
         else:
             print("❌ 잘못된 선택입니다.")
 
@@ -0,0 +1,269 @@
+"""
+마켓 × 투자 기간 수익률 행렬
+마켓마다 가장 긴 기간의 일봉을 한 번만 받고 현재가는 한 번의 티커 요청으로 받아
+모든 (마켓, 며칠 전) 조합의 수익률/손익/연간 수익률을 배열로 한 번에 계산
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가 (직접 실행시)
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from config.settings import HISTORY_MAX_CONCURRENCY
+from utils.api_client import get_current_prices, get_historical_series
+from utils.candle_series import CandleSeries
+from utils.format_utils import create_table_header, create_table_row, format_percentage
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# 며칠 전 기준일이 휴장 등으로 비어 있을 때를 대비해 더 받는 일수 (calculate_investment_return과 같음)
+HISTORY_MARGIN_DAYS = 5
+
+_NAN = float("nan")
+
+
+def _annual_return_rate(ratio: float, days: float) -> float:
+    """calculate_annual_return_rate와 같은 식: ((1 + 수익률 / 일수)^365 - 1) × 100 (넘치면 0)"""
+    try:
+        return ((1 + ratio / days) ** 365 - 1) * 100
+    except OverflowError:
+        return 0.0
+
+
+class ReturnMatrix:
+    """
+    마켓 × 투자 기간 수익률 행렬 (행: 마켓, 열: 며칠 전)
+
+    각 값은 길이 len(markets) * len(horizons)인 array('d')에 행 우선으로 저장되며
+    계산할 수 없는 칸(이력 부족, 현재가 없음)은 NaN
+
+    - investment_prices: 투자 시점 가격
+    - days: 실제 매수한 일봉부터 최근 일봉까지의 일수
+    - return_rates: 수익률 (%)
+    - profit_losses: 손익 (investment_amount 기준)
+    - annual_return_rates: 연간 수익률 (%, 복리)
+
+    Args:
+        markets (Sequence[str]): 마켓 코드
+        horizons (Sequence[int]): 투자 시점 (며칠 전)
+        investment_amount (float): 칸마다 투자한 금액
+        current_prices (array): 마켓별 현재가 (없으면 NaN)
+    """
+
+    COLUMNS = ("investment_prices", "days", "return_rates", "profit_losses", "annual_return_rates")
+
+    def __init__(self, markets: Sequence[str], horizons: Sequence[int], investment_amount: float,
+                 current_prices: array):
+        self.markets = tuple(markets)
+        self.horizons = tuple(horizons)
+        self.investment_amount = investment_amount
+        self.current_prices = current_prices
+        size = len(self.markets) * len(self.horizons)
+        self.investment_prices: array = array('d', [_NAN]) * size
+        self.days: array = array('d', [_NAN]) * size
+        self.return_rates: array = array('d', [_NAN]) * size
+        self.profit_losses: array = array('d', [_NAN]) * size
+        self.annual_return_rates: array = array('d', [_NAN]) * size
+        self._rows = {market: row for row, market in enumerate(self.markets)}
+        self._cols = {horizon: col for col, horizon in enumerate(self.horizons)}
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.markets), len(self.horizons)
+
+    def index(self, market: str, horizon: int) -> int:
+        """(마켓, 며칠 전) 칸의 배열 위치 (없는 조합이면 KeyError)"""
+        return self._rows[market] * len(self.horizons) + self._cols[horizon]
+
+    def row(self, name: str, market: str) -> array:
+        """한 마켓의 값 배열 (열 순서는 horizons)"""
+        start = self._rows[market] * len(self.horizons)
+        return getattr(self, name)[start:start + len(self.horizons)]
+
+    def get(self, market: str, horizon: int) -> Optional[Dict[str, Any]]:
+        """
+        한 칸의 결과를 calculate_investment_return 결과와 같은 키로 반환
+
+        Args:
+            market (str): 마켓 코드
+            horizon (int): 며칠 전
+
+        Returns:
+            Dict[str, Any]: 결과 (계산할 수 없는 칸이면 None)
+        """
+        position = self.index(market, horizon)
+        investment_price = self.investment_prices[position]
+        if math.isnan(investment_price) or math.isnan(self.return_rates[position]):
+            return None
+
+        current_price = self.current_prices[self._rows[market]]
+        purchase_quantity = self.investment_amount / investment_price
+        profit_loss = self.profit_losses[position]
+        return {
+            'market': market,
+            'coin_name': market.split('-')[1],
+            'investment_amount': self.investment_amount,
+            'investment_price': investment_price,
+            'purchase_quantity': purchase_quantity,
+            'current_price': current_price,
+            'current_value': self.investment_amount + profit_loss,
+            'profit_loss': profit_loss,
+            'return_rate': self.return_rates[position],
+            'annual_return_rate': self.annual_return_rates[position],
+            'days_ago': int(self.days[position]),
+            'is_profit': profit_loss > 0
+        }
+
+    def to_rows(self) -> List[Dict[str, Any]]:
+        """계산된 모든 칸의 결과 리스트 (마켓, 며칠 전 순)"""
+        rows = []
+        for market in self.markets:
+            for horizon in self.horizons:
+                result = self.get(market, horizon)
+                if result is not None:
+                    rows.append(result)
+        return rows
+
+
+def load_histories(markets: Iterable[str], days: Union[int, Dict[str, int]]) -> Dict[str, CandleSeries]:
+    """
+    마켓별 과거 일봉을 한 번씩 조회 (마켓은 동시에 조회)
+
+    Args:
+        markets (Iterable[str]): 마켓 코드
+        days (int | Dict[str, int]): 조회할 일수 (마켓별로 다르면 마켓 → 일수)
+
+    Returns:
+        Dict[str, CandleSeries]: 조회에 성공한 마켓의 일봉 시계열
+    """
+    markets = list(dict.fromkeys(markets))
+    if not markets:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(len(markets), HISTORY_MAX_CONCURRENCY)) as executor:
+        series = list(executor.map(
+            lambda market: get_historical_series(market, days[market] if isinstance(days, dict) else days),
+            markets
+        ))
+    return {market: history for market, history in zip(markets, series) if history}
+
+
+def build_return_matrix(histories: Dict[str, CandleSeries], current_prices: Dict[str, float],
+                        horizons: Sequence[int], investment_amount: float = 1000000,
+                        markets: Optional[Sequence[str]] = None) -> ReturnMatrix:
+    """
+    이미 받은 일봉과 현재가로 수익률 행렬을 계산 (네트워크 요청 없음)
+
+    마켓마다 최근 일봉을 1일 전으로 보고, 며칠 전 날짜의 일봉(없으면 직전 거래일)을
+    이진 탐색으로 찾은 뒤 모든 기간을 한 번에 계산 (find_investment_date_price와 같은 기준)
+
+    Args:
+        histories (Dict[str, CandleSeries]): 마켓별 일봉 시계열
+        current_prices (Dict[str, float]): 마켓별 현재가
+        horizons (Sequence[int]): 투자 시점 (며칠 전, 1 이상)
+        investment_amount (float): 칸마다 투자한 금액
+        markets (Sequence[str], optional): 행 순서 (기본값: histories 순서)
+
+    Returns:
+        ReturnMatrix: 수익률 행렬
+
+    Raises:
+        ValueError: 기간이 1일 미만이거나 투자 금액이 0 이하인 경우
+    """
+    horizons = list(horizons)
+    if any(horizon < 1 for horizon in horizons):
+        raise ValueError("투자 시점은 1일 이상이어야 합니다.")
+    if investment_amount <= 0:
+        raise ValueError("투자 금액은 0보다 커야 합니다.")
+
+    markets = list(markets if markets is not None else histories)
+    prices = array('d', (current_prices.get(market) or _NAN for market in markets))
+    matrix = ReturnMatrix(markets, horizons, investment_amount, prices)
+
+    offsets = [(horizon - 1) * SECONDS_PER_DAY for horizon in horizons]
+    width = len(horizons)
+    investment_prices, days = matrix.investment_prices, matrix.days
+
+    # 1) 마켓별로 기간마다 투자 시점 일봉을 이진 탐색 (O(M·H·log N))
+    for row, market in enumerate(markets):
+        series = histories.get(market)
+        if not series:
+            continue
+        timestamps, closes = series.timestamps, series.close
+        latest = timestamps[-1]
+        base = row * width
+        for col, offset in enumerate(offsets):
+            index = bisect_right(timestamps, latest - offset) - 1
+            if index >= 0 and closes[index]:
+                investment_prices[base + col] = closes[index]
+                days[base + col] = (latest - timestamps[index]) // SECONDS_PER_DAY + 1
+
+    # 2) 모든 칸을 한 번에 계산 (NaN은 그대로 전파됨)
+    current = [price for price in prices for _ in range(width)]
+    ratios = [now / then - 1 for now, then in zip(current, investment_prices)]
+    matrix.return_rates = array('d', (ratio * 100 for ratio in ratios))
+    matrix.profit_losses = array('d', (ratio * investment_amount for ratio in ratios))
+    matrix.annual_return_rates = array('d', map(_annual_return_rate, ratios, days))
+    return matrix
+
+
+def calculate_return_matrix(markets: Sequence[str], horizons: Sequence[int],
+                            investment_amount: float = 1000000) -> Optional[ReturnMatrix]:
+    """
+    여러 마켓 × 여러 투자 시점의 수익률을 한 번에 계산하는 함수
+    마켓마다 가장 긴 기간의 일봉만 한 번 받고, 현재가는 한 번의 티커 요청으로 받음
+
+    Args:
+        markets (Sequence[str]): 마켓 코드 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+        horizons (Sequence[int]): 투자 시점 리스트 (며칠 전, 예: [7, 30, 90, 365])
+        investment_amount (float): 조합마다 투자한 금액
+
+    Returns:
+        ReturnMatrix: 수익률 행렬 (조회에 실패한 마켓의 행은 NaN)
+        None: 입력이 잘못되었거나 모든 마켓 조회에 실패한 경우
+    """
+    markets = list(dict.fromkeys(markets))
+    horizons = sorted(set(horizons))
+    if not markets or not horizons or horizons[0] < 1 or investment_amount <= 0:
+        print("❌ 마켓, 1일 이상의 투자 시점, 0보다 큰 투자 금액이 필요합니다.")
+        return None
+
+    print(f"📡 {len(markets)}개 마켓의 최근 {horizons[-1]}일 데이터 조회 중...")
+    histories = load_histories(markets, horizons[-1] + HISTORY_MARGIN_DAYS)
+    if not histories:
+        print("❌ 과거 데이터 조회에 실패했습니다.")
+        return None
+
+    current_prices = get_current_prices(list(histories))
+    failed = [market for market in markets if market not in histories or market not in current_prices]
+    if failed:
+        print(f"⚠️  데이터를 받지 못한 마켓: {', '.join(failed)}")
+
+    return build_return_matrix(histories, current_prices, horizons, investment_amount, markets)
+
+
+def print_return_matrix(matrix: ReturnMatrix) -> None:
+    """
+    수익률 행렬을 표로 출력 (행: 마켓, 열: 며칠 전 수익률)
+
+    Args:
+        matrix (ReturnMatrix): calculate_return_matrix의 결과
+    """
+    columns = ['암호화폐'] + [f"{horizon}일전" for horizon in matrix.horizons]
+    widths = [10] + [10] * len(matrix.horizons)
+    alignments = ['center'] + ['right'] * len(matrix.horizons)
+
+    print(create_table_header(columns, widths))
+    for market in matrix.markets:
+        values = [market.split('-')[1]]
+        for rate in matrix.row('return_rates', market):
+            values.append("-" if math.isnan(rate) else f"{'+' if rate > 0 else ''}{format_percentage(rate)}")
+        print(create_table_row(values, widths, alignments))
@@ -236,6 +236,44 @@ def investment_scenarios():
         }
     ]
 
+@pytest.fixture
+def fake_upbit_server(monkeypatch, tmp_path):
+    """로컬 가짜 업비트 서버를 띄우고 API 엔드포인트와 캐시 경로를 교체"""
+    from config.settings import API_ENDPOINTS
+    from utils import market_catalog
+    from utils.price_cache import clear_price_cache
+    from utils.rate_limiter import RateLimiter, set_rate_limiter
+    from utils.retry_policy import reset_circuit_breakers
+    from utils.candle_store import CandleStore, set_candle_store
+    from utils.candle_archive import CandleArchive, set_candle_archive
+    from utils.api_client import clear_resamplers
+    from utils.price_hub import close_price_hubs
+    from tests.helpers.fake_upbit_server import FakeUpbitServer
+
+    monkeypatch.setattr(market_catalog, "MARKET_CATALOG_PATH", str(tmp_path / "market_all.json"))
+    market_catalog.clear_market_catalog()
+    clear_price_cache()
+    reset_circuit_breakers()
+    clear_resamplers()
+    close_price_hubs()
+    previous_store = set_candle_store(CandleStore(str(tmp_path / "candles.sqlite3")))
+    previous_archive = set_candle_archive(CandleArchive(str(tmp_path / "candle_archive")))
+    # 로컬 서버는 제한이 없으므로 속도 제한은 테스트가 직접 설정할 때만 적용
+    previous_limiter = set_rate_limiter(RateLimiter({"default": 10000}, burst=10000))
+
+    with FakeUpbitServer() as server:
+        for name, url in server.api_endpoints().items():
+            monkeypatch.setitem(API_ENDPOINTS, name, url)
+        yield server
+
+    close_price_hubs()
+    market_catalog.clear_market_catalog()
+    clear_price_cache()
+    clear_resamplers()
+    set_rate_limiter(previous_limiter)
+    set_candle_store(previous_store)
+    set_candle_archive(previous_archive)
+
 # 테스트 실행 전/후 Hook
 def pytest_configure(config):
     """테스트 설정 초기화"""
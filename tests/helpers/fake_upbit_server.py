@@ -0,0 +1,378 @@
+"""
+로컬 가짜 업비트 API 서버
+네트워크 없이 API 클라이언트를 테스트하기 위한 localhost HTTP 서버
+지연 시간 분포, 오류 응답, 429 제한, 일부만 담긴 응답을 주입하여 부하/장애 테스트에도 사용
+
+사용법 (부하 테스트용 단독 실행):
+    python -m tests.helpers.fake_upbit_server --port 8080 --latency lognormal:0.05:0.6 --error-rate 0.01
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Any, Optional, Union
+from urllib.parse import urlparse, parse_qs
+
+from tests.helpers.test_data_generator import TestDataGenerator
+
+DEFAULT_PRICES = {
+    "KRW-BTC": 50000000.0,
+    "KRW-ETH": 2800000.0,
+    "KRW-XRP": 650.0,
+    "KRW-ADA": 450.0,
+    "KRW-DOT": 8500.0
+}
+
+LatencySampler = Callable[[random.Random], float]
+
+
+def constant_latency(seconds: float) -> LatencySampler:
+    """항상 같은 지연 시간"""
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencySampler:
+    """low~high 사이 균등 분포 지연 시간"""
+    return lambda rng: rng.uniform(low, high)
+
+
+def exponential_latency(mean: float) -> LatencySampler:
+    """평균이 mean인 지수 분포 지연 시간"""
+    return lambda rng: rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+
+
+def lognormal_latency(median: float, sigma: float) -> LatencySampler:
+    """중앙값이 median인 로그 정규 분포 지연 시간 (sigma가 클수록 꼬리가 김)"""
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+def with_tail_latency(base: LatencySampler, probability: float, tail_seconds: float) -> LatencySampler:
+    """probability 확률로 tail_seconds만큼 지연을 더함 (드문 지연 스파이크)"""
+    return lambda rng: base(rng) + (tail_seconds if rng.random() < probability else 0.0)
+
+
+def parse_latency(spec: str) -> LatencySampler:
+    """
+    문자열 지연 시간 설정을 분포로 변환
+
+    예) '0.05', 'uniform:0.01:0.1', 'exponential:0.05', 'lognormal:0.05:0.6'
+    """
+    name, *args = spec.split(":")
+    values = [float(arg) for arg in args]
+    if not args:
+        return constant_latency(float(name))
+    if name == "uniform":
+        return uniform_latency(*values)
+    if name == "exponential":
+        return exponential_latency(*values)
+    if name == "lognormal":
+        return lognormal_latency(*values)
+    raise ValueError(f"알 수 없는 지연 시간 분포: {spec}")
+
+
+class _FakeUpbitHandler(BaseHTTPRequestHandler):
+    """가짜 업비트 API 요청 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+    # 헤더와 본문을 따로 쓰므로 Nagle 알고리즘을 끄지 않으면 keep-alive 연결에서 지연 ACK만큼 늦어짐
+    disable_nagle_algorithm = True
+    server: "FakeUpbitServer"
+
+    def do_GET(self):
+        fake = self.server
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+        fake.on_request_start(parsed.path, params)
+        try:
+            delay = fake.sample_latency()
+            if delay > 0:
+                time.sleep(delay)
+
+            group, remaining = fake.consume_rate_limit(parsed.path)
+            headers = {"Remaining-Req": f"group={group}; min=600; sec={max(remaining, 0)}"}
+            if remaining < 0:
+                body = {"error": {"name": "too_many_requests", "message": "Too many requests"}}
+                self._send_json(429, body, headers)
+                return
+
+            if fake.should_inject(fake.error_rate):
+                body = {"error": {"name": "server_error", "message": "Injected failure"}}
+                self._send_json(fake.error_status, body, headers)
+                return
+
+            if parsed.path == "/v1/ticker":
+                status, body = fake.handle_ticker(params)
+            elif parsed.path == "/v1/candles/days":
+                status, body = fake.handle_candles(params)
+            elif parsed.path == "/v1/candles/minutes/1":
+                status, body = fake.handle_candles(params, minutes=True)
+            elif parsed.path == "/v1/market/all":
+                status, body = fake.handle_market_all(params)
+            else:
+                status, body = 404, {"error": {"name": "404", "message": "Not found"}}
+
+            truncate = status == 200 and fake.should_inject(fake.truncate_rate)
+            self._send_json(status, body, headers, truncate=truncate)
+        finally:
+            fake.on_request_end()
+
+    def _send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None,
+                   truncate: bool = False) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        if truncate:
+            # 본문이 중간에 잘린 응답 (Content-Length도 잘린 길이에 맞춤)
+            payload = payload[:len(payload) // 2]
+        self.server.on_response(status)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeUpbitServer(ThreadingHTTPServer):
+    """
+    업비트 API를 흉내내는 로컬 서버
+
+    Args:
+        prices: 마켓별 기준 가격 (등록되지 않은 마켓은 404 응답)
+        latency: 응답 지연 시간(초) 또는 지연 시간 분포 (예: lognormal_latency(0.05, 0.6))
+        rate_limit: 그룹별 1초 구간당 허용 요청 수 (초과시 429 응답, None이면 무제한)
+        history_days: 마켓별로 제공할 일봉 이력 일수
+        history_minutes: 마켓별로 제공할 1분봉 이력 분 수 (현재 분까지)
+        error_rate: error_status 응답을 보낼 확률
+        error_status: 주입할 오류 상태 코드
+        partial_rate: 티커/일봉 응답에서 일부 항목을 빼고 보낼 확률
+        truncate_rate: 본문이 중간에 잘린 응답을 보낼 확률
+        seed: 주입 확률과 지연 시간 분포의 난수 시드
+        port: 사용할 포트 (0이면 임의의 빈 포트)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, prices: Optional[Dict[str, float]] = None,
+                 latency: Union[float, LatencySampler] = 0.0,
+                 rate_limit: Optional[int] = None, history_days: int = 1000,
+                 history_minutes: int = 3000,
+                 error_rate: float = 0.0, error_status: int = 500,
+                 partial_rate: float = 0.0, truncate_rate: float = 0.0,
+                 seed: Optional[int] = None, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _FakeUpbitHandler)
+        self.prices = dict(prices or DEFAULT_PRICES)
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.history_days = history_days
+        self.history_minutes = history_minutes
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.partial_rate = partial_rate
+        self.truncate_rate = truncate_rate
+        self.status_counts: Dict[int, int] = {}
+        self.rng = random.Random(seed)
+        self._histories: Dict[str, List[Dict[str, Any]]] = {}
+        self._minute_histories: Dict[str, List[Dict[str, Any]]] = {}
+        self.throttled = 0
+        self._windows: Dict[str, List[int]] = {}  # 그룹 → [구간 시작 초, 사용 횟수]
+        self.requests: List[Dict[str, Any]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}/v1"
+
+    def api_endpoints(self) -> Dict[str, str]:
+        """config.settings.API_ENDPOINTS 형태의 엔드포인트 딕셔너리"""
+        return {
+            "ticker": f"{self.base_url}/ticker",
+            "candles_days": f"{self.base_url}/candles/days",
+            "candles_minutes": f"{self.base_url}/candles/minutes/1",
+            "market_all": f"{self.base_url}/market/all"
+        }
+
+    def start(self) -> "FakeUpbitServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "FakeUpbitServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def on_request_start(self, path: str, params: Dict[str, str]) -> None:
+        with self._lock:
+            self.requests.append({"path": path, "params": params})
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def on_request_end(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def on_response(self, status: int) -> None:
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def sample_latency(self) -> float:
+        """이번 요청에 적용할 지연 시간(초)"""
+        if callable(self.latency):
+            with self._lock:
+                return max(0.0, self.latency(self.rng))
+        return self.latency
+
+    def should_inject(self, rate: float) -> bool:
+        """rate 확률로 장애를 주입할지 결정"""
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self.rng.random() < rate
+
+    def consume_rate_limit(self, path: str):
+        """요청 그룹의 현재 1초 구간 사용량을 늘리고 (그룹, 남은 요청 수)를 반환"""
+        group = "ticker" if path.endswith("/ticker") else "candles" if "/candles/" in path else "market"
+        if self.rate_limit is None:
+            return group, 9
+
+        with self._lock:
+            second = int(time.time())
+            window = self._windows.setdefault(group, [second, 0])
+            if window[0] != second:
+                window[0], window[1] = second, 0
+            window[1] += 1
+            remaining = self.rate_limit - window[1]
+            if remaining < 0:
+                self.throttled += 1
+            return group, remaining
+
+    def request_count(self, path: Optional[str] = None) -> int:
+        with self._lock:
+            return sum(1 for r in self.requests if path is None or r["path"] == path)
+
+    def handle_ticker(self, params: Dict[str, str]):
+        markets = [m for m in params.get("markets", "").split(",") if m]
+        if not markets or any(m not in self.prices for m in markets):
+            return 404, {"error": {"name": "404", "message": "Code not found"}}
+
+        if len(markets) > 1 and self.should_inject(self.partial_rate):
+            # 요청한 마켓 중 일부만 응답 (최소 1개는 포함)
+            with self._lock:
+                markets = self.rng.sample(markets, self.rng.randint(1, len(markets) - 1))
+
+        tickers = []
+        for market in markets:
+            ticker = TestDataGenerator.generate_ticker_data(market, self.prices[market], volatility=0.0)
+            tickers.append(ticker)
+        return 200, tickers
+
+    def get_history(self, market: str) -> List[Dict[str, Any]]:
+        """마켓의 일봉 이력을 반환 (과거순, UTC 00:00 기준으로 정렬된 날짜)"""
+        with self._lock:
+            history = self._histories.get(market)
+            if history is None:
+                history = TestDataGenerator.generate_candle_data(market, self.history_days, self.prices[market])
+                today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+                self._align_history(history, today, timedelta(days=1))
+                self._histories[market] = history
+            return history
+
+    def get_minute_history(self, market: str) -> List[Dict[str, Any]]:
+        """마켓의 1분봉 이력을 반환 (과거순, 처음 조회한 시각의 분까지)"""
+        with self._lock:
+            history = self._minute_histories.get(market)
+            if history is None:
+                history = TestDataGenerator.generate_candle_data(
+                    market, self.history_minutes, self.prices[market], trend="sideways"
+                )
+                minute = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+                self._align_history(history, minute, timedelta(minutes=1))
+                for candle in history:
+                    candle["unit"] = 1
+                self._minute_histories[market] = history
+            return history
+
+    @staticmethod
+    def _align_history(history: List[Dict[str, Any]], last: datetime, step: timedelta) -> None:
+        """과거순 캔들의 시각을 last에서 끝나는 step 간격으로 맞춤"""
+        for index, candle in enumerate(history):
+            start = last - step * (len(history) - 1 - index)
+            candle["candle_date_time_utc"] = start.strftime("%Y-%m-%dT%H:%M:%S")
+            candle["candle_date_time_kst"] = (start + timedelta(hours=9)).strftime("%Y-%m-%dT%H:%M:%S")
+            candle["timestamp"] = int(start.timestamp() * 1000)
+
+    def handle_candles(self, params: Dict[str, str], minutes: bool = False):
+        market = params.get("market", "")
+        if market not in self.prices:
+            return 404, {"error": {"name": "404", "message": "Code not found"}}
+
+        count = min(int(params.get("count", 1)), 200)
+        history = self.get_minute_history(market) if minutes else self.get_history(market)
+
+        to = params.get("to")
+        if to:
+            cursor = to.replace(" ", "T").rstrip("Z")
+            history = [c for c in history if c["candle_date_time_utc"] < cursor]
+
+        if count > 1 and self.should_inject(self.partial_rate):
+            # 요청보다 적은 개수만 응답
+            count //= 2
+
+        # 업비트 API는 최신순으로 반환
+        return 200, list(reversed(history[-count:])) if count > 0 else []
+
+    def handle_market_all(self, params: Dict[str, str]):
+        markets = [
+            {"market": market, "korean_name": market.split("-")[1], "english_name": market.split("-")[1]}
+            for market in self.prices
+        ]
+        return 200, markets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 업비트 API 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", default="0", help="예: 0.05, uniform:0.01:0.1, lognormal:0.05:0.6")
+    parser.add_argument("--rate-limit", type=int, default=None, help="그룹별 초당 허용 요청 수")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--partial-rate", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = FakeUpbitServer(
+        latency=parse_latency(args.latency), rate_limit=args.rate_limit,
+        error_rate=args.error_rate, error_status=args.error_status,
+        partial_rate=args.partial_rate, truncate_rate=args.truncate_rate,
+        seed=args.seed, host=args.host, port=args.port
+    )
+    print(f"🧪 가짜 업비트 서버 실행 중: {server.base_url} (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 응답 상태 코드: {server.status_counts}")
+
+
+if __name__ == "__main__":
+    main()
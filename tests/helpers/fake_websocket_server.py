@@ -0,0 +1,185 @@
+"""
+로컬 가짜 업비트 WebSocket 서버
+정해진 체결 시세(tick) 목록을 재생하여 스트리밍 클라이언트를 네트워크 없이 테스트
+"""
+import json
+import socket
+import socketserver
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+from utils.websocket_client import (
+    OPCODE_BINARY,
+    OPCODE_CLOSE,
+    OPCODE_PING,
+    OPCODE_PONG,
+    OPCODE_TEXT,
+    create_accept_key,
+    encode_frame,
+    read_frame
+)
+
+
+def make_tick(market: str, trade_price: float) -> Dict[str, Any]:
+    """업비트 WebSocket ticker 형식의 체결 시세 메시지를 생성"""
+    now = int(time.time() * 1000)
+    return {
+        "type": "ticker",
+        "code": market,
+        "trade_price": trade_price,
+        "trade_timestamp": now,
+        "timestamp": now,
+        "stream_type": "REALTIME"
+    }
+
+
+class _ConnectionClosed(Exception):
+    pass
+
+
+class _FakeWebSocketHandler(socketserver.BaseRequestHandler):
+    """WebSocket 연결 하나를 처리 (핸드셰이크 → 구독 수신 → tick 재생)"""
+
+    server: "FakeWebSocketServer"
+
+    def setup(self):
+        self.request.settimeout(0.1)
+        self._buffer = b""
+
+    def _fill(self) -> None:
+        while True:
+            try:
+                chunk = self.request.recv(4096)
+            except socket.timeout:
+                if self.server.stopping:
+                    raise _ConnectionClosed()
+                continue
+            if not chunk:
+                raise _ConnectionClosed()
+            self._buffer += chunk
+            return
+
+    def _recv_exact(self, size: int) -> bytes:
+        while len(self._buffer) < size:
+            self._fill()
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def _handshake(self) -> None:
+        while b"\r\n\r\n" not in self._buffer:
+            self._fill()
+        head, self._buffer = self._buffer.split(b"\r\n\r\n", 1)
+
+        key = ""
+        for line in head.decode("latin-1").split("\r\n")[1:]:
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "sec-websocket-key":
+                key = value.strip()
+
+        self.request.sendall((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {create_accept_key(key)}\r\n\r\n"
+        ).encode())
+
+    def handle(self):
+        fake = self.server
+        try:
+            self._handshake()
+            connection_number = fake.on_connect()
+
+            opcode, _, payload = read_frame(self._recv_exact)
+            if opcode == OPCODE_TEXT:
+                fake.subscriptions.append(json.loads(payload))
+
+            sent = 0
+            while True:
+                if connection_number == 1 and fake.drop_after is not None and sent >= fake.drop_after:
+                    # 첫 연결은 예고 없이 끊어 재연결을 유도
+                    self.request.shutdown(socket.SHUT_RDWR)
+                    return
+                tick = fake.next_tick()
+                if tick is None:
+                    break
+                if fake.tick_interval > 0:
+                    time.sleep(fake.tick_interval)
+                self.request.sendall(encode_frame(OPCODE_BINARY, json.dumps(tick).encode(), mask=False))
+                sent += 1
+
+            # 재생이 끝나면 ping/close에만 응답
+            while True:
+                opcode, _, payload = read_frame(self._recv_exact)
+                if opcode == OPCODE_PING:
+                    fake.pings += 1
+                    if fake.respond_to_ping:
+                        self.request.sendall(encode_frame(OPCODE_PONG, payload, mask=False))
+                elif opcode == OPCODE_CLOSE:
+                    self.request.sendall(encode_frame(OPCODE_CLOSE, payload[:2], mask=False))
+                    return
+        except (_ConnectionClosed, OSError):
+            return
+
+
+class FakeWebSocketServer(socketserver.ThreadingTCPServer):
+    """
+    업비트 WebSocket을 흉내내는 로컬 서버
+
+    Args:
+        ticks: 순서대로 보낼 체결 시세 메시지 (연결이 바뀌어도 이어서 재생)
+        tick_interval: 메시지 사이 간격(초)
+        drop_after: 첫 연결에서 이 개수만큼 보낸 뒤 연결을 끊음 (None이면 끊지 않음)
+        respond_to_ping: False면 ping에 응답하지 않음 (heartbeat 테스트용)
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, ticks: Optional[List[Dict[str, Any]]] = None, tick_interval: float = 0.0,
+                 drop_after: Optional[int] = None, respond_to_ping: bool = True):
+        super().__init__(("127.0.0.1", 0), _FakeWebSocketHandler)
+        self.ticks = list(ticks or [])
+        self.tick_interval = tick_interval
+        self.drop_after = drop_after
+        self.respond_to_ping = respond_to_ping
+        self.subscriptions: List[Any] = []
+        self.connections = 0
+        self.pings = 0
+        self.stopping = False
+        self._position = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.server_address[1]}/websocket/v1"
+
+    def on_connect(self) -> int:
+        with self._lock:
+            self.connections += 1
+            return self.connections
+
+    def next_tick(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if self._position >= len(self.ticks):
+                return None
+            tick = self.ticks[self._position]
+            self._position += 1
+            return tick
+
+    def start(self) -> "FakeWebSocketServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.stopping = True
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "FakeWebSocketServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
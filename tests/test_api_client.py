@@ -39,6 +39,42 @@ def test_api_connection():
         print("❌ 실패: 여러 코인 가격 조회 실패")
 
 
+def test_bisection_isolates_rejected_markets(fake_upbit_server):
+    """잘못된 마켓이 섞인 일괄 조회에서 분할 조회 요청 수 테스트"""
+    print("\n🔍 잘못된 마켓 분할 조회 테스트")
+
+    from utils.api_client import get_current_prices_with_rejected
+
+    fake_upbit_server.prices = {f"KRW-C{i:03d}": 1000.0 + i for i in range(200)}
+    markets = list(fake_upbit_server.prices)
+    markets[17] = "KRW-TYPO1"
+    markets[150] = "KRW-TYPO2"
+
+    prices, rejected = get_current_prices_with_rejected(markets)
+    request_count = fake_upbit_server.request_count("/v1/ticker")
+
+    print(f"✅ 요청 {request_count}회, 거부된 마켓: {rejected}")
+    assert sorted(rejected) == ["KRW-TYPO1", "KRW-TYPO2"]
+    assert len(prices) == 198
+    assert request_count <= 2 * 2 * 8 + 1  # 2 * k * log2(n) + 1
+
+
+def test_paginated_history_beyond_limit(fake_upbit_server):
+    """200개를 넘는 일봉 조회가 페이지를 합쳐 정렬/중복 제거되는지 테스트"""
+    print("\n📅 일봉 페이지 조회 테스트")
+
+    from utils.api_client import get_historical_data
+
+    candles = get_historical_data("KRW-BTC", 730)
+    times = [candle["candle_date_time_utc"] for candle in candles]
+
+    print(f"✅ {len(candles)}일분, 요청 {fake_upbit_server.request_count('/v1/candles/days')}회")
+    assert len(candles) == 730
+    assert times == sorted(set(times), reverse=True)
+    assert times == [c["candle_date_time_utc"] for c in reversed(fake_upbit_server.get_history("KRW-BTC")[-730:])]
+    assert fake_upbit_server.request_count("/v1/candles/days") == 4
+
+
 def test_format_functions():
     """포맷팅 함수 테스트"""
     print("\n🎨 포맷팅 함수 테스트를 시작합니다...")
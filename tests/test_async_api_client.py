@@ -0,0 +1,78 @@
+"""
+비동기 API 클라이언트 테스트 파일
+지연이 주입된 로컬 가짜 서버로 동시 요청과 동시성 제한을 확인
+"""
+
+import sys
+import os
+import asyncio
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import ASYNC_MAX_CONCURRENCY
+from utils import async_api_client
+from utils.api_client import get_historical_data, get_single_price
+
+
+def test_async_fan_out_with_latency(fake_upbit_server):
+    """지연 응답 서버에 대한 동시 조회가 순차 조회보다 빠른지 테스트"""
+    print("\n🧪 비동기 동시 조회 테스트")
+
+    fake_upbit_server.latency = 0.1
+    markets = list(fake_upbit_server.prices) * 20  # 100회 요청
+
+    async def fan_out():
+        return await asyncio.gather(*(async_api_client.get_single_price(m) for m in markets))
+
+    start = time.perf_counter()
+    prices = asyncio.run(fan_out())
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {len(markets)}회 요청 {elapsed:.2f}초 (최대 동시 {fake_upbit_server.max_in_flight})")
+    assert all(price is not None for price in prices)
+    assert elapsed < len(markets) * 0.1 / 4
+    assert fake_upbit_server.max_in_flight <= ASYNC_MAX_CONCURRENCY
+
+
+def test_async_current_prices_and_history(fake_upbit_server):
+    """일괄 현재가 조회와 과거 데이터 동시 조회 테스트"""
+    print("\n🧪 비동기 현재가/과거 데이터 조회 테스트")
+
+    async def run():
+        prices = await async_api_client.get_current_prices(["KRW-BTC", "KRW-ETH", "KRW-NOPE"])
+        history = await async_api_client.gather_historical_data(["KRW-BTC", "KRW-ETH"], 10)
+        return prices, history
+
+    prices, history = asyncio.run(run())
+
+    assert set(prices) == {"KRW-BTC", "KRW-ETH"}
+    assert all(len(candles) == 10 for candles in history.values())
+    print("✅ 존재하지 않는 마켓 제외, 과거 데이터 동시 조회 확인")
+
+
+def test_async_shares_price_cache_and_candle_store(fake_upbit_server):
+    """비동기 조회가 동기 클라이언트의 현재가 캐시와 캔들 저장소를 함께 쓰는지 테스트"""
+    print("\n🧪 비동기 캐시/저장소 공유 테스트")
+
+    # 현재가 캐시 TTL 안에 비동기 조회가 이어지도록 현재가를 나중에 조회
+    assert get_historical_data("KRW-BTC", 30) is not None
+    assert get_single_price("KRW-BTC") == 50000000.0
+    tickers = fake_upbit_server.request_count("/v1/ticker")
+    candles = fake_upbit_server.request_count("/v1/candles/days")
+
+    async def run():
+        return await asyncio.gather(
+            async_api_client.get_single_price("KRW-BTC"),
+            async_api_client.get_historical_data("KRW-BTC", 30)
+        )
+
+    price, history = asyncio.run(run())
+
+    assert price == 50000000.0
+    assert len(history) == 30
+    # 현재가는 캐시에서, 일봉은 저장소에서 읽으므로 티커 재조회 없이 최신 일봉만 다시 받음
+    assert fake_upbit_server.request_count("/v1/ticker") == tickers
+    assert fake_upbit_server.request_count("/v1/candles/days") - candles <= 1
+    print("✅ 현재가 캐시와 캔들 저장소 공유 확인")
@@ -0,0 +1,153 @@
+"""
+메모리 매핑 캔들 아카이브 테스트 파일
+파일 형식, 복사 없는 mmap 뷰, 증분 추가/교체/병합, API 동기화를 확인
+"""
+
+import sys
+import os
+import time
+from array import array
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.candle_archive import HEADER_SIZE, RECORD_SIZE, CandleArchive, get_candle_archive
+from utils.candle_series import CandleSeries
+from utils.api_client import get_historical_series, sync_candle_archive
+
+START = 1704067200  # 2024-01-01 00:00 UTC
+
+
+def _minute_series(count: int, start: int = START, market: str = "KRW-BTC") -> CandleSeries:
+    """종가가 분 번호인 1분봉 시계열"""
+    timestamps = array('q', range(start, start + count * 60, 60))
+    closes = array('d', (float(index) for index in range(count)))
+    return CandleSeries(market, "minutes/1", timestamps, closes, closes, closes, closes, array('d', [1.0]) * count)
+
+
+def test_round_trip_is_zero_copy(tmp_path):
+    """저장한 캔들을 mmap 뷰로 그대로 읽는지 테스트"""
+    print("\n🧪 캔들 아카이브 읽기/쓰기 테스트")
+
+    archive = CandleArchive(str(tmp_path))
+    series = _minute_series(1000)
+    assert archive.append(series) == 1000
+
+    path = archive.path("KRW-BTC", "minutes/1")
+    assert path.endswith(os.path.join("KRW-BTC", "minutes-1.candles"))
+    assert os.path.getsize(path) == HEADER_SIZE + 1000 * RECORD_SIZE
+
+    opened = archive.open("KRW-BTC", "minutes/1")
+    assert len(opened) == 1000
+    assert list(opened) == list(series)
+    assert opened.unit == "minutes/1"
+
+    # 모든 열이 같은 매핑을 가리키고, 슬라이스/기간 조회도 복사하지 않음
+    window = opened.between(START + 100 * 60, START + 200 * 60)
+    assert len(window) == 100
+    assert window[0].close == 100.0
+    assert window.close.obj is opened.timestamps.obj is opened.volume.obj
+    assert opened.at_or_before(START + 500 * 60 + 30).close == 500.0
+
+    info = archive.info("KRW-BTC", "minutes/1")
+    assert (info.record_count, info.first_timestamp, info.last_timestamp) == (1000, START, START + 999 * 60)
+    assert archive.open("KRW-ETH") is None
+    print(f"✅ {opened}")
+
+
+def test_append_replace_and_merge(tmp_path):
+    """새 캔들 추가, 진행 중인 마지막 캔들 교체, 과거 캔들 병합을 테스트"""
+    archive = CandleArchive(str(tmp_path))
+    archive.append(_minute_series(110)[10:])
+    reader = archive.open("KRW-BTC", "minutes/1")
+
+    # 마지막 분(109)을 새 값으로 교체하고 110~119를 덧붙임
+    newer = _minute_series(120)[109:]
+    newer.close.obj[109] = 999.0
+    assert archive.append(newer) == 11
+    current = archive.open("KRW-BTC", "minutes/1")
+    assert len(current) == 110
+    assert current[99].close == 999.0
+    assert current[-1].timestamp == START + 119 * 60
+    assert len(reader) == 100  # 이미 연 시계열은 열 때의 레코드 수를 유지
+
+    # 더 과거 캔들이 섞이면 합쳐서 다시 씀 (겹친 캔들은 변경된 것만 셈)
+    assert archive.append(_minute_series(15), history_start=True) == 10
+    merged = archive.open("KRW-BTC", "minutes/1")
+    assert len(merged) == 120
+    assert list(merged.timestamps) == list(range(START, START + 120 * 60, 60))
+    assert archive.info("KRW-BTC", "minutes/1").history_start
+    assert [entry.unit for entry in archive.entries()] == ["minutes/1"]
+
+
+def test_rejects_foreign_files(tmp_path):
+    """형식이 다른 파일은 열지 않는지 테스트"""
+    archive = CandleArchive(str(tmp_path))
+    path = archive.path("KRW-BTC", "days")
+    os.makedirs(os.path.dirname(path))
+    with open(path, "wb") as handle:
+        handle.write(b"not an archive".ljust(HEADER_SIZE, b"\0"))
+
+    with pytest.raises(ValueError):
+        archive.open("KRW-BTC", "days")
+
+
+def test_open_large_archive_is_lazy(tmp_path):
+    """큰 아카이브도 데이터를 읽지 않고 바로 열리는지 테스트"""
+    print("\n🧪 대용량 아카이브 열기 테스트")
+
+    archive = CandleArchive(str(tmp_path))
+    count = 200000
+    archive.append(_minute_series(count))
+
+    started = time.perf_counter()
+    series = archive.open("KRW-BTC", "minutes/1")
+    elapsed = time.perf_counter() - started
+
+    assert series.nbytes == count * RECORD_SIZE
+    assert elapsed < 0.05
+    assert series.first_after(START + 150000 * 60).close == 150001.0
+    print(f"✅ {count}개 분봉({series.nbytes / 1e6:.1f}MB) 열기: {elapsed * 1000:.2f}ms")
+
+
+def test_sync_candle_archive(fake_upbit_server):
+    """API에서 받은 캔들을 아카이브에 넣고 이후에는 새 캔들만 받는지 테스트"""
+    path = "/v1/candles/days"
+    assert sync_candle_archive("KRW-BTC", 450) == 450
+    assert fake_upbit_server.request_count(path) == 3
+
+    # 두 번째 동기화는 오늘 캔들 한 페이지만 받아 교체
+    assert sync_candle_archive("KRW-BTC", 450) == 1
+    assert fake_upbit_server.request_count(path) == 4
+
+    archived = sync_candle_archive("KRW-ETH", 10, unit="minutes/1")
+    assert archived == 10
+
+    series = get_candle_archive().open("KRW-BTC")
+    expected = get_historical_series("KRW-BTC", 450)
+    assert list(series.close) == list(expected.close)
+
+    # 이력이 짧은 마켓은 상장 시점으로 기록되어 다시 전체를 받지 않음
+    fake_upbit_server.history_days = 50
+    assert sync_candle_archive("KRW-XRP", 450) == 50
+    assert get_candle_archive().info("KRW-XRP").history_start
+    before = fake_upbit_server.request_count(path)
+    sync_candle_archive("KRW-XRP", 450)
+    assert fake_upbit_server.request_count(path) == before + 1
+    assert sync_candle_archive("KRW-NOPE", 10) is None
+
+
+def test_sync_stale_archive_leaves_no_gap(fake_upbit_server):
+    """오래전에 동기화한 아카이브를 다시 동기화해도 그 사이 캔들이 빠지지 않는지 테스트"""
+    history = fake_upbit_server.get_history("KRW-BTC")
+    # 40일 전에 30일치를 동기화해 둔 아카이브
+    get_candle_archive().append(CandleSeries.from_candles(list(reversed(history[-70:-40])), "KRW-BTC"))
+
+    # 마지막 캔들 교체 1개 + 그 뒤 40일
+    assert sync_candle_archive("KRW-BTC", 30) == 41
+    series = get_candle_archive().open("KRW-BTC")
+    assert len(series) == 70
+    assert all(later - earlier == 86400 for earlier, later in zip(series.timestamps, series.timestamps[1:]))
+    assert list(series.close) == [candle["trade_price"] for candle in history[-70:]]
@@ -0,0 +1,178 @@
+"""
+열 단위 캔들 시계열 테스트 파일
+API 응답 변환, 복사 없는 슬라이싱/기간 조회, 메모리 사용량을 확인
+"""
+
+import sys
+import os
+import json
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.candle_series import KST, CandleSeries, parse_candle_time, to_timestamp
+from utils.api_client import get_historical_data, get_historical_series
+from src.return_calculator import find_investment_date_price, calculate_investment_return
+from tests.helpers.test_data_generator import TestDataGenerator
+
+
+def _api_candles(count: int):
+    """업비트 응답처럼 최신순으로 정렬된 일봉 데이터"""
+    return list(reversed(TestDataGenerator.generate_candle_data("KRW-BTC", count)))
+
+
+def test_from_candles_and_round_trip():
+    """API 응답(최신순)을 과거순 배열로 변환하고 되돌리는지 테스트"""
+    print("\n🧪 캔들 시계열 변환 테스트")
+
+    candles = _api_candles(30)
+    series = CandleSeries.from_candles(candles)
+
+    assert series.market == "KRW-BTC"
+    assert len(series) == 30
+    assert list(series.timestamps) == sorted(series.timestamps)
+    assert series[-1].close == candles[0]['trade_price']
+    assert series[0].open == candles[-1]['opening_price']
+    assert series[-1].kst_date == candles[0]['candle_date_time_kst'][:10]
+
+    restored = series.to_candles()
+    assert [c['trade_price'] for c in restored] == [c['trade_price'] for c in candles]
+
+    payload = json.dumps(candles).encode("utf-8")
+    assert list(CandleSeries.from_payload(payload).close) == list(series.close)
+    print(f"✅ {series}")
+
+
+def test_slicing_and_date_range_share_arrays():
+    """슬라이싱과 기간 조회가 배열을 복사하지 않는 뷰를 반환하는지 테스트"""
+    print("\n🧪 캔들 시계열 뷰 테스트")
+
+    series = CandleSeries.from_candles(_api_candles(365))
+    view = series[100:200]
+
+    assert len(view) == 100
+    assert view.close.obj is series.close.obj
+    assert view[0] == series[100]
+
+    start, end = series[50].timestamp, series[80].timestamp
+    window = series.between(start, end)
+    assert len(window) == 30
+    assert window[0] == series[50]
+    assert window.timestamps.obj is series.timestamps.obj
+
+    assert len(series.between(end, start)) == 0
+    assert len(series.between(start=series[-1].timestamp)) == 1
+    assert series.index_of("2000-01-01") == 0
+    print(f"✅ 기간 뷰: {window}")
+
+
+def test_memory_is_fraction_of_dicts():
+    """캔들당 메모리가 딕셔너리 형식보다 훨씬 작은지 테스트"""
+    print("\n🧪 캔들 시계열 메모리 테스트")
+
+    raw = json.dumps(_api_candles(2000)).encode("utf-8")
+
+    tracemalloc.start()
+    candles = json.loads(raw)
+    dict_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    CandleSeries.from_candles(candles)  # 시각 변환 캐시는 측정에서 제외
+    tracemalloc.start()
+    series = CandleSeries.from_candles(candles)
+    series_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert series.nbytes == 2000 * 48
+    assert series_bytes * 10 < dict_bytes
+    print(f"✅ 캔들당 {dict_bytes / 2000:.0f}B → {series_bytes / 2000:.0f}B")
+
+
+def test_find_investment_date_price_accepts_series():
+    """투자 시점 가격 추출이 리스트와 시계열에서 같은 결과를 내는지 테스트"""
+    candles = _api_candles(10)
+    series = CandleSeries.from_candles(candles)
+
+    for days_ago in (1, 5, 10):
+        expected = (candles[days_ago - 1]['trade_price'], candles[days_ago - 1]['candle_date_time_kst'][:10])
+        assert find_investment_date_price(candles, days_ago) == expected
+        assert find_investment_date_price(series, days_ago) == expected
+    assert find_investment_date_price(series, 11) is None
+
+
+def _daily_candles(days):
+    """지정한 날짜(UTC 00:00 시작)의 일봉만 있는 최신순 데이터 (종가 = 날짜의 일)"""
+    candles = []
+    for day in sorted(days, reverse=True):
+        start = datetime(day.year, day.month, day.day)
+        candles.append({
+            "market": "KRW-BTC",
+            "candle_date_time_utc": start.strftime("%Y-%m-%dT%H:%M:%S"),
+            "candle_date_time_kst": (start + timedelta(hours=9)).strftime("%Y-%m-%dT%H:%M:%S"),
+            "opening_price": float(day.day), "high_price": float(day.day), "low_price": float(day.day),
+            "trade_price": float(day.day), "candle_acc_trade_volume": 1.0
+        })
+    return candles
+
+
+def test_date_lookup_with_gaps():
+    """거래 공백이 있어도 날짜로 직전/다음 거래일 일봉을 찾는지 테스트"""
+    print("\n🧪 날짜 기준 조회 테스트")
+
+    # 1월 3일~5일은 거래 공백
+    days = [date(2024, 1, d) for d in (1, 2, 6, 7, 8, 9, 10)]
+    series = CandleSeries.from_candles(_daily_candles(days))
+
+    assert series.at_or_before("2024-01-02").close == 2.0
+    assert series.at_or_before(date(2024, 1, 4)).close == 2.0
+    assert series.first_after(date(2024, 1, 2)).close == 6.0
+    assert series.first_after("2024-01-04").close == 6.0
+    assert series.at_or_before("2023-12-31") is None
+    assert series.first_after("2024-01-10") is None
+
+    # KST 날짜 D의 일봉은 D 09:00 KST(= D 00:00 UTC)에 시작
+    assert series.at_or_before(datetime(2024, 1, 7, 8, 59), tz=KST).close == 6.0
+    assert series.at_or_before(datetime(2024, 1, 7, 9, 0), tz=KST).close == 7.0
+    assert series.at_or_before(datetime(2024, 1, 7, 0, 0, tzinfo=timezone.utc)).close == 7.0
+    assert to_timestamp("2024-01-07T09:00:00+09:00") == to_timestamp(date(2024, 1, 7))
+
+    # 며칠 전 조회도 위치가 아니라 날짜 기준 (10일이 1일 전이면 6일 전 = 5일 → 직전 거래일 2일)
+    assert find_investment_date_price(series, 6) == (2.0, "2024-01-02")
+    assert find_investment_date_price(series, 5) == (6.0, "2024-01-06")
+    assert find_investment_date_price(series, investment_date="2024-01-03") == (6.0, "2024-01-06")
+    assert find_investment_date_price(series, investment_date=date(2024, 1, 8)) == (8.0, "2024-01-08")
+    assert find_investment_date_price(series, investment_date="2024-02-01") is None
+    print("✅ 공백 구간 조회 확인")
+
+
+def test_return_calculator_with_explicit_date(fake_upbit_server):
+    """수익률 계산기가 며칠 전 대신 투자 일자를 받는지 테스트"""
+    print("\n🧪 투자 일자 지정 수익률 계산 테스트")
+
+    series = get_historical_series("KRW-BTC", 30)
+    target = series[-10]
+
+    by_date = calculate_investment_return("KRW-BTC", None, 1000000, investment_date=target.kst_date)
+    by_offset = calculate_investment_return("KRW-BTC", 10, 1000000)
+
+    assert by_date['success'] and by_offset['success']
+    assert by_date['investment_date'] == by_offset['investment_date'] == target.kst_date
+    assert by_date['investment_price'] == target.close
+    assert by_date['days_ago'] == 10
+
+    assert not calculate_investment_return("KRW-BTC", None, 1000000, investment_date="2999-01-01")['success']
+    assert not calculate_investment_return("KRW-BTC", None, 1000000, investment_date="01/02/2024")['success']
+    print(f"✅ {target.kst_date} 투자 수익률: {by_date['return_rate']:.2f}%")
+
+
+def test_get_historical_series(fake_upbit_server):
+    """API 클라이언트가 과거 일봉을 시계열로 반환하는지 테스트"""
+    series = get_historical_series("KRW-BTC", 250)
+    candles = get_historical_data("KRW-BTC", 250)
+
+    assert len(series) == 250
+    assert series[-1].timestamp == parse_candle_time(candles[0]['candle_date_time_utc'])
+    assert list(reversed(series.close)) == [c['trade_price'] for c in candles]
+    assert get_historical_series("KRW-NOPE", 10) is None
@@ -0,0 +1,102 @@
+"""
+캔들 저장소 테스트 파일
+저장소 우선 조회, 증분 동기화, 오프라인 조회, 동시 읽기를 확인
+"""
+
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.api_client import get_historical_data
+from src.return_calculator import find_investment_date_price
+from utils.candle_store import CandleStore, get_candle_store
+
+
+def test_incremental_sync_and_offline(fake_upbit_server):
+    """반복 조회시 최신 캔들만 받아오고 오프라인에서도 저장 데이터를 쓰는지 테스트"""
+    print("\n🧪 캔들 저장소 증분 동기화 테스트")
+
+    first = get_historical_data("KRW-BTC", 365)
+    first_requests = fake_upbit_server.request_count("/v1/candles/days")
+    assert len(first) == 365
+    assert first_requests == 2
+
+    second = get_historical_data("KRW-BTC", 365)
+    assert [c["candle_date_time_utc"] for c in second] == [c["candle_date_time_utc"] for c in first]
+    assert fake_upbit_server.request_count("/v1/candles/days") == first_requests + 1
+    assert fake_upbit_server.requests[-1]["params"]["count"] == "1"
+
+    # 서버가 내려가도 저장된 데이터로 응답
+    fake_upbit_server.prices.pop("KRW-BTC")
+    offline = get_historical_data("KRW-BTC", 30)
+    assert len(offline) == 30
+    print("✅ 365일 최초 2회 요청, 재조회 1회(1일분) 요청, 오프라인 조회 확인")
+
+
+def test_short_history_market(fake_upbit_server):
+    """상장 기간이 요청보다 짧은 마켓은 저장 후 다시 전체 조회하지 않는지 테스트"""
+    print("\n🧪 상장 기간이 짧은 마켓 테스트")
+
+    fake_upbit_server.history_days = 50
+    assert len(get_historical_data("KRW-ETH", 100)) == 50
+    requests_after_first = fake_upbit_server.request_count("/v1/candles/days")
+
+    assert len(get_historical_data("KRW-ETH", 100)) == 50
+    assert fake_upbit_server.requests[-1]["params"]["count"] == "1"
+    assert fake_upbit_server.request_count("/v1/candles/days") == requests_after_first + 1
+    print("✅ 상장 시점 기록 후 증분 조회 확인")
+
+
+def test_stale_store_is_caught_up_without_gaps(fake_upbit_server):
+    """오래전에 동기화한 저장소를 다시 조회해도 그 사이 일봉이 빠지지 않는지 테스트"""
+    print("\n🧪 오래된 저장소 따라잡기 테스트")
+
+    history = fake_upbit_server.get_history("KRW-BTC")
+    # 20일 전에 10일치를 동기화해 둔 저장소
+    get_candle_store().save("KRW-BTC", "days", list(reversed(history[-30:-20])))
+
+    assert len(get_historical_data("KRW-BTC", 10)) == 10
+    assert fake_upbit_server.requests[-1]["params"]["count"] == "21"
+
+    data = get_historical_data("KRW-BTC", 20)
+    expected = list(reversed(history[-20:]))
+    assert [c["candle_date_time_utc"] for c in data] == [c["candle_date_time_utc"] for c in expected]
+    assert find_investment_date_price(data, 15)[0] == history[-15]["trade_price"]
+
+    # 예전에 남은 구멍이 있으면 필요한 구간 전체를 다시 받음
+    history = fake_upbit_server.get_history("KRW-ETH")
+    store = get_candle_store()
+    store.save("KRW-ETH", "days", list(reversed(history[-10:])))
+    store.save("KRW-ETH", "days", list(reversed(history[-30:-20])))
+    requests_before = fake_upbit_server.request_count("/v1/candles/days")
+    data = get_historical_data("KRW-ETH", 20)
+    assert fake_upbit_server.request_count("/v1/candles/days") == requests_before + 1
+    assert fake_upbit_server.requests[-1]["params"]["count"] == "20"
+    assert len(data) == 20
+    print("✅ 빠진 구간 없이 따라잡기 확인")
+
+
+def test_concurrent_readers(tmp_path):
+    """쓰는 중에도 여러 스레드가 동시에 읽을 수 있는지 테스트"""
+    print("\n🧪 캔들 저장소 동시 읽기 테스트")
+
+    store = CandleStore(str(tmp_path / "candles.sqlite3"))
+    candles = [
+        {"candle_date_time_utc": f"2024-01-{day:02d}T00:00:00", "trade_price": float(day)}
+        for day in range(1, 29)
+    ]
+    store.save("KRW-BTC", "days", candles)
+
+    def read_and_write(index):
+        store.save("KRW-BTC", "days", candles[index % 28:index % 28 + 1])
+        return len(store.load("KRW-BTC", "days", 100))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        counts = list(pool.map(read_and_write, range(64)))
+
+    assert all(count == 28 for count in counts)
+    assert store.load("KRW-BTC", "days", 1)[0]["trade_price"] == 28.0
+    print("✅ 동시 읽기/쓰기 64회 확인")
@@ -0,0 +1,90 @@
+"""
+API 기록/재생(cassette) 테스트 파일
+가짜 서버 응답을 기록한 뒤 네트워크 요청 없이 같은 결과가 재생되는지 확인
+"""
+
+import sys
+import os
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.cassette import Cassette, set_cassette, make_request_key
+from utils.candle_store import CandleStore, set_candle_store
+from utils.price_cache import clear_price_cache
+from utils.api_client import get_current_prices, get_historical_data, get_single_price
+
+
+def _run_pipeline():
+    prices = get_current_prices(["KRW-BTC", "KRW-ETH", "KRW-DOGE"])
+    history = get_historical_data("KRW-BTC", 450)
+    return prices, history
+
+
+def test_record_then_replay(fake_upbit_server, tmp_path):
+    """기록한 응답을 네트워크 없이 같은 순서로 재생하는지 테스트"""
+    print("\n🧪 cassette 기록/재생 테스트")
+
+    path = str(tmp_path / "cassette.jsonl.gz")
+    recorder = Cassette(path, "record")
+    previous = set_cassette(recorder)
+    try:
+        recorded = _run_pipeline()
+        recorder.close()
+        recorded_requests = fake_upbit_server.request_count()
+        assert recorder.stats['recorded'] == recorded_requests
+
+        # 캐시와 저장소를 비우고 재생
+        clear_price_cache()
+        set_candle_store(CandleStore(str(tmp_path / "replay.sqlite3")))
+        player = Cassette(path, "replay")
+        set_cassette(player)
+        replayed = _run_pipeline()
+    finally:
+        set_cassette(previous)
+
+    assert replayed == recorded
+    assert recorded[0] == {"KRW-BTC": 50000000.0, "KRW-ETH": 2800000.0}
+    assert len(recorded[1]) == 450
+    assert fake_upbit_server.request_count() == recorded_requests
+    assert player.stats['replayed'] == recorded_requests
+    assert player.stats['misses'] == 0
+    print(f"✅ {recorded_requests}개 응답 기록 후 재생")
+
+
+def test_replay_miss_and_latency(fake_upbit_server, tmp_path):
+    """기록되지 않은 요청은 재시도 없이 실패하고, 지연 재현 옵션이 동작하는지 테스트"""
+    print("\n🧪 cassette 미기록 요청 및 지연 재현 테스트")
+
+    path = str(tmp_path / "cassette.jsonl.gz")
+    recorder = Cassette(path, "record")
+    previous = set_cassette(recorder)
+    try:
+        fake_upbit_server.latency = 0.2
+        assert get_single_price("KRW-BTC") == 50000000.0
+        recorder.close()
+
+        clear_price_cache()
+        player = Cassette(path, "replay")
+        set_cassette(player)
+        started = time.monotonic()
+        assert get_single_price("KRW-XRP") is None
+        assert player.stats['misses'] == 1
+        assert time.monotonic() - started < 0.5
+
+        clear_price_cache()
+        set_cassette(Cassette(path, "replay", replay_latency=True))
+        started = time.monotonic()
+        assert get_single_price("KRW-BTC") == 50000000.0
+        assert time.monotonic() - started >= 0.2
+    finally:
+        set_cassette(previous)
+    print("✅ 미기록 요청 실패 및 지연 재현 확인")
+
+
+def test_request_key_ignores_host_and_order():
+    """요청 키가 호스트와 파라미터 순서에 영향을 받지 않는지 테스트"""
+    key1 = make_request_key("https://api.upbit.com/v1/candles/days", {"market": "KRW-BTC", "count": 200})
+    key2 = make_request_key("http://127.0.0.1:8080/v1/candles/days", {"count": 200, "market": "KRW-BTC"})
+    assert key1 == key2 == "/v1/candles/days?count=200&market=KRW-BTC"
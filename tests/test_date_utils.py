@@ -0,0 +1,102 @@
+"""
+날짜 유틸리티 테스트 파일
+캔들 시각 문자열의 일괄 변환 결과, 오류 수집, 속도를 확인
+"""
+
+import sys
+import os
+import calendar
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.candle_series import KST, CandleSeries
+from utils.date_utils import (
+    INVALID_TIMESTAMP,
+    parse_candle_timestamps,
+    parse_upbit_datetime,
+    parse_upbit_timestamp,
+    parse_upbit_timestamps
+)
+from tests.helpers.test_data_generator import TestDataGenerator
+
+
+def test_matches_calendar_timegm():
+    """변환 결과가 표준 라이브러리 계산과 같은지 테스트"""
+    base = datetime(2017, 9, 25, 0, 0, 0)
+    moments = [base + timedelta(hours=7 * i, seconds=i) for i in range(2000)]
+    values = [moment.strftime("%Y-%m-%dT%H:%M:%S") for moment in moments]
+
+    parsed = parse_upbit_timestamps(values)
+    assert parsed.errors == []
+    assert list(parsed.timestamps) == [calendar.timegm(moment.timetuple()) for moment in moments]
+
+    assert parse_upbit_timestamp("2024-01-01T09:00:00", KST) == parse_upbit_timestamp("2024-01-01T00:00:00")
+    assert parse_upbit_timestamp("2024-01-01T00:00:00.123456Z") == 1704067200
+
+
+def test_parse_upbit_datetime():
+    """단일 날짜 변환이 시간대 표기를 무시하고, 잘못된 값은 예외로 알리는지 테스트"""
+    assert parse_upbit_datetime("2024-01-01T09:30:15") == datetime(2024, 1, 1, 9, 30, 15)
+    assert parse_upbit_datetime("2024-01-01T09:30:15+09:00") == datetime(2024, 1, 1, 9, 30, 15)
+    for value in ("2024-01-01", "not a date", "2024-13-01T00:00:00"):
+        with pytest.raises(ValueError):
+            parse_upbit_datetime(value)
+
+
+def test_kst_and_utc_fields_agree():
+    """같은 캔들의 KST/UTC 필드가 같은 epoch 초가 되는지 테스트"""
+    candles = TestDataGenerator.generate_candle_data("KRW-BTC", 50)
+    utc = parse_candle_timestamps(candles, "candle_date_time_utc")
+    kst = parse_candle_timestamps(candles, "candle_date_time_kst")
+    assert utc.timestamps == kst.timestamps
+    assert not utc.errors and not kst.errors
+
+
+def test_errors_are_collected(capsys):
+    """잘못된 값은 행마다 출력하지 않고 위치와 값을 모아 반환하는지 테스트"""
+    values = ["2024-01-01T00:00:00", "2024-02-30T00:00:00", None, "2024-01-01", "2024-01-01T24:00:00", 17]
+    parsed = parse_upbit_timestamps(values)
+
+    assert [index for index, _ in parsed.errors] == [1, 2, 3, 4, 5]
+    assert parsed.timestamps[0] == 1704067200
+    assert all(parsed.timestamps[index] == INVALID_TIMESTAMP for index, _ in parsed.errors)
+    assert capsys.readouterr().out == ""
+
+
+def test_candle_series_drops_invalid_rows(capsys):
+    """시계열 변환시 잘못된 시각의 캔들은 제외하고 한 번만 알리는지 테스트"""
+    candles = list(reversed(TestDataGenerator.generate_candle_data("KRW-BTC", 20)))
+    candles[3]['candle_date_time_utc'] = "invalid"
+    candles[7]['candle_date_time_utc'] = None
+
+    series = CandleSeries.from_candles(candles)
+    output = capsys.readouterr().out
+
+    assert len(series) == 18
+    assert output.count("⚠️") == 1 and "2개" in output
+
+
+def test_bulk_parsing_speed():
+    """100,000개 시각 변환이 strptime보다 빠른지 테스트"""
+    print("\n🧪 시각 일괄 변환 속도 테스트")
+
+    base = datetime(2020, 1, 1)
+    values = [(base + timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%S") for i in range(100000)]
+
+    started = time.perf_counter()
+    parsed = parse_upbit_timestamps(values)
+    bulk_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for value in values:
+        datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+    strptime_seconds = time.perf_counter() - started
+
+    assert len(parsed.timestamps) == 100000 and not parsed.errors
+    assert bulk_seconds < strptime_seconds
+    print(f"✅ 일괄 변환 {bulk_seconds * 1000:.1f}ms / strptime {strptime_seconds * 1000:.1f}ms")
@@ -0,0 +1,109 @@
+"""
+적립식 투자(DCA) 백테스터 테스트 파일
+매수 일정, 수수료, 누적 수량/평균 매수가/손익 곡선, 전체 마켓 일괄 실행을 확인
+"""
+
+import sys
+import os
+import time
+from array import array
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.candle_series import CandleSeries
+from src.dca_backtester import backtest_dca, backtest_dca_markets
+from tests.helpers.test_data_generator import TestDataGenerator
+
+START = 1704067200  # 2024-01-01 00:00 UTC
+DAY = 24 * 60 * 60
+
+
+def _daily(closes, skip=()):
+    """종가가 주어진 일봉 시계열 (skip에 있는 날은 거래 공백)"""
+    days = [day for day in range(len(closes)) if day not in skip]
+    timestamps = array('q', (START + day * DAY for day in days))
+    prices = array('d', (closes[day] for day in days))
+    return CandleSeries("KRW-BTC", "days", timestamps, prices, prices, prices, prices, array('d', [1.0]) * len(days))
+
+
+def test_dca_quantities_and_fees():
+    """매수 수량, 수수료, 평균 매수가, 손익을 직접 계산한 값과 비교"""
+    print("\n🧪 적립식 투자 계산 테스트")
+
+    closes = [100.0, 80.0, 50.0, 60.0, 200.0]
+    result = backtest_dca(_daily(closes), 10000, interval_days=2, fee_rate=0.001)
+
+    # 0, 2, 4일째 매수
+    quantity = sum(10000 * 0.999 / closes[day] for day in (0, 2, 4))
+    assert result['success']
+    assert result['buy_count'] == 3
+    assert result['total_invested'] == 30000
+    assert result['total_fee'] == pytest.approx(30)
+    assert result['total_quantity'] == pytest.approx(quantity)
+    assert result['average_cost'] == pytest.approx(30000 / quantity)
+    assert result['final_value'] == pytest.approx(quantity * 200)
+    assert result['return_rate'] == pytest.approx((quantity * 200 / 30000 - 1) * 100)
+
+    assert list(result['invested_curve']) == [10000, 10000, 20000, 20000, 30000]
+    assert result['quantity_curve'][1] == result['quantity_curve'][0]
+    assert result['pnl_curve'][1] == pytest.approx(10000 * 0.999 / 100 * 80 - 10000)
+    assert len(result['pnl_curve']) == len(result['timestamps']) == 5
+    print(f"✅ 평균 매수가 {result['average_cost']:.2f}, 수익률 {result['return_rate']:.2f}%")
+
+
+def test_dca_buys_next_trading_day_on_gaps():
+    """매수 예정일에 거래가 없으면 다음 거래일에 매수하는지 테스트"""
+    closes = [100.0] * 10
+    closes[4] = 50.0
+    result = backtest_dca(_daily(closes, skip={3}), 1000, interval_days=3, fee_rate=0.0)
+
+    # 0, 3(공백 → 4), 6, 9일째 매수
+    assert result['buy_count'] == 4
+    assert result['total_quantity'] == pytest.approx(10 + 20 + 10 + 10)
+    assert list(result['invested_curve'])[:4] == [1000, 1000, 1000, 2000]
+
+
+def test_dca_accepts_api_candles_and_rejects_bad_input():
+    """get_historical_data 형식 입력과 잘못된 입력을 테스트"""
+    candles = list(reversed(TestDataGenerator.generate_candle_data("KRW-ETH", 60)))
+    from_list = backtest_dca(candles, 50000)
+    from_series = backtest_dca(CandleSeries.from_candles(candles), 50000)
+
+    assert from_list['market'] == "KRW-ETH"
+    assert from_list['final_value'] == from_series['final_value']
+    assert from_list['buy_count'] == 9
+
+    assert not backtest_dca(candles, 0)['success']
+    assert not backtest_dca(candles, 1000, interval_days=0)['success']
+    assert not backtest_dca([], 1000, market="KRW-ETH")['success']
+
+
+def test_year_across_many_markets_is_fast():
+    """1년치 일봉으로 수백 개 마켓을 빠르게 계산하는지 테스트"""
+    print("\n🧪 적립식 투자 대량 계산 테스트")
+
+    series = CandleSeries.from_candles(list(reversed(TestDataGenerator.generate_candle_data("KRW-BTC", 365))))
+    started = time.perf_counter()
+    results = [backtest_dca(series, 100000, interval_days=1) for _ in range(250)]
+    elapsed = time.perf_counter() - started
+
+    assert all(result['buy_count'] == 365 for result in results)
+    assert elapsed < 2.0
+    print(f"✅ 250개 마켓 × 365일: {elapsed * 1000:.0f}ms")
+
+
+def test_backtest_all_krw_markets(fake_upbit_server):
+    """KRW 마켓 전체를 마켓당 한 번의 조회로 백테스트하는지 테스트"""
+    results = backtest_dca_markets(days=365, amount=100000, interval_days=7)
+
+    assert set(results) == set(fake_upbit_server.prices)
+    assert fake_upbit_server.request_count("/v1/candles/days") == 2 * len(results)
+    for result in results.values():
+        assert result['success']
+        assert result['buy_count'] == 53
+        assert len(result['pnl_curve']) == 365
+
+    assert backtest_dca_markets(["KRW-NOPE"]) == {}
@@ -0,0 +1,80 @@
+"""
+가짜 업비트 서버 장애 주입 테스트 파일
+지연 시간 분포, 오류 응답, 일부 응답, 잘린 응답에서 클라이언트가 복구하는지 확인
+"""
+
+import sys
+import os
+import random
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.retry_policy import RetryPolicy, set_retry_policy
+from utils.price_cache import clear_price_cache
+from utils.api_client import get_current_prices
+from tests.helpers.fake_upbit_server import (
+    FakeUpbitServer,
+    lognormal_latency,
+    with_tail_latency,
+    parse_latency
+)
+
+
+def _fast_retry_policy() -> RetryPolicy:
+    return RetryPolicy(max_retries=6, base_delay=0.001, max_delay=0.01, max_elapsed=5.0, jitter=0.0)
+
+
+def test_latency_distributions():
+    """지연 시간 분포가 시드에 따라 재현되고 꼬리 지연이 섞이는지 테스트"""
+    print("\n🧪 지연 시간 분포 테스트")
+
+    samples = []
+    for _ in range(2):
+        server = FakeUpbitServer(latency=with_tail_latency(lognormal_latency(0.01, 0.5), 0.05, 1.0), seed=3)
+        samples.append(sorted(server.sample_latency() for _ in range(1000)))
+        server.server_close()
+
+    assert samples[0] == samples[1]
+    median, p99 = samples[0][500], samples[0][990]
+    assert 0.008 < median < 0.012
+    assert p99 > 1.0
+    assert parse_latency("0.25")(random.Random()) == 0.25
+    assert 0.01 <= parse_latency("uniform:0.01:0.02")(random.Random()) <= 0.02
+    print(f"✅ 중앙값 {median * 1000:.1f}ms, p99 {p99 * 1000:.0f}ms")
+
+
+def test_client_recovers_from_injected_errors(fake_upbit_server):
+    """오류 응답과 잘린 응답이 섞여도 재시도로 전체 결과를 받는지 테스트"""
+    print("\n🧪 오류/잘린 응답 주입 테스트")
+
+    fake_upbit_server.rng = random.Random(11)
+    # 잘린 응답도 재시도되는 실패이므로 연속 실패로 회로 차단기가 열리지 않을 정도의 비율을 사용
+    fake_upbit_server.error_rate = 0.1
+    fake_upbit_server.error_status = 503
+    fake_upbit_server.truncate_rate = 0.1
+    previous = set_retry_policy(_fast_retry_policy())
+    try:
+        for _ in range(10):
+            prices = get_current_prices(["KRW-BTC", "KRW-ETH"])
+            assert prices == {"KRW-BTC": 50000000.0, "KRW-ETH": 2800000.0}
+            clear_price_cache()
+    finally:
+        set_retry_policy(previous)
+
+    assert fake_upbit_server.status_counts.get(503, 0) > 0
+    print(f"✅ 응답 상태 코드: {fake_upbit_server.status_counts}")
+
+
+def test_client_handles_partial_responses(fake_upbit_server):
+    """일부 마켓이 빠진 티커 응답에서 빠진 마켓만 다시 조회하는지 테스트"""
+    print("\n🧪 일부 응답 주입 테스트")
+
+    fake_upbit_server.rng = random.Random(5)
+    fake_upbit_server.partial_rate = 1.0
+    markets = list(fake_upbit_server.prices)
+
+    prices = get_current_prices(markets)
+    assert prices == fake_upbit_server.prices
+    assert fake_upbit_server.request_count("/v1/ticker") > 1
+    print(f"✅ 티커 요청 {fake_upbit_server.request_count('/v1/ticker')}회로 {len(prices)}개 마켓 조회")
@@ -0,0 +1,81 @@
+"""
+HTTP 세션 풀 테스트 파일
+공유 세션 재사용과 keep-alive 연결 재사용을 로컬 서버로 확인
+"""
+
+import sys
+import os
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.http_session import get_session, configure_session, close_session
+from utils.api_client import make_api_request
+
+
+class _CountingHandler(BaseHTTPRequestHandler):
+    """새 TCP 연결 수를 세는 keep-alive 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def do_GET(self):
+        body = json.dumps([{"market": "KRW-BTC", "trade_price": 1000.0}]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_shared_session_lifecycle():
+    """공유 세션 생성/정리 테스트"""
+    print("\n🧪 공유 세션 생명주기 테스트")
+
+    first = get_session()
+    assert get_session() is first
+
+    close_session()
+    second = get_session()
+    assert second is not first
+
+    configured = configure_session(pool_maxsize=4)
+    assert get_session() is configured
+    assert configured.get_adapter("https://api.upbit.com")._pool_maxsize == 4
+
+    close_session()
+    print("✅ 세션 재사용 및 정리 확인")
+
+
+def test_keep_alive_connection_reuse():
+    """여러 요청이 하나의 TCP 연결을 재사용하는지 테스트"""
+    print("\n🧪 keep-alive 연결 재사용 테스트")
+
+    _CountingHandler.connections = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CountingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/v1/ticker"
+        close_session()
+        for _ in range(5):
+            data = make_api_request(url, {"markets": "KRW-BTC"})
+            assert data[0]["trade_price"] == 1000.0
+
+        print(f"✅ 요청 5회, TCP 연결 {_CountingHandler.connections}회")
+        assert _CountingHandler.connections == 1
+    finally:
+        close_session()
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,114 @@
+"""
+API 응답 디코딩 테스트 파일
+필요한 필드만 읽는 디코더가 전체 파싱과 같은 결과를 내는지 확인
+"""
+
+import sys
+import os
+import json
+
+import pytest
+import requests
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import json_decoder
+from utils.json_decoder import (
+    TickerPrice,
+    CandleClose,
+    decode_ticker_prices,
+    decode_candle_closes,
+    loads
+)
+from utils.api_client import _decode_response, get_current_prices, parse_ticker_prices
+from tests.helpers.test_data_generator import TestDataGenerator
+
+
+def test_decode_matches_full_parse():
+    """빠른 경로 결과가 전체 파싱 후 추출한 값과 같은지 테스트"""
+    print("\n🧪 선택적 디코딩 결과 비교 테스트")
+
+    tickers = [TestDataGenerator.generate_ticker_data(f"KRW-COIN{i}", 1000.0 + i) for i in range(50)]
+    candles = TestDataGenerator.generate_candle_data("KRW-BTC", 30)
+
+    for separators in ((",", ":"), (", ", ": ")):
+        ticker_bytes = json.dumps(tickers, separators=separators).encode()
+        candle_bytes = json.dumps(candles, separators=separators).encode()
+
+        assert decode_ticker_prices(ticker_bytes) == [
+            TickerPrice(t["market"], float(t["trade_price"])) for t in tickers
+        ]
+        assert decode_candle_closes(candle_bytes) == [
+            CandleClose(c["candle_date_time_kst"], float(c["trade_price"])) for c in candles
+        ]
+
+    assert decode_ticker_prices(b"[]") == []
+    print("✅ 티커/일봉 디코딩 결과 일치")
+
+
+def test_decode_falls_back_to_full_parse():
+    """빠른 경로로 읽을 수 없는 응답은 전체 파싱으로 처리하는지 테스트"""
+    print("\n🧪 전체 파싱 대체 경로 테스트")
+
+    payloads = [
+        # 이스케이프된 문자열
+        [{"market": "KRW-\\BTC", "trade_price": 1}, {"market": "KRW-ETH", "trade_price": 2.5}],
+        # null 가격 (parse_ticker_prices와 같이 제외)
+        [{"market": "KRW-BTC", "trade_price": None}, {"market": "KRW-ETH", "trade_price": 2.5}],
+        # 중첩 객체
+        [{"market": "KRW-ETH", "extra": {"note": "x"}, "trade_price": 2.5}],
+    ]
+    expected = [
+        [TickerPrice("KRW-\\BTC", 1.0), TickerPrice("KRW-ETH", 2.5)],
+        [TickerPrice("KRW-ETH", 2.5)],
+        [TickerPrice("KRW-ETH", 2.5)],
+    ]
+
+    for payload, records in zip(payloads, expected):
+        assert decode_ticker_prices(json.dumps(payload).encode()) == records
+
+    assert parse_ticker_prices(expected[0]) == {"KRW-\\BTC": 1.0, "KRW-ETH": 2.5}
+    print("✅ 대체 경로 결과 확인")
+
+
+def test_truncated_body_is_not_decoded():
+    """잘린 본문은 빠른 경로로 읽지 않고 재시도 가능한 JSON 오류가 되는지 테스트"""
+    truncated = b'[{"market":"KRW-BTC","trade_price":5e7,"x":1},{"market":"KRW-ETH","trade_price":280'
+
+    with pytest.raises(ValueError):
+        decode_ticker_prices(truncated)
+    with pytest.raises(ValueError):
+        decode_ticker_prices(truncated + b"}")
+
+    response = requests.Response()
+    response._content = truncated
+    with pytest.raises(requests.exceptions.InvalidJSONError):
+        _decode_response(response, decode_ticker_prices)
+
+
+def test_json_backend_selection(monkeypatch):
+    """JSON_BACKEND 설정에 따라 파서를 고르는지 테스트"""
+    print("\n🧪 JSON 파서 선택 테스트")
+
+    monkeypatch.setattr(json_decoder, "JSON_BACKEND", "json")
+    assert json_decoder.get_json_backend() == "json"
+    assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    monkeypatch.setattr(json_decoder, "JSON_BACKEND", "auto")
+    expected = "orjson" if json_decoder.orjson is not None else "json"
+    assert json_decoder.get_json_backend() == expected
+    assert loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    print(f"✅ 자동 선택: {expected}")
+
+
+def test_current_prices_use_compact_records(fake_upbit_server):
+    """현재가 조회가 압축 레코드 디코더를 거쳐 같은 가격을 반환하는지 테스트"""
+    print("\n🧪 현재가 조회 디코딩 경로 테스트")
+
+    markets = list(fake_upbit_server.prices)
+    prices = get_current_prices(markets)
+
+    assert prices == fake_upbit_server.prices
+    assert fake_upbit_server.request_count("/v1/ticker") == 1
+    print(f"✅ {len(prices)}개 마켓 현재가 조회")
@@ -0,0 +1,66 @@
+"""
+마켓 목록 캐시 테스트 파일
+market/all 1회 조회, 디스크 캐시 재사용, 잘못된 마켓 사전 차단을 확인
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import market_catalog
+from src.portfolio_analyzer import validate_portfolio
+from src.price_alert import validate_market_code
+from src.return_calculator import calculate_investment_return
+
+
+def test_catalog_lookup_and_disk_cache(fake_upbit_server):
+    """마켓 목록 조회 및 디스크 캐시 재사용 테스트"""
+    print("\n🧪 마켓 목록 캐시 테스트")
+
+    assert market_catalog.is_known_market("KRW-BTC")
+    assert not market_catalog.is_known_market("KRW-BTCC")
+    assert market_catalog.get_quote_currency("KRW-ETH") == "KRW"
+    assert market_catalog.get_korean_name("KRW-XRP") == "XRP"
+    assert "KRW-ADA" in market_catalog.get_markets_by_quote("KRW")
+    assert fake_upbit_server.request_count("/v1/market/all") == 1
+
+    # 메모리 캐시를 지워도 디스크 캐시가 유효하면 다시 조회하지 않음
+    market_catalog.clear_market_catalog()
+    assert market_catalog.is_known_market("KRW-DOT")
+    assert fake_upbit_server.request_count("/v1/market/all") == 1
+
+    market_catalog.load_market_catalog(force_refresh=True)
+    assert fake_upbit_server.request_count("/v1/market/all") == 2
+    print("✅ 마켓 목록 1회 조회 후 캐시 재사용 확인")
+
+
+def test_unknown_markets_rejected_before_ticker(fake_upbit_server):
+    """상장되지 않은 마켓이 현재가 조회 전에 거부되는지 테스트"""
+    print("\n🧪 잘못된 마켓 사전 차단 테스트")
+
+    assert validate_portfolio({"KRW-BTC": 0.1, "KRW-ETH": 1.0})
+    assert not validate_portfolio({"KRW-BTC": 0.1, "KRW-ETHH": 1.0})
+    assert validate_market_code("KRW-BTC")
+    assert not validate_market_code("KRW-BTCC")
+
+    result = calculate_investment_return("KRW-TYPO", 7, 1000000)
+    assert not result['success']
+
+    assert fake_upbit_server.request_count("/v1/ticker") == 0
+    assert fake_upbit_server.request_count("/v1/candles/days") == 0
+    print("✅ 티커 요청 없이 잘못된 마켓 거부 확인")
+
+
+def test_non_krw_market_accepted(fake_upbit_server):
+    """KRW 외 기준 통화 마켓도 목록에 있으면 수익률 계산이 되는지 테스트"""
+    print("\n🧪 BTC 마켓 수익률 계산 테스트")
+
+    fake_upbit_server.prices["BTC-ETH"] = 0.05
+    assert market_catalog.get_quote_currency("BTC-ETH") == "BTC"
+
+    result = calculate_investment_return("BTC-ETH", 7, 1.0)
+    assert result['success'], result['error_message']
+    assert result['current_price'] == 0.05
+    print(f"✅ BTC-ETH 수익률: {result['return_rate']:.2f}%")
@@ -0,0 +1,89 @@
+"""
+API 지표 수집 테스트 파일
+엔드포인트별 응답 시간, 상태 코드, 재시도, 대체 경로 지표와 Prometheus 출력을 확인
+"""
+
+import sys
+import os
+import random
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.metrics import (
+    ApiMetrics,
+    set_api_metrics,
+    get_metrics_snapshot,
+    export_prometheus_metrics
+)
+from utils.retry_policy import RetryPolicy, set_retry_policy
+from utils.api_client import get_current_prices, get_historical_data
+
+
+def test_histogram_and_prometheus_format():
+    """히스토그램 누적 개수와 Prometheus 텍스트 형식 테스트"""
+    print("\n🧪 히스토그램 및 Prometheus 형식 테스트")
+
+    metrics = ApiMetrics(buckets=(0.1, 1.0))
+    metrics.observe_request("ticker", 200, 0.05, 100)
+    metrics.observe_request("ticker", 200, 0.1, 100)
+    metrics.observe_request("ticker", 503, 3.0, 20)
+    metrics.observe_request("ticker", None, 0.5, 0)
+    metrics.observe_retry("ticker")
+    metrics.observe_fallback("ticker", "bisect")
+
+    ticker = metrics.snapshot()["ticker"]
+    assert ticker['latency']['buckets'] == {0.1: 2, 1.0: 3, '+Inf': 4}
+    assert ticker['statuses'] == {'200': 2, '503': 1, 'error': 1}
+    assert ticker['bytes_received'] == 220
+    assert ticker['retries'] == 1
+
+    text = metrics.to_prometheus()
+    assert '# TYPE upbit_api_request_duration_seconds histogram' in text
+    assert 'upbit_api_request_duration_seconds_bucket{endpoint="ticker",le="+Inf"} 4' in text
+    assert 'upbit_api_request_duration_seconds_count{endpoint="ticker"} 4' in text
+    assert 'upbit_api_responses_total{endpoint="ticker",status="503"} 1' in text
+    assert 'upbit_api_retries_total{endpoint="ticker"} 1' in text
+    assert 'upbit_api_fallbacks_total{endpoint="ticker",reason="bisect"} 1' in text
+    print("✅ Prometheus 출력 확인")
+
+
+def test_client_records_endpoint_metrics(fake_upbit_server):
+    """API 클라이언트가 엔드포인트별 지표를 기록하는지 테스트"""
+    print("\n🧪 API 클라이언트 지표 기록 테스트")
+
+    previous_metrics = set_api_metrics(ApiMetrics())
+    previous_policy = set_retry_policy(
+        RetryPolicy(max_retries=5, base_delay=0.001, max_delay=0.01, max_elapsed=5.0, jitter=0.0)
+    )
+    try:
+        get_current_prices(["KRW-BTC", "KRW-ETH", "KRW-DOGE"])
+
+        fake_upbit_server.rng = random.Random(2)
+        fake_upbit_server.error_rate = 0.3
+        get_historical_data("KRW-BTC", 450)
+        fake_upbit_server.error_rate = 0.0
+
+        snapshot = get_metrics_snapshot()
+    finally:
+        set_api_metrics(previous_metrics)
+        set_retry_policy(previous_policy)
+
+    ticker, candles = snapshot['ticker'], snapshot['candles']
+    assert ticker['requests'] == fake_upbit_server.request_count("/v1/ticker")
+    assert ticker['statuses']['404'] >= 1
+    assert ticker['fallbacks']['bisect'] >= 1
+    assert candles['requests'] == fake_upbit_server.request_count("/v1/candles/days")
+    assert candles['retries'] == candles['statuses']['500'] > 0
+    assert candles['bytes_received'] > 0
+    print(f"✅ ticker {ticker['requests']}회, candles {candles['requests']}회 (재시도 {candles['retries']}회)")
+
+
+def test_disabled_metrics_are_empty():
+    """지표 수집이 꺼져 있으면 빈 결과를 반환하는지 테스트"""
+    previous = set_api_metrics(None)
+    try:
+        assert get_metrics_snapshot() == {}
+        assert export_prometheus_metrics() == ""
+    finally:
+        set_api_metrics(previous)
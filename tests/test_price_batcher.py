@@ -0,0 +1,88 @@
+"""
+현재가 묶음 처리 테스트 파일
+동시에 들어온 단일 마켓 요청이 한 번의 티커 요청으로 처리되는지 확인
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import api_client
+from utils.price_batcher import PriceBatcher, set_price_batcher
+from utils.api_client import get_current_prices_with_rejected, get_single_price
+
+
+def _batch_loader(markets):
+    return get_current_prices_with_rejected(markets)[0]
+
+
+def test_threads_share_one_ticker_request(fake_upbit_server, monkeypatch):
+    """여러 스레드의 단일 마켓 요청을 한 번의 티커 요청으로 묶는지 테스트"""
+    print("\n🧪 스레드 요청 묶음 처리 테스트")
+
+    batcher = PriceBatcher(_batch_loader, window=0.2, max_batch=100)
+    previous = set_price_batcher(batcher)
+    monkeypatch.setattr(api_client, "PRICE_BATCH_ENABLED", True)
+    markets = list(fake_upbit_server.prices) * 4
+    try:
+        with ThreadPoolExecutor(max_workers=len(markets)) as pool:
+            results = list(pool.map(get_single_price, markets))
+    finally:
+        batcher.close()
+        set_price_batcher(previous)
+
+    assert results == [fake_upbit_server.prices[market] for market in markets]
+    assert fake_upbit_server.request_count("/v1/ticker") == 1
+    stats = batcher.get_stats()
+    assert stats['requests'] == len(markets)
+    assert stats['batches'] == 1
+    assert stats['max_batch_size'] == len(fake_upbit_server.prices)
+    print(f"✅ 묶음 통계: {stats}")
+
+
+def test_size_cap_and_unknown_market(fake_upbit_server):
+    """최대 묶음 크기를 지키고, 존재하지 않는 마켓은 None을 받는지 테스트"""
+    print("\n🧪 묶음 크기 제한 테스트")
+
+    batcher = PriceBatcher(_batch_loader, window=1.0, max_batch=2)
+    markets = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-DOGE"]
+    started = time.monotonic()
+    futures = [batcher.submit(market) for market in markets]
+    results = [future.result(5) for future in futures]
+    batcher.close()
+
+    assert results == [50000000.0, 2800000.0, 650.0, None]
+    assert time.monotonic() - started < 1.0  # 크기 제한에 도달하면 window를 기다리지 않음
+    assert batcher.get_stats()['batch_sizes'] == {2: 2}
+    print(f"✅ 묶음 크기: {batcher.get_stats()['batch_sizes']}")
+
+
+def test_asyncio_callers_are_batched():
+    """asyncio 호출자들의 요청도 하나의 묶음으로 처리되는지 테스트"""
+    print("\n🧪 asyncio 요청 묶음 처리 테스트")
+
+    calls = []
+    lock = threading.Lock()
+
+    def loader(markets):
+        with lock:
+            calls.append(sorted(markets))
+        return {market: float(len(market)) for market in markets}
+
+    batcher = PriceBatcher(loader, window=0.05)
+
+    async def main():
+        return await asyncio.gather(*(batcher.get_async(f"KRW-C{i}") for i in range(20)))
+
+    results = asyncio.run(main())
+    batcher.close()
+
+    assert results == [float(len(f"KRW-C{i}")) for i in range(20)]
+    assert len(calls) == 1 and len(calls[0]) == 20
+    print(f"✅ 20개 요청 → 티커 조회 {len(calls)}회")
@@ -0,0 +1,74 @@
+"""
+현재가 캐시 테스트 파일
+TTL 재사용, 동시 요청 합치기(single-flight), 실패시 이전 가격 사용을 확인
+"""
+
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.price_cache import PriceCache, get_price_cache_stats
+from utils.api_client import get_single_price, get_current_prices
+
+
+def test_single_flight_and_ttl():
+    """동시 호출자가 하나의 조회를 공유하고 TTL 후 다시 조회하는지 테스트"""
+    print("\n🧪 single-flight 및 TTL 테스트")
+
+    cache = PriceCache(ttl=0.2, max_staleness=5.0)
+    calls = []
+    release = threading.Event()
+
+    def slow_loader(markets):
+        calls.append(list(markets))
+        release.wait(1)
+        return {market: 100.0 for market in markets}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(cache.get_many, ["KRW-BTC"], slow_loader) for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert all(result == {"KRW-BTC": 100.0} for result in results)
+    assert len(calls) == 1
+    assert cache.get_stats()['coalesced'] == 7
+
+    assert cache.get_many(["KRW-BTC"], slow_loader) == {"KRW-BTC": 100.0}
+    assert len(calls) == 1
+
+    time.sleep(0.25)
+    cache.get_many(["KRW-BTC"], slow_loader)
+    assert len(calls) == 2
+    print(f"✅ 통계: {cache.get_stats()}")
+
+
+def test_stale_price_on_failure():
+    """조회 실패시 허용 범위 내의 이전 가격을 반환하는지 테스트"""
+    print("\n🧪 조회 실패시 이전 가격 사용 테스트")
+
+    cache = PriceCache(ttl=0.0, max_staleness=5.0)
+    cache.get_many(["KRW-ETH"], lambda markets: {"KRW-ETH": 2800000.0})
+
+    prices = cache.get_many(["KRW-ETH", "KRW-XRP"], lambda markets: {})
+    assert prices == {"KRW-ETH": 2800000.0}
+    assert cache.get_stats()['stale'] == 1
+    print("✅ 이전 가격 대체 확인")
+
+
+def test_repeated_lookups_hit_cache(fake_upbit_server):
+    """같은 마켓 반복 조회시 티커 요청이 재사용되는지 테스트"""
+    print("\n🧪 API 클라이언트 캐시 적용 테스트")
+
+    for _ in range(5):
+        assert get_single_price("KRW-BTC") is not None
+    prices = get_current_prices(["KRW-BTC", "KRW-ETH"])
+
+    assert set(prices) == {"KRW-BTC", "KRW-ETH"}
+    assert fake_upbit_server.request_count("/v1/ticker") == 2
+    print(f"✅ 티커 요청 2회, 통계: {get_price_cache_stats()}")
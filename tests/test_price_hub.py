@@ -0,0 +1,140 @@
+"""
+가격 허브 테스트 파일
+하나의 상위 시세원을 여러 구독자가 공유하고, 느린 구독자는 최신 가격만 받는지 확인
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.price_hub import PriceHub, get_price_hub
+from src.portfolio_analyzer import get_current_prices_api
+from utils.websocket_client import TickerStream
+from tests.helpers.fake_websocket_server import FakeWebSocketServer, make_tick
+
+
+def test_poll_source_is_shared(fake_upbit_server):
+    """여러 구독자가 하나의 폴링 조회를 공유하는지 테스트"""
+    print("\n🧪 폴링 허브 공유 테스트")
+
+    hub = PriceHub(source="poll", interval=0.05)
+    received = []
+    done = threading.Event()
+
+    def on_update(update):
+        received.append(update)
+        if len(received) >= 3:
+            done.set()
+
+    try:
+        btc = hub.subscribe(["KRW-BTC"])
+        both = hub.subscribe(["KRW-BTC", "KRW-ETH"])
+        hub.subscribe(["KRW-ETH"], callback=on_update)
+
+        assert btc.get(timeout=2).price == 50000000.0
+        # 첫 조회가 KRW-BTC만 포함했을 수 있으므로 두 마켓이 모두 올 때까지 읽음
+        seen = set()
+        deadline = time.monotonic() + 2
+        while seen != {"KRW-BTC", "KRW-ETH"} and time.monotonic() < deadline:
+            update = both.get(timeout=0.5)
+            if update is not None:
+                seen.add(update.market)
+        assert seen == {"KRW-BTC", "KRW-ETH"}
+        assert done.wait(2)
+        assert all(update.market == "KRW-ETH" for update in received)
+    finally:
+        hub.close()
+
+    stats = hub.get_stats()
+    # 구독자 수와 관계없이 폴링 주기마다 티커 요청은 최대 한 번
+    assert fake_upbit_server.request_count("/v1/ticker") <= stats['upstream_requests']
+    print(f"✅ 허브 통계: {stats}")
+
+
+def test_slow_subscriber_gets_latest_value():
+    """느린 구독자는 중간 가격을 건너뛰고 최신 가격만 받는지 테스트"""
+    print("\n🧪 최신 값 우선 테스트")
+
+    hub = PriceHub(fetcher=lambda markets: {}, interval=60)
+    subscription = hub.subscribe(["KRW-BTC", "KRW-ETH"])
+    for price in range(1000):
+        hub.publish("KRW-BTC", float(price))
+    hub.publish("KRW-ETH", 1.0)
+
+    update = subscription.get(timeout=1)
+    assert (update.market, update.price) == ("KRW-BTC", 999.0)
+    assert hub.get_latest("KRW-BTC") == update
+    assert subscription.get(timeout=1).market == "KRW-ETH"
+    assert subscription.get(timeout=0.05) is None
+    assert subscription.dropped == 999
+    hub.close()
+    print(f"✅ 덮어쓴 갱신 {subscription.dropped}개")
+
+
+def test_unconflated_subscriber_gets_every_update():
+    """conflate=False 구독자는 모든 갱신을 순서대로 받는지 테스트"""
+    hub = PriceHub(source="poll", fetcher=lambda markets: {})
+    subscription = hub.subscribe(["KRW-BTC"], conflate=False)
+    for price in range(100):
+        hub.publish("KRW-BTC", float(price))
+
+    received = [subscription.get(timeout=1).price for _ in range(100)]
+    assert received == [float(price) for price in range(100)]
+    assert subscription.get(timeout=0.05) is None
+    assert subscription.dropped == 0
+    hub.close()
+
+
+def test_async_iterator_and_stream_source(monkeypatch):
+    """WebSocket 시세원과 async iterator 구독 테스트"""
+    print("\n🧪 스트림 허브 async 구독 테스트")
+
+    ticks = [make_tick("KRW-BTC", 100.0 + i) for i in range(5)]
+    with FakeWebSocketServer(ticks, tick_interval=0.02) as server:
+        hub = PriceHub(source="stream", interval=0.1,
+                       stream_factory=lambda markets: TickerStream(markets, url=server.url))
+
+        async def collect():
+            prices = []
+            subscription = hub.subscribe(["KRW-BTC"])
+            async for update in subscription:
+                prices.append(update.price)
+                if update.price == 104.0:
+                    subscription.close()
+            return prices
+
+        prices = asyncio.run(asyncio.wait_for(collect(), 5))
+        hub.close()
+
+    assert prices[-1] == 104.0
+    assert prices == sorted(prices)
+    assert len(server.subscriptions) == 1
+    print(f"✅ 수신 가격: {prices}")
+
+
+def test_snapshot_shares_global_hub(fake_upbit_server):
+    """포트폴리오 분석기의 현재가 조회가 전역 허브 구독을 공유하는지 테스트"""
+    print("\n🧪 전역 허브 snapshot 테스트")
+
+    hub = get_price_hub("poll")
+    hub.interval = 0.05
+    with hub.subscribe(["KRW-BTC", "KRW-ETH"]) as subscription:
+        assert subscription.get(timeout=2) is not None
+        before = fake_upbit_server.request_count("/v1/ticker")
+
+        prices = get_current_prices_api(["KRW-BTC", "KRW-ETH"])
+        assert prices == {"KRW-BTC": 50000000.0, "KRW-ETH": 2800000.0}
+        # 이미 구독 중인 마켓이므로 별도 조회 없이 허브의 주기 조회 값을 사용
+        assert hub.get_stats()['subscribers'] == 1
+        assert fake_upbit_server.request_count("/v1/ticker") - before <= 2
+
+    # 없는 마켓은 한 번의 조회 주기가 끝나면 기다리지 않고 빠짐
+    started = time.monotonic()
+    assert hub.snapshot(["KRW-BTC", "KRW-NOPE"], timeout=5) == {"KRW-BTC": 50000000.0}
+    assert time.monotonic() - started < 2
+    print("✅ 허브 snapshot 공유 확인")
@@ -0,0 +1,78 @@
+"""
+요청 속도 제한 테스트 파일
+초당 요청 수를 제한하는 로컬 서버를 상대로 429 응답 없이 대기열이 동작하는지 확인
+"""
+
+import sys
+import os
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import API_ENDPOINTS
+from utils.api_client import make_api_request
+from utils import async_api_client
+from utils.rate_limiter import RateLimiter, set_rate_limiter, parse_remaining_req
+
+
+def test_parse_remaining_req():
+    """Remaining-Req 헤더 파싱 테스트"""
+    assert parse_remaining_req("group=default; min=1800; sec=29") == {
+        "group": "default", "min": "1800", "sec": "29"
+    }
+    assert parse_remaining_req("") is None
+    assert parse_remaining_req("group=default") is None
+
+
+def test_observe_uses_header_group():
+    """Remaining-Req 헤더의 group 값으로 버킷을 고르는지 테스트"""
+    limiter = RateLimiter({"default": 8, "order": 8}, burst=2)
+    limiter.observe("default", 200, "group=order; min=100; sec=0")
+
+    # 서버가 알려준 order 그룹만 차단되고 URL 기준 그룹은 그대로
+    assert limiter._get_bucket("order").reserve() > 0
+    assert limiter._get_bucket("default").reserve() == 0
+
+
+def test_threaded_callers_are_queued(fake_upbit_server):
+    """여러 스레드의 요청이 서버 제한을 넘지 않도록 대기하는지 테스트"""
+    print("\n🧪 스레드 요청 속도 제한 테스트")
+
+    fake_upbit_server.rate_limit = 10
+    previous = set_rate_limiter(RateLimiter({"ticker": 8}, burst=2))
+    try:
+        url = API_ENDPOINTS["ticker"]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: make_api_request(url, {"markets": "KRW-BTC"}), range(20)))
+        elapsed = time.perf_counter() - start
+    finally:
+        set_rate_limiter(previous)
+
+    print(f"✅ 20회 요청 {elapsed:.2f}초, 429 응답 {fake_upbit_server.throttled}회")
+    assert all(results)
+    assert fake_upbit_server.throttled == 0
+    assert elapsed >= 1.5
+
+
+def test_async_callers_are_queued(fake_upbit_server):
+    """asyncio 호출자도 같은 속도 제한을 따르는지 테스트"""
+    print("\n🧪 비동기 요청 속도 제한 테스트")
+
+    fake_upbit_server.rate_limit = 10
+    previous = set_rate_limiter(RateLimiter({"candles": 8}, burst=2))
+    try:
+        async def fan_out():
+            return await asyncio.gather(
+                *(async_api_client.get_historical_data("KRW-BTC", 5) for _ in range(20))
+            )
+        results = asyncio.run(fan_out())
+    finally:
+        set_rate_limiter(previous)
+
+    print(f"✅ 429 응답 {fake_upbit_server.throttled}회")
+    assert all(results)
+    assert fake_upbit_server.throttled == 0
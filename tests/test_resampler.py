@@ -0,0 +1,183 @@
+"""
+분봉 리샘플링 엔진 테스트 파일
+캔들 경계, 증분 반영, OHLCV 집계, 한 번 받은 1분봉으로 여러 시간 단위를 만드는지 확인
+"""
+
+import sys
+import os
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.candle_series import Candle, CandleSeries
+from utils.resampler import TIMEFRAME_SECONDS, CandleResampler, bucket_start
+from utils import api_client
+from utils.api_client import clear_resamplers, get_minute_candles, get_resampled_series, plan_candle_pages
+from src.price_alert import get_recent_price_range
+
+START = int(datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp())  # 월요일 00:00 UTC
+
+
+def _minutes(count: int, start: int = START, seed: int = 7, skip=()):
+    """과거순 1분봉 (skip에 있는 분은 거래 공백)"""
+    rng = random.Random(seed)
+    price = 100.0
+    candles = []
+    for index in range(count):
+        if index in skip:
+            continue
+        opening = price
+        price *= 1 + rng.uniform(-0.01, 0.01)
+        high, low = max(opening, price) * 1.001, min(opening, price) * 0.999
+        candles.append(Candle(start + index * 60, opening, high, low, price, rng.uniform(0.1, 2.0)))
+    return candles
+
+
+def _aggregate(candles, seconds):
+    """기대값: 분봉을 시간 단위별로 직접 묶음"""
+    groups = {}
+    for candle in candles:
+        groups.setdefault(bucket_start(candle.timestamp, seconds), []).append(candle)
+    return [
+        Candle(start, group[0].open, max(c.high for c in group), min(c.low for c in group),
+               group[-1].close, sum(c.volume for c in group))
+        for start, group in sorted(groups.items())
+    ]
+
+
+def test_bucket_boundaries():
+    """캔들 경계가 UTC 00:00(KST 09:00)과 월요일에 맞는지 테스트"""
+    wednesday = START + 2 * 86400 + 13 * 3600 + 7 * 60 + 5
+    assert bucket_start(wednesday, TIMEFRAME_SECONDS["15m"]) == START + 2 * 86400 + 13 * 3600
+    assert bucket_start(wednesday, TIMEFRAME_SECONDS["4h"]) == START + 2 * 86400 + 12 * 3600
+    assert bucket_start(wednesday, TIMEFRAME_SECONDS["1d"]) == START + 2 * 86400
+    assert bucket_start(wednesday, TIMEFRAME_SECONDS["1w"]) == START
+    assert datetime.fromtimestamp(bucket_start(wednesday, TIMEFRAME_SECONDS["1w"]), timezone.utc).weekday() == 0
+
+    with pytest.raises(ValueError):
+        CandleResampler("KRW-BTC", ("3m",))
+
+
+def test_ohlcv_matches_manual_aggregation():
+    """리샘플링 결과가 직접 묶은 값과 같은지 테스트 (거래 공백 포함)"""
+    print("\n🧪 리샘플링 OHLCV 테스트")
+
+    minutes = _minutes(3 * 1440, skip=set(range(100, 130)) | {2000})
+    resampler = CandleResampler("KRW-BTC")
+    assert resampler.add(minutes) == len(minutes)
+
+    for timeframe in ("5m", "1h", "4h", "1d", "1w"):
+        series = resampler.series(timeframe)
+        expected = _aggregate(minutes, TIMEFRAME_SECONDS[timeframe])
+        assert len(series) == len(expected)
+        for actual, wanted in zip(series, expected):
+            assert actual[:5] == wanted[:5]
+            assert actual.volume == pytest.approx(wanted.volume)
+        assert series.unit == timeframe
+
+    # 거래가 없던 5분 구간은 캔들이 없음
+    assert len(resampler.series("5m")) == 3 * 1440 // 5 - 6
+    print(f"✅ {resampler.series('1h')}")
+
+
+def test_incremental_add_matches_batch():
+    """1분봉을 나누어 넣어도 한 번에 넣은 결과와 같은지 테스트"""
+    minutes = _minutes(600)
+    batch = CandleResampler("KRW-BTC", ("15m", "1h"))
+    batch.add(minutes)
+
+    incremental = CandleResampler("KRW-BTC", ("15m", "1h"))
+    for offset in range(0, len(minutes), 37):
+        # 이미 반영한 분을 겹쳐 넣어도 건너뜀
+        incremental.add(minutes[max(0, offset - 3):offset + 37])
+
+    for timeframe in ("15m", "1h"):
+        assert list(incremental.series(timeframe)) == list(batch.series(timeframe))
+    assert incremental.last_timestamp == minutes[-1].timestamp
+
+
+def test_in_progress_minute_is_replaced():
+    """진행 중인 마지막 분이 갱신되면 마지막 캔들만 바뀌는지 테스트"""
+    minutes = _minutes(10)
+    resampler = CandleResampler("KRW-BTC", ("5m",))
+    resampler.add(minutes)
+    before = resampler.series("5m")
+
+    last = minutes[-1]
+    updated = last._replace(high=last.high * 2, close=last.close * 1.5, volume=last.volume + 1)
+    assert resampler.add([updated]) == 1
+    after = resampler.series("5m")
+
+    assert len(after) == len(before) == 2
+    assert after[0] == before[0]
+    assert after[-1].high == updated.high
+    assert after[-1].close == updated.close
+    assert after[-1].volume == pytest.approx(before[-1].volume + 1)
+
+    # 이전에 만든 시계열은 이후 갱신의 영향을 받지 않음
+    assert before[-1].close == last.close
+
+
+def test_minute_pages_align_to_minutes():
+    """1분봉 페이지 커서가 분 경계에 맞는지 테스트"""
+    now = datetime(2024, 1, 1, 12, 30, 45, tzinfo=timezone.utc)
+    pages = plan_candle_pages(450, now, unit="minutes/1")
+
+    assert [page['count'] for page in pages] == [200, 200, 50]
+    assert pages[1]['to'] == "2024-01-01T09:11:00Z"
+    assert pages[2]['to'] == "2024-01-01T05:51:00Z"
+    assert plan_candle_pages(201, now)[1]['to'] == "2023-06-16T00:00:00Z"
+
+
+def test_one_download_serves_all_timeframes(fake_upbit_server):
+    """1분봉을 한 번 받아 여러 시간 단위 캔들을 만드는지 테스트"""
+    print("\n🧪 1분봉 한 번으로 여러 시간 단위 조회 테스트")
+
+    path = "/v1/candles/minutes/1"
+    hourly = get_resampled_series("KRW-BTC", "1h", 24)
+    first_requests = fake_upbit_server.request_count(path)
+
+    assert len(hourly) <= 24
+    assert first_requests == 8  # 1440분 / 200개
+
+    # 더 짧은 시간 단위는 이미 받은 범위 안이므로 마지막 분 이후만 다시 받음
+    quarter = get_resampled_series("KRW-BTC", "15m", 20)
+    five = get_resampled_series("KRW-BTC", "5m", 12)
+    assert fake_upbit_server.request_count(path) == first_requests + 2
+
+    minutes = get_minute_candles("KRW-BTC", 300)
+    assert len(minutes) == 300
+    latest = minutes[0]
+    for series in (hourly, quarter, five):
+        assert series[-1].close == latest['trade_price']
+    assert quarter[-1].timestamp == bucket_start(five[-1].timestamp, 15 * 60)
+
+    assert get_resampled_series("KRW-BTC", "3m", 10) is None
+    assert get_resampled_series("KRW-NOPE", "1h", 1) is None
+
+    # 가격 알림의 최근 24시간 범위도 같은 리샘플러에서 만들어 분봉을 다시 받지 않음
+    before = fake_upbit_server.request_count(path)
+    assert get_recent_price_range("KRW-BTC") == (max(hourly.high), min(hourly.low))
+    assert fake_upbit_server.request_count(path) - before <= 1
+    assert get_recent_price_range("KRW-NOPE") is None
+    print(f"✅ {hourly} / {quarter} / {five}")
+
+
+def test_cached_resampler_is_rebuilt_across_a_gap(fake_upbit_server):
+    """이전 호출 이후 빈 구간이 생기면 리샘플러를 새로 만들어 빈 구간 없이 집계하는지 테스트"""
+    history = fake_upbit_server.get_minute_history("KRW-BTC")
+    # 하루 전쯤 조회한 뒤 남아 있는 리샘플러
+    stale = CandleResampler("KRW-BTC")
+    stale.add(CandleSeries.from_candles(history[-3000:-1500], "KRW-BTC", "minutes/1"))
+    api_client._resamplers["KRW-BTC"] = stale
+
+    hourly = get_resampled_series("KRW-BTC", "1h", 3)
+    daily = get_resampled_series("KRW-BTC", "1d", 2)
+
+    clear_resamplers()
+    assert list(get_resampled_series("KRW-BTC", "1h", 3)) == list(hourly)
+    assert list(get_resampled_series("KRW-BTC", "1d", 2)) == list(daily)
@@ -0,0 +1,103 @@
+"""
+재시도 정책 및 회로 차단기 테스트 파일
+오류 분류, 지수 백오프, 마감 시간, 회로 차단/복구를 확인
+"""
+
+import sys
+import os
+import socket
+import time
+
+import requests
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.api_client import make_api_request
+from utils.retry_policy import (
+    RetryPolicy,
+    CircuitBreaker,
+    set_retry_policy,
+    get_circuit_breaker_states,
+    reset_circuit_breakers
+)
+
+
+def _http_error(status_code: int) -> requests.exceptions.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.exceptions.HTTPError(response=response)
+
+
+def test_error_classification_and_backoff():
+    """재시도 대상 오류 분류와 백오프 계산 테스트"""
+    print("\n🧪 오류 분류 및 백오프 테스트")
+
+    policy = RetryPolicy(max_retries=5, base_delay=0.5, max_delay=2.0, max_elapsed=10.0, jitter=0.0)
+
+    assert not policy.is_retryable(_http_error(404))
+    assert not policy.is_retryable(_http_error(400))
+    assert policy.is_retryable(_http_error(429))
+    assert policy.is_retryable(_http_error(503))
+    assert policy.is_retryable(requests.exceptions.ConnectionError())
+    assert not policy.is_upstream_failure(_http_error(429))
+
+    assert [policy.get_backoff(i) for i in range(4)] == [0.5, 1.0, 2.0, 2.0]
+
+    started_at = time.monotonic()
+    assert policy.get_retry_delay(0, _http_error(404), started_at) is None
+    assert policy.get_retry_delay(4, _http_error(503), started_at) is None
+    assert policy.get_retry_delay(0, _http_error(503), started_at - 9.8) is None
+
+    jittered = RetryPolicy(base_delay=1.0, jitter=1.0)
+    assert all(0 <= jittered.get_backoff(0) <= 1.0 for _ in range(100))
+    print("✅ 4xx 즉시 포기, 429/5xx/연결 실패 재시도 확인")
+
+
+def test_circuit_breaker_transitions():
+    """회로 차단기 상태 전환 테스트"""
+    print("\n🧪 회로 차단기 상태 전환 테스트")
+
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.1)
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    time.sleep(0.12)
+    assert breaker.allow_request()  # 복구 확인 요청 1개
+    assert not breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.12)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    print("✅ closed → open → half_open → closed 확인")
+
+
+def test_unreachable_endpoint_fails_fast():
+    """연결할 수 없는 엔드포인트가 회로 차단 후 바로 실패하는지 테스트"""
+    print("\n🧪 장애 엔드포인트 빠른 실패 테스트")
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    url = f"http://127.0.0.1:{port}/v1/ticker"
+
+    reset_circuit_breakers()
+    previous = set_retry_policy(RetryPolicy(max_retries=3, base_delay=0.01, jitter=0.0))
+    try:
+        for _ in range(2):
+            assert make_api_request(url, {"markets": "KRW-BTC"}) is None
+        assert get_circuit_breaker_states()[f"127.0.0.1:{port}/ticker"] == CircuitBreaker.OPEN
+
+        start = time.perf_counter()
+        assert make_api_request(url, {"markets": "KRW-BTC"}) is None
+        assert time.perf_counter() - start < 0.05
+    finally:
+        set_retry_policy(previous)
+        reset_circuit_breakers()
+    print("✅ 회로가 열린 뒤 요청 없이 바로 실패 확인")
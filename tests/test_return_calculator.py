@@ -12,6 +12,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.return_calculator import (
     calculate_investment_return,
     calculate_annual_return_rate,
+    compare_multiple_scenarios,
     find_investment_date_price,
     get_historical_data_api,
     get_single_price_api
@@ -228,6 +229,33 @@ def test_data_consistency():
         print(f"   일관성: {'✅ 통과' if all_same else '❌ 실패'}")
 
 
+def test_compare_scenarios_fetches_each_market_once(fake_upbit_server):
+    """시나리오 비교가 마켓별 일봉 1회 + 현재가 1회만 요청하는지 테스트"""
+    print("\n🧪 다중 시나리오 조회 횟수 테스트")
+
+    plans = [("KRW-BTC", 7), ("KRW-BTC", 30), ("KRW-BTC", 180), ("KRW-ETH", 1), ("KRW-ETH", 90),
+             ("KRW-XRP", 14), ("KRW-XRP", 60), ("KRW-ADA", 3), ("KRW-ADA", 120), ("KRW-ADA", 365)]
+    scenarios = [
+        {'name': f"{market} {days}일", 'market': market, 'days_ago': days, 'investment_amount': 1000000}
+        for market, days in plans
+    ]
+    scenarios.append({'name': "잘못된 시나리오", 'market': "KRW-BTC", 'days_ago': 0, 'investment_amount': 1000000})
+
+    results = compare_multiple_scenarios(scenarios)
+
+    assert len(results) == 10
+    assert fake_upbit_server.request_count("/v1/candles/days") == 5  # KRW-ADA는 370일이라 2페이지
+    assert fake_upbit_server.request_count("/v1/ticker") == 1
+
+    for result, (market, days) in zip(results, plans):
+        single = calculate_investment_return(market, days, 1000000)
+        assert result['market'] == market
+        assert result['investment_price'] == single['investment_price']
+        assert result['days_ago'] == single['days_ago']
+        assert abs(result['return_rate'] - single['return_rate']) < 1e-9
+    print(f"✅ 시나리오 {len(results)}개, 요청 {fake_upbit_server.request_count('/v1/candles/days') + 1}회")
+
+
 def run_all_tests():
     """모든 테스트 실행"""
     print("🧪 수익률 계산기 테스트 시작")
@@ -0,0 +1,117 @@
+"""
+마켓 × 투자 기간 수익률 행렬 테스트 파일
+단일 시나리오 계산과 같은 결과인지, 마켓마다 한 번만 조회하는지, 대량 조합이 빠른지 확인
+"""
+
+import sys
+import os
+import math
+import time
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.candle_series import CandleSeries
+from src.return_calculator import (
+    calculate_annual_return_rate,
+    calculate_investment_return,
+    find_investment_date_price
+)
+from src.return_matrix import build_return_matrix, calculate_return_matrix
+from tests.helpers.test_data_generator import TestDataGenerator
+
+
+def _series(market: str, days: int, skip: int = 0) -> CandleSeries:
+    """일봉 시계열 (skip번째 일봉을 빼서 거래 공백을 만듦)"""
+    candles = list(reversed(TestDataGenerator.generate_candle_data(market, days)))
+    if skip:
+        del candles[skip]
+    return CandleSeries.from_candles(candles, market)
+
+
+def test_matrix_matches_single_scenario_formula():
+    """행렬의 각 칸이 단일 시나리오 계산식과 같은지 테스트"""
+    print("\n🧪 수익률 행렬 계산 테스트")
+
+    histories = {"KRW-BTC": _series("KRW-BTC", 120, skip=10), "KRW-ETH": _series("KRW-ETH", 40)}
+    prices = {"KRW-BTC": 60000000.0, "KRW-ETH": 3000000.0}
+    horizons = [1, 7, 11, 30, 90]
+    matrix = build_return_matrix(histories, prices, horizons, 2000000)
+
+    assert matrix.shape == (2, 5)
+    for market, series in histories.items():
+        for horizon in horizons:
+            result = matrix.get(market, horizon)
+            found = find_investment_date_price(series, horizon)
+            if found is None:
+                assert result is None
+                continue
+
+            investment_price, _ = found
+            return_rate = (prices[market] / investment_price - 1) * 100
+            assert result['investment_price'] == investment_price
+            assert result['return_rate'] == pytest.approx(return_rate)
+            assert result['profit_loss'] == pytest.approx(2000000 * return_rate / 100)
+            assert result['annual_return_rate'] == pytest.approx(
+                calculate_annual_return_rate(return_rate, result['days_ago']))
+
+    # 11일 전 일봉이 빠져 있으면 직전 거래일(12일 전) 가격으로 계산
+    assert matrix.get("KRW-BTC", 11)['days_ago'] == 12
+    # 이력보다 긴 기간은 계산하지 않음
+    assert matrix.get("KRW-ETH", 90) is None
+    assert math.isnan(matrix.row('return_rates', "KRW-ETH")[-1])
+    assert len(matrix.to_rows()) == 9
+    print(f"✅ {matrix.shape} 행렬 계산 확인")
+
+
+def test_missing_current_price_leaves_nan_row():
+    """현재가가 없는 마켓은 NaN으로 남는지 테스트"""
+    matrix = build_return_matrix({"KRW-BTC": _series("KRW-BTC", 10)}, {}, [1, 5])
+    assert all(math.isnan(rate) for rate in matrix.return_rates)
+    assert matrix.get("KRW-BTC", 5) is None
+
+    with pytest.raises(ValueError):
+        build_return_matrix({}, {}, [0])
+
+
+def test_thousands_of_combinations_are_fast():
+    """수천 개 조합을 조회 후 빠르게 계산하는지 테스트"""
+    print("\n🧪 수익률 행렬 대량 계산 테스트")
+
+    base = _series("KRW-BTC", 400)
+    markets = [f"KRW-C{index:03d}" for index in range(100)]
+    histories = {market: base for market in markets}
+    prices = {market: 50000000.0 + index for index, market in enumerate(markets)}
+    horizons = list(range(1, 366, 7))
+
+    started = time.perf_counter()
+    matrix = build_return_matrix(histories, prices, horizons)
+    elapsed = time.perf_counter() - started
+
+    assert len(matrix.return_rates) == 100 * len(horizons)
+    assert elapsed < 0.5
+    print(f"✅ {len(matrix.return_rates)}개 조합 계산: {elapsed * 1000:.1f}ms")
+
+
+def test_calculate_return_matrix_fetches_each_market_once(fake_upbit_server):
+    """마켓마다 일봉을 한 번, 현재가는 한 번의 요청으로 받는지 테스트"""
+    markets = ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
+    matrix = calculate_return_matrix(markets, [30, 1, 7, 90, 7], 1000000)
+
+    assert matrix.horizons == (1, 7, 30, 90)
+    assert fake_upbit_server.request_count("/v1/candles/days") == 3
+    assert fake_upbit_server.request_count("/v1/ticker") == 1
+
+    single = calculate_investment_return("KRW-ETH", 30, 1000000)
+    cell = matrix.get("KRW-ETH", 30)
+    assert cell['investment_price'] == single['investment_price']
+    assert cell['days_ago'] == single['days_ago']
+    assert cell['return_rate'] == pytest.approx(single['return_rate'])
+
+    partial = calculate_return_matrix(["KRW-BTC", "KRW-NOPE"], [7])
+    assert partial.get("KRW-BTC", 7) is not None
+    assert partial.get("KRW-NOPE", 7) is None
+    assert calculate_return_matrix(["KRW-NOPE"], [7]) is None
+    assert calculate_return_matrix(["KRW-BTC"], [0]) is None
@@ -0,0 +1,153 @@
+"""
+API 전송 방식(transport) 테스트 파일
+호출마다 또는 전역으로 전송 방식을 바꿔도 같은 결과를 얻는지 확인
+"""
+
+import sys
+import os
+import asyncio
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import API_ENDPOINTS
+from utils import async_api_client
+from utils.api_client import make_api_request, get_current_prices, get_single_price, get_historical_data
+from utils.rate_limiter import RateLimiter, set_rate_limiter
+from utils.cassette import Cassette
+from utils.price_cache import clear_price_cache
+from utils.transport import (
+    Transport,
+    PlainTransport,
+    SessionTransport,
+    CassetteTransport,
+    create_transport,
+    get_transport,
+    set_transport
+)
+
+
+class CountingTransport(Transport):
+    """요청 경로를 기록하고 내부 전송 방식에 위임하는 테스트용 전송 방식"""
+
+    name = "counting"
+
+    def __init__(self, inner: Transport):
+        self.inner = inner
+        self.paths = []
+
+    def get(self, url, params=None, timeout=10):
+        self.paths.append(url.rsplit("/v1", 1)[-1])
+        return self.inner.get(url, params, timeout)
+
+
+class UnlimitedTransport(CountingTransport):
+    """속도 제한을 적용하지 않는 테스트용 전송 방식 (기록된 응답 재생과 같은 경우)"""
+
+    @property
+    def rate_limited(self):
+        return False
+
+
+class CountingRateLimiter(RateLimiter):
+    """슬롯을 요청한 횟수를 세는 테스트용 속도 제한기"""
+
+    def __init__(self):
+        super().__init__({"default": 10000}, burst=10000)
+        self.acquired = 0
+
+    def acquire(self, group):
+        self.acquired += 1
+        return super().acquire(group)
+
+    async def acquire_async(self, group):
+        self.acquired += 1
+        return await super().acquire_async(group)
+
+
+def test_per_call_transport(fake_upbit_server):
+    """호출부에서 지정한 전송 방식으로 모든 공개 함수가 요청하는지 테스트"""
+    print("\n🧪 호출별 전송 방식 테스트")
+
+    transport = CountingTransport(PlainTransport())
+
+    assert get_current_prices(["KRW-BTC", "KRW-ETH"], transport) == {"KRW-BTC": 50000000.0, "KRW-ETH": 2800000.0}
+    clear_price_cache()
+    assert get_single_price("KRW-BTC", transport) == 50000000.0
+    assert len(get_historical_data("KRW-BTC", 450, transport)) == 450
+    assert make_api_request(API_ENDPOINTS["market_all"], transport=transport)
+
+    assert transport.paths.count("/ticker") == 2
+    assert transport.paths.count("/candles/days") == 3
+    assert transport.paths.count("/market/all") == 1
+    assert fake_upbit_server.request_count() == len(transport.paths)
+    print(f"✅ 전송 방식을 거친 요청 {len(transport.paths)}개")
+
+
+def test_global_transport(fake_upbit_server):
+    """전역 전송 방식 교체가 기본 호출에 적용되는지 테스트"""
+    print("\n🧪 전역 전송 방식 교체 테스트")
+
+    transport = CountingTransport(SessionTransport())
+    previous = set_transport(transport)
+    try:
+        assert get_transport() is transport
+        assert get_single_price("KRW-ETH") == 2800000.0
+    finally:
+        set_transport(previous)
+
+    assert transport.paths == ["/ticker"]
+    assert get_transport() is not transport
+    print("✅ 전역 전송 방식 교체 확인")
+
+
+def test_rate_limit_follows_transport(fake_upbit_server):
+    """동기/비동기 클라이언트 모두 전송 방식이 제한 대상일 때만 속도 제한을 적용하는지 테스트"""
+    url = API_ENDPOINTS["market_all"]
+    limiter = CountingRateLimiter()
+    previous_limiter = set_rate_limiter(limiter)
+    try:
+        cases = ((UnlimitedTransport(PlainTransport()), 0), (CountingTransport(PlainTransport()), 2))
+        for transport, expected in cases:
+            limiter.acquired = 0
+            previous = set_transport(transport)
+            try:
+                assert make_api_request(url)
+                assert asyncio.run(async_api_client.make_api_request(url))
+            finally:
+                set_transport(previous)
+            assert transport.paths == ["/market/all"] * 2
+            assert limiter.acquired == expected
+    finally:
+        set_rate_limiter(previous_limiter)
+
+
+def test_cassette_transport_per_call(fake_upbit_server, tmp_path):
+    """호출별 cassette 전송 방식으로 기록한 응답을 네트워크 없이 재생하는지 테스트"""
+    print("\n🧪 cassette 전송 방식 테스트")
+
+    path = str(tmp_path / "cassette.jsonl.gz")
+    recorder = Cassette(path, "record")
+    recorded = get_current_prices(["KRW-BTC", "KRW-ETH"], CassetteTransport(recorder))
+    recorder.close()
+    requests_sent = fake_upbit_server.request_count()
+
+    clear_price_cache()
+    replay = CassetteTransport(Cassette(path, "replay"))
+    assert not replay.rate_limited
+    assert get_current_prices(["KRW-BTC", "KRW-ETH"], replay) == recorded
+    assert fake_upbit_server.request_count() == requests_sent
+    print("✅ cassette 전송 방식 기록/재생 확인")
+
+
+def test_create_transport():
+    """이름으로 전송 방식을 생성하는지 테스트"""
+    assert isinstance(create_transport("session"), SessionTransport)
+    assert isinstance(create_transport("plain"), PlainTransport)
+    with pytest.raises(ValueError):
+        create_transport("carrier-pigeon")
+    # get()을 구현하지 않은 전송 방식은 만들 수 없음
+    with pytest.raises(TypeError):
+        Transport()
@@ -0,0 +1,126 @@
+"""
+WebSocket 시세 스트리밍 클라이언트 테스트 파일
+로컬 가짜 WebSocket 서버가 재생하는 체결 시세로 구독, 재연결, heartbeat를 확인
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import websocket_client
+from utils.websocket_client import TickerStream, encode_frame, read_frame, OPCODE_TEXT
+from src.price_alert import price_alert_system
+from tests.helpers.fake_websocket_server import FakeWebSocketServer, make_tick
+
+
+def test_frame_round_trip():
+    """마스킹된 프레임과 긴 프레임이 그대로 복원되는지 테스트"""
+    print("\n🧪 WebSocket 프레임 인코딩 테스트")
+
+    for payload in (b"", b"hello", b"x" * 300, b"y" * 70000):
+        frame = encode_frame(OPCODE_TEXT, payload, mask=True)
+        position = 0
+
+        def recv_exact(size):
+            nonlocal position
+            data = frame[position:position + size]
+            position += size
+            return data
+
+        opcode, fin, decoded = read_frame(recv_exact)
+        assert (opcode, fin, decoded) == (OPCODE_TEXT, True, payload)
+        assert position == len(frame)
+    print("✅ 프레임 복원 성공")
+
+
+def test_stream_receives_scripted_ticks():
+    """구독 메시지를 보내고 재생된 시세를 순서대로 받는지 테스트"""
+    print("\n🧪 체결 시세 수신 테스트")
+
+    ticks = [make_tick("KRW-BTC", 50000000.0 + i * 1000) for i in range(5)]
+    with FakeWebSocketServer(ticks) as server:
+        with TickerStream(["KRW-BTC"], url=server.url) as stream:
+            received = [stream.read_tick(timeout=2) for _ in range(5)]
+
+    assert [tick['trade_price'] for tick in received] == [tick['trade_price'] for tick in ticks]
+    assert all(tick['market'] == "KRW-BTC" for tick in received)
+    assert server.subscriptions[0][1] == {"type": "ticker", "codes": ["KRW-BTC"], "isOnlyRealtime": True}
+    print(f"✅ {len(received)}개 시세 수신")
+
+
+def test_stream_reconnects_and_resubscribes():
+    """연결이 끊기면 다시 연결하고 같은 구독을 다시 요청하는지 테스트"""
+    print("\n🧪 재연결 및 재구독 테스트")
+
+    ticks = [make_tick("KRW-ETH", 2800000.0 + i) for i in range(6)]
+    with FakeWebSocketServer(ticks, drop_after=3) as server:
+        with TickerStream(["KRW-ETH"], url=server.url, reconnect_delay=0.05) as stream:
+            received = [stream.read_tick(timeout=2) for _ in range(6)]
+
+    assert [tick['trade_price'] for tick in received] == [tick['trade_price'] for tick in ticks]
+    assert stream.reconnects == 1
+    assert server.connections == 2
+    assert len(server.subscriptions) == 2
+    assert server.subscriptions[1][1]["codes"] == ["KRW-ETH"]
+    print(f"✅ 재연결 {stream.reconnects}회, 구독 {len(server.subscriptions)}회")
+
+
+def test_stream_heartbeat():
+    """메시지가 없으면 ping을 보내고, 응답이 없으면 다시 연결하는지 테스트"""
+    print("\n🧪 heartbeat 테스트")
+
+    with FakeWebSocketServer(respond_to_ping=True) as server:
+        with TickerStream(["KRW-BTC"], url=server.url, ping_interval=0.1) as stream:
+            assert stream.read_tick(timeout=0.6) is None
+        assert server.pings >= 2
+        assert stream.reconnects == 0
+
+    with FakeWebSocketServer(respond_to_ping=False) as server:
+        with TickerStream(["KRW-BTC"], url=server.url, ping_interval=0.1,
+                          reconnect_delay=0.05) as stream:
+            assert stream.read_tick(timeout=0.6) is None
+        assert server.pings >= 1
+        assert stream.reconnects >= 1
+    print("✅ ping 전송 및 무응답 재연결 확인")
+
+
+def test_price_alert_uses_stream(fake_upbit_server, monkeypatch):
+    """가격 알림이 폴링 없이 스트림 시세로 알림을 판단하는지 테스트"""
+    print("\n🧪 스트림 기반 가격 알림 테스트")
+
+    prices = [100.0, 104.0, 106.0, 107.0, 100.0, 94.0, 95.0, 100.0]
+    ticks = [make_tick("KRW-BTC", price) for price in prices]
+
+    with FakeWebSocketServer(ticks, tick_interval=0.01) as server:
+        monkeypatch.setattr(websocket_client, "UPBIT_WEBSOCKET_URL", server.url)
+        result = price_alert_system("KRW-BTC", target_high=105.0, target_low=95.0,
+                                    cycles=1, interval=1, use_stream=True)
+
+    assert result['success']
+    # 기록은 구간마다 하나 (구간의 마지막 가격과 구간 중 알림 여부)
+    assert len(result['monitoring_data']) == 1
+    record = result['monitoring_data'][0]
+    assert (record['price'], record['alert_triggered'], record['alert_type']) == (100.0, True, 'low')
+    # 상한 돌파 1회 + 하한 이탈 1회 (같은 상태가 이어지는 체결은 다시 세지 않음)
+    assert result['alerts_triggered'] == 2
+    assert result['final_price'] == 100.0
+    assert fake_upbit_server.request_count("/v1/ticker") == 0
+    print(f"✅ 알림 {result['alerts_triggered']}회, 시세 {len(prices)}개 확인")
+
+
+def test_price_alert_polling_counts_like_stream(fake_upbit_server):
+    """폴링 모드도 구간마다 한 번 기록하고 알림 상태 진입만 세는지 테스트"""
+    print("\n🧪 폴링 기반 가격 알림 테스트")
+
+    # 현재가(50,000,000원)가 계속 상한가 위에 있음
+    result = price_alert_system("KRW-BTC", target_high=40000000.0, target_low=30000000.0,
+                                cycles=2, interval=1, use_stream=False)
+
+    assert result['success']
+    assert [record['cycle'] for record in result['monitoring_data']] == [1, 2]
+    assert all(record['alert_type'] == 'high' for record in result['monitoring_data'])
+    assert result['alerts_triggered'] == 1
+    assert result['final_price'] == 50000000.0
+    print(f"✅ 알림 {result['alerts_triggered']}회, 기록 {len(result['monitoring_data'])}개 확인")
@@ -5,8 +5,131 @@
 from .api_client import (
     make_api_request,
     get_current_prices,
+    get_current_prices_with_rejected,
     get_single_price,
-    get_historical_data
+    get_historical_data,
+    get_historical_series,
+    get_minute_candles,
+    get_resampled_series,
+    clear_resamplers,
+    sync_candle_archive
+)
+
+from .http_session import (
+    get_session,
+    configure_session,
+    close_session
+)
+
+from .transport import (
+    Transport,
+    SessionTransport,
+    PlainTransport,
+    CassetteTransport,
+    create_transport,
+    get_transport,
+    set_transport
+)
+
+from .rate_limiter import (
+    RateLimiter,
+    get_rate_limiter,
+    set_rate_limiter,
+    get_endpoint_group
+)
+
+from .retry_policy import (
+    RetryPolicy,
+    CircuitBreaker,
+    get_retry_policy,
+    set_retry_policy,
+    get_circuit_breaker_states,
+    reset_circuit_breakers
+)
+
+from .price_cache import (
+    PriceCache,
+    get_price_cache,
+    get_price_cache_stats,
+    clear_price_cache
+)
+
+from .price_batcher import (
+    PriceBatcher,
+    get_price_batcher,
+    set_price_batcher
+)
+
+from .price_hub import (
+    PriceHub,
+    PriceUpdate,
+    Subscription,
+    get_price_hub,
+    set_price_hub,
+    close_price_hubs
+)
+
+from .candle_store import (
+    CandleStore,
+    get_candle_store,
+    set_candle_store
+)
+
+from .candle_series import (
+    Candle,
+    CandleSeries
+)
+
+from .candle_archive import (
+    CandleArchive,
+    ArchiveInfo,
+    get_candle_archive,
+    set_candle_archive
+)
+
+from .resampler import (
+    CandleResampler,
+    TIMEFRAME_SECONDS
+)
+
+from .metrics import (
+    ApiMetrics,
+    get_api_metrics,
+    set_api_metrics,
+    get_metrics_snapshot,
+    export_prometheus_metrics
+)
+
+from .cassette import (
+    Cassette,
+    CassetteMissError,
+    get_cassette,
+    set_cassette
+)
+
+from .json_decoder import (
+    TickerPrice,
+    CandleClose,
+    decode_ticker_prices,
+    decode_candle_closes,
+    get_json_backend
+)
+
+from .websocket_client import (
+    TickerStream,
+    WebSocketError
+)
+
+from .market_catalog import (
+    load_market_catalog,
+    clear_market_catalog,
+    get_market_info,
+    is_known_market,
+    find_unknown_markets,
+    get_korean_name,
+    get_english_name,
+    get_quote_currency,
+    get_markets_by_quote
 )
 
 from .date_utils import (
@@ -14,7 +137,11 @@ from .date_utils import (
     get_current_datetime,
     get_date_days_ago,
     format_date,
-    parse_upbit_datetime
+    parse_upbit_datetime,
+    parse_upbit_timestamp,
+    parse_upbit_timestamps,
+    parse_candle_timestamps,
+    ParsedTimestamps
 )
 
 from .format_utils import (
@@ -30,8 +157,115 @@ __all__ = [
     # API 관련
     'make_api_request',
     'get_current_prices',
+    'get_current_prices_with_rejected',
     'get_single_price',
     'get_historical_data',
+    'get_historical_series',
+    'get_minute_candles',
+    'get_resampled_series',
+    'clear_resamplers',
+    'sync_candle_archive',
+
+    # HTTP 세션 관련
+    'get_session',
+    'configure_session',
+    'close_session',
+
+    # 요청 전송 방식 관련
+    'Transport',
+    'SessionTransport',
+    'PlainTransport',
+    'CassetteTransport',
+    'create_transport',
+    'get_transport',
+    'set_transport',
+
+    # 요청 속도 제한 관련
+    'RateLimiter',
+    'get_rate_limiter',
+    'set_rate_limiter',
+    'get_endpoint_group',
+
+    # 재시도 정책 관련
+    'RetryPolicy',
+    'CircuitBreaker',
+    'get_retry_policy',
+    'set_retry_policy',
+    'get_circuit_breaker_states',
+    'reset_circuit_breakers',
+
+    # 현재가 캐시 관련
+    'PriceCache',
+    'get_price_cache',
+    'get_price_cache_stats',
+    'clear_price_cache',
+
+    # 현재가 묶음 처리 관련
+    'PriceBatcher',
+    'get_price_batcher',
+    'set_price_batcher',
+
+    # 가격 허브 관련
+    'PriceHub',
+    'PriceUpdate',
+    'Subscription',
+    'get_price_hub',
+    'set_price_hub',
+    'close_price_hubs',
+
+    # 캔들 저장소 관련
+    'CandleStore',
+    'get_candle_store',
+    'set_candle_store',
+
+    # 캔들 시계열 관련
+    'Candle',
+    'CandleSeries',
+
+    # 캔들 아카이브 관련
+    'CandleArchive',
+    'ArchiveInfo',
+    'get_candle_archive',
+    'set_candle_archive',
+
+    # 분봉 리샘플링 관련
+    'CandleResampler',
+    'TIMEFRAME_SECONDS',
+
+    # API 지표 관련
+    'ApiMetrics',
+    'get_api_metrics',
+    'set_api_metrics',
+    'get_metrics_snapshot',
+    'export_prometheus_metrics',
+
+    # API 기록/재생 관련
+    'Cassette',
+    'CassetteMissError',
+    'get_cassette',
+    'set_cassette',
+
+    # 응답 디코딩 관련
+    'TickerPrice',
+    'CandleClose',
+    'decode_ticker_prices',
+    'decode_candle_closes',
+    'get_json_backend',
+
+    # 실시간 시세 스트림 관련
+    'TickerStream',
+    'WebSocketError',
+
+    # 마켓 목록 관련
+    'load_market_catalog',
+    'clear_market_catalog',
+    'get_market_info',
+    'is_known_market',
+    'find_unknown_markets',
+    'get_korean_name',
+    'get_english_name',
+    'get_quote_currency',
+    'get_markets_by_quote',
 
     # 날짜 관련
     'get_current_time',
@@ -39,6 +273,10 @@ __all__ = [
     'get_date_days_ago',
     'format_date',
     'parse_upbit_datetime',
+    'parse_upbit_timestamp',
+    'parse_upbit_timestamps',
+    'parse_candle_timestamps',
+    'ParsedTimestamps',
 
     # 포맷팅 관련
     'format_currency',
@@ -5,43 +5,337 @@
 
 import requests
 import time
-from typing import List, Dict, Any, Optional
-from config.settings import API_ENDPOINTS, REQUEST_TIMEOUT, MAX_RETRIES
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple, cast
+from config.settings import (
+    API_ENDPOINTS,
+    REQUEST_TIMEOUT,
+    PRICE_CACHE_ENABLED,
+    PRICE_BATCH_ENABLED,
+    RATE_LIMIT_ENABLED,
+    CANDLES_MAX_PER_REQUEST,
+    HISTORY_MAX_CONCURRENCY,
+    CANDLE_STORE_ENABLED,
+    RESAMPLE_TIMEFRAMES
+)
+from utils.price_cache import get_price_cache
+from utils.rate_limiter import get_rate_limiter, get_endpoint_group
+from utils.retry_policy import get_retry_policy, get_circuit_breaker, get_error_status
+from utils.candle_store import get_candle_store
+from utils.candle_archive import get_candle_archive
+from utils.candle_series import CandleSeries, parse_candle_time
+from utils.resampler import TIMEFRAME_SECONDS, CandleResampler
+from utils.json_decoder import Decoder, TickerPrice, decode_ticker_prices, loads
+from utils.cassette import get_cassette
+from utils.metrics import get_api_metrics
+from utils.price_batcher import get_price_batcher
+from utils.transport import Transport, CassetteTransport, get_transport
 
 
-def make_api_request(url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict]:
+def _decode_response(response: requests.Response, decoder: Optional[Decoder]) -> Any:
     """
-    API 요청을 수행하는 기본 함수
+    응답 본문을 디코딩 (잘린 본문 등 잘못된 JSON은 재시도 가능한 요청 예외로 변환)
+
+    Raises:
+        requests.exceptions.InvalidJSONError: 본문을 JSON으로 읽을 수 없는 경우
+    """
+    try:
+        return (decoder or loads)(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(f"잘못된 JSON 응답: {e}")
+
+
+def _resolve_transport(transport: Optional[Transport] = None) -> Transport:
+    """
+    요청에 사용할 전송 방식을 결정
+    호출부가 넘긴 전송 방식이 우선이고, 없으면 전역 전송 방식을 사용
+    (전역 cassette가 켜져 있으면 기록/재생 전송 방식으로 감쌈)
+
+    Args:
+        transport (Transport, optional): 호출부가 지정한 전송 방식
+
+    Returns:
+        Transport: 사용할 전송 방식
+    """
+    if transport is not None:
+        return transport
+
+    cassette = get_cassette()
+    if cassette is not None:
+        return CassetteTransport(cassette)
+    return get_transport()
+
+
+def _perform_request(url: str, params: Optional[Dict[str, Any]] = None,
+                     decoder: Optional[Decoder] = None,
+                     transport: Optional[Transport] = None) -> Any:
+    """
+    속도 제한 대기 없이 API 요청을 한 번 수행하고 응답 헤더를 속도 제한기에 반영
+    cassette 기록 모드에서는 응답을 기록하고, 재생 모드에서는 기록된 응답을 사용
+    지표 수집이 켜져 있으면 응답 시간, 상태 코드, 수신 바이트를 기록
 
     Args:
         url (str): 요청할 API URL
         params (dict, optional): 요청 파라미터
+        decoder (Callable, optional): 응답 바이트를 읽는 함수 (기본값: JSON 전체 파싱)
+        transport (Transport, optional): 전송 방식 (기본값: 전역 전송 방식)
 
     Returns:
-        dict: API 응답 데이터 (JSON)
-        None: 요청 실패시
+        Any: API 응답 데이터 (decoder 결과)
+
+    Raises:
+        requests.exceptions.RequestException: 요청 실패시
+    """
+    transport = _resolve_transport(transport)
+    metrics = get_api_metrics()
+    started_at = time.perf_counter() if metrics is not None else 0.0
+
+    try:
+        response = transport.get(url, params, REQUEST_TIMEOUT)
+    except requests.exceptions.RequestException:
+        if metrics is not None:
+            metrics.observe_request(get_endpoint_group(url), None, time.perf_counter() - started_at, 0)
+        raise
+
+    # 기록된 응답을 재생하는 경우에는 속도 제한 상태를 갱신하지 않음
+    if RATE_LIMIT_ENABLED and transport.rate_limited:
+        get_rate_limiter().observe(
+            get_endpoint_group(url),
+            response.status_code,
+            response.headers.get('Remaining-Req')
+        )
+
+    if metrics is not None:
+        metrics.observe_request(get_endpoint_group(url), response.status_code,
+                                time.perf_counter() - started_at, len(response.content))
+    response.raise_for_status()  # HTTP 에러 체크
+    return _decode_response(response, decoder)
+
+
+def _send_request(url: str, params: Optional[Dict[str, Any]] = None,
+                  decoder: Optional[Decoder] = None,
+                  transport: Optional[Transport] = None) -> Any:
+    """
+    재시도 없이 API 요청을 한 번 수행 (요청 그룹의 속도 제한을 지킬 때까지 대기)
+
+    Args:
+        url (str): 요청할 API URL
+        params (dict, optional): 요청 파라미터
+        decoder (Callable, optional): 응답 바이트를 읽는 함수
+        transport (Transport, optional): 전송 방식
+
+    Returns:
+        Any: API 응답 데이터 (JSON)
+
+    Raises:
+        requests.exceptions.RequestException: 요청 실패시
+    """
+    transport = _resolve_transport(transport)
+    if RATE_LIMIT_ENABLED and transport.rate_limited:
+        get_rate_limiter().acquire(get_endpoint_group(url))
+    return _perform_request(url, params, decoder, transport)
+
+
+def is_rejected_status(status: Optional[int]) -> bool:
+    """
+    재시도해도 성공할 수 없는 요청 거부 상태인지 확인 (429 제외 4xx)
+
+    Args:
+        status (int, optional): HTTP 상태 코드
+
+    Returns:
+        bool: 요청 거부 여부
+    """
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+def _request_json(url: str, params: Optional[Dict[str, Any]] = None,
+                  decoder: Optional[Decoder] = None,
+                  transport: Optional[Transport] = None) -> Tuple[Optional[Any], Optional[int]]:
     """
-    for attempt in range(MAX_RETRIES):
+    재시도 정책과 회로 차단기를 적용하여 API 요청을 수행하고 실패시 마지막 상태 코드를 함께 반환
+    재시도할 수 없는 오류(429를 제외한 4xx 등)는 바로 포기하고,
+    엔드포인트의 회로가 열려 있으면 요청하지 않고 바로 실패
+
+    Args:
+        url (str): 요청할 API URL
+        params (dict, optional): 요청 파라미터
+        decoder (Callable, optional): 응답 바이트를 읽는 함수
+        transport (Transport, optional): 전송 방식
+
+    Returns:
+        Tuple[Any, int]: (응답 데이터, None) 또는 실패시 (None, 마지막 상태 코드)
+    """
+    policy = get_retry_policy()
+    group = get_endpoint_group(url)
+    breaker = get_circuit_breaker(url, group)
+    started_at = time.monotonic()
+    status = None
+
+    for attempt in range(policy.max_retries):
+        if not breaker.allow_request():
+            print(f"⚡ {group} API 장애로 요청을 잠시 차단합니다 (회로 차단기 열림)")
+            return None, status
+
         try:
-            response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()  # HTTP 에러 체크
-            return response.json()
+            response_data = _send_request(url, params, decoder, transport)
+            breaker.record_success()
+            return response_data, None
         except requests.exceptions.RequestException as e:
-            print(f"API 요청 실패 (시도 {attempt + 1}/{MAX_RETRIES}): {e}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(1)  # 1초 대기 후 재시도
+            status = get_error_status(e)
+            print(f"API 요청 실패 (시도 {attempt + 1}/{policy.max_retries}): {e}")
+            if policy.is_upstream_failure(e):
+                breaker.record_failure()
+            elif status == 429:
+                breaker.release()
             else:
-                print("API 요청을 포기합니다.")
-                return None
+                breaker.record_success()  # 4xx 응답은 서버가 정상 동작 중이라는 뜻
+
+            delay = policy.get_retry_delay(attempt, e, started_at)
+            if delay is None:
+                break
+            metrics = get_api_metrics()
+            if metrics is not None:
+                metrics.observe_retry(group)
+            time.sleep(delay)
+
+    print("API 요청을 포기합니다.")
+    return None, status
+
+
+def make_api_request(url: str, params: Optional[Dict[str, Any]] = None,
+                     decoder: Optional[Decoder] = None,
+                     transport: Optional[Transport] = None) -> Optional[Dict]:
+    """
+    API 요청을 수행하는 기본 함수
+    기본 전송 방식은 프로세스 전역 공유 세션으로 keep-alive 연결을 재사용
+
+    Args:
+        url (str): 요청할 API URL
+        params (dict, optional): 요청 파라미터
+        decoder (Callable, optional): 응답 바이트를 읽는 함수
+                                      (예: decode_ticker_prices, 기본값: JSON 전체 파싱)
+        transport (Transport, optional): 이 요청에 사용할 전송 방식 (기본값: 전역 전송 방식)
+
+    Returns:
+        dict: API 응답 데이터 (JSON 또는 decoder 결과)
+        None: 요청 실패시
+    """
+    response_data, _ = _request_json(url, params, decoder, transport)
+    return response_data
+
+
+def parse_ticker_prices(response_data: Optional[List[Any]]) -> Dict[str, float]:
+    """
+    티커 응답에서 마켓별 현재가를 추출
+
+    Args:
+        response_data (List): 티커 API 응답 (딕셔너리 또는 TickerPrice 레코드 리스트)
+
+    Returns:
+        Dict[str, float]: 마켓별 현재가 딕셔너리
+    """
+    prices = {}
+    for data in response_data or []:
+        if isinstance(data, TickerPrice):
+            market, price = data
+        else:
+            market = data.get('market')
+            price = data.get('trade_price')
+        if market and price:
+            prices[market] = float(price)
+    return prices
+
+
+def _observe_fallback(group: str, reason: str) -> None:
+    """지표 수집이 켜져 있으면 대체 경로 사용을 기록"""
+    metrics = get_api_metrics()
+    if metrics is not None:
+        metrics.observe_fallback(group, reason)
+
+
+def _bisect_ticker_prices(markets: List[str], prices: Dict[str, float], rejected: List[str],
+                          transport: Optional[Transport] = None) -> None:
+    """
+    마켓 목록을 한 번에 조회하고, 거부되면 절반씩 나누어 잘못된 마켓을 찾음
+    잘못된 마켓 k개를 n개 중에서 O(k log n)회 요청으로 분리
 
+    Args:
+        markets (List[str]): 조회할 마켓 코드 리스트
+        prices (Dict[str, float]): 조회된 현재가를 채울 딕셔너리
+        rejected (List[str]): 서버가 거부한 마켓을 채울 리스트
+        transport (Transport, optional): 전송 방식
+    """
+    url = API_ENDPOINTS["ticker"]
+    response_data, status = _request_json(url, {"markets": ','.join(markets)}, decode_ticker_prices, transport)
+
+    if response_data is not None:
+        batch_prices = parse_ticker_prices(response_data)
+        prices.update(batch_prices)
+
+        # 응답에서 일부 마켓만 누락된 경우, 진전이 있을 때만 누락분을 다시 조회
+        missing_markets = [market for market in markets if market not in batch_prices]
+        if missing_markets and batch_prices:
+            _observe_fallback('ticker', 'missing_markets')
+            _bisect_ticker_prices(missing_markets, prices, rejected, transport)
+        return
+
+    if not is_rejected_status(status):
+        # 네트워크 장애 등은 마켓 문제가 아니므로 더 나누지 않음
+        return
+
+    if len(markets) == 1:
+        rejected.append(markets[0])
+        return
+
+    _observe_fallback('ticker', 'bisect')
+    middle = len(markets) // 2
+    _bisect_ticker_prices(markets[:middle], prices, rejected, transport)
+    _bisect_ticker_prices(markets[middle:], prices, rejected, transport)
+
+
+def get_current_prices_with_rejected(markets: List[str], transport: Optional[Transport] = None
+                                     ) -> Tuple[Dict[str, float], List[str]]:
+    """
+    여러 암호화폐의 현재가를 조회하고 서버가 거부한 마켓 코드를 함께 반환
+    현재가 캐시를 거치며, 캐시에 없는 마켓만 한 번에 조회
+    일괄 조회가 거부되면 분할 조회로 잘못된 마켓만 골라냄
+
+    Args:
+        markets (List[str]): 조회할 마켓 코드 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+        transport (Transport, optional): 전송 방식 (기본값: 전역 전송 방식)
+
+    Returns:
+        Tuple[Dict[str, float], List[str]]: (마켓별 현재가, 거부된 마켓 리스트)
+    """
+    rejected: List[str] = []
+
+    def load_prices(missing_markets: List[str]) -> Dict[str, float]:
+        prices: Dict[str, float] = {}
+        _bisect_ticker_prices(missing_markets, prices, rejected, transport)
+        return prices
+
+    if not markets:
+        return {}, rejected
 
-def get_current_prices(markets: List[str]) -> Dict[str, float]:
+    unique_markets = list(dict.fromkeys(markets))
+    if PRICE_CACHE_ENABLED:
+        prices = get_price_cache().get_many(unique_markets, load_prices)
+    else:
+        prices = load_prices(unique_markets)
+
+    return prices, rejected
+
+
+def get_current_prices(markets: List[str], transport: Optional[Transport] = None) -> Dict[str, float]:
     """
     여러 암호화폐의 현재가를 조회하는 함수
     일부 마켓이 실패해도 성공한 마켓들의 가격은 반환
 
     Args:
         markets (List[str]): 조회할 마켓 코드 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+        transport (Transport, optional): 전송 방식 (기본값: 전역 전송 방식)
 
     Returns:
         Dict[str, float]: 마켓별 현재가 딕셔너리
@@ -51,95 +345,359 @@ def get_current_prices(markets: List[str]) -> Dict[str, float]:
 
     # 단일 마켓인 경우 개별 조회 사용
     if len(markets) == 1:
-        price = get_single_price(markets[0])
+        price = get_single_price(markets[0], transport)
         return {markets[0]: price} if price is not None else {}
 
-    # 먼저 일괄 조회 시도
-    markets_str = ','.join(markets)
-    url = API_ENDPOINTS["ticker"]
-    params = {"markets": markets_str}
+    prices, rejected = get_current_prices_with_rejected(markets, transport)
 
-    response_data = make_api_request(url, params)
-
-    prices = {}
-    if response_data:
-        # 성공한 마켓들 처리
-        for data in response_data:
-            market = data.get('market')
-            price = data.get('trade_price')
-            if market and price:
-                prices[market] = float(price)
-    
-    # 일괄 조회가 실패했거나 일부 마켓이 누락된 경우 개별 조회 시도
-    missing_markets = [market for market in markets if market not in prices]
-    if missing_markets:
-        if not response_data:
-            # 일괄 조회가 완전히 실패한 경우 (존재하지 않는 마켓 포함)
-            print(f"⚠️  일괄 조회 실패, 모든 마켓을 개별 조회합니다")
-            for market in markets:
-                individual_price = get_single_price(market)
-                if individual_price is not None:
-                    prices[market] = individual_price
-                    print(f"   ✅ {market}: {individual_price:,}원")
-                else:
-                    print(f"   ❌ {market}: 마켓이 존재하지 않습니다")
-        else:
-            # 일부 마켓만 누락된 경우
-            print(f"⚠️  일부 마켓 조회 실패, 개별 조회 시도: {', '.join(missing_markets)}")
-            for market in missing_markets:
-                individual_price = get_single_price(market)
-                if individual_price is not None:
-                    prices[market] = individual_price
-                    print(f"   ✅ {market}: {individual_price:,}원")
-                else:
-                    print(f"   ❌ {market}: 마켓이 존재하지 않습니다")
+    if rejected:
+        print(f"⚠️  존재하지 않는 마켓을 제외했습니다: {', '.join(rejected)}")
+        for market in rejected:
+            print(f"   ❌ {market}: 마켓이 존재하지 않습니다")
 
     return prices
 
 
-def get_single_price(market: str) -> Optional[float]:
+def get_single_price(market: str, transport: Optional[Transport] = None) -> Optional[float]:
     """
     단일 암호화폐의 현재가를 조회하는 함수
+    같은 마켓을 짧은 시간 안에 다시 조회하면 현재가 캐시의 값을 재사용
+    PRICE_BATCH_ENABLED면 동시에 들어온 다른 마켓 요청과 묶어 한 번에 조회
+    (전송 방식을 지정한 호출은 묶음 처리기를 거치지 않고 바로 조회)
 
     Args:
         market (str): 조회할 마켓 코드 (예: 'KRW-BTC')
+        transport (Transport, optional): 전송 방식 (기본값: 전역 전송 방식)
 
     Returns:
         float: 현재가
         None: 조회 실패시
     """
-    url = API_ENDPOINTS["ticker"]
-    params = {"markets": market}
+    if PRICE_BATCH_ENABLED and transport is None:
+        return get_price_batcher().get(market)
+
+    prices, _ = get_current_prices_with_rejected([market], transport)
+    return prices.get(market)
+
+
+# 저장소 캔들 단위별 (API 엔드포인트 이름, 캔들 길이(초))
+CANDLE_UNITS = {
+    "days": ("candles_days", 24 * 60 * 60),
+    "minutes/1": ("candles_minutes", 60),
+}
+MINUTE_UNIT = "minutes/1"
+
+
+def plan_candle_pages(count: int, now: Optional[datetime] = None, unit: str = "days") -> List[Dict[str, Any]]:
+    """
+    캔들 조회를 요청당 최대 개수 단위의 페이지로 나누고 페이지별 to 커서를 계산
+    캔들은 UTC 기준 단위 경계(일봉 00:00, 분봉 매 분)에 시작하므로 커서를 경계로 맞추면
+    페이지를 동시에 요청할 수 있음
+
+    Args:
+        count (int): 조회할 캔들 수 (일봉이면 일수, 1분봉이면 분 수)
+        now (datetime, optional): 기준 시각 (UTC, 기본값: 현재)
+        unit (str): 캔들 단위 ('days' 또는 'minutes/1')
+
+    Returns:
+        List[Dict[str, Any]]: 페이지별 요청 파라미터 [{'count': 200, 'to': None}, {'count': 200, 'to': '...Z'}, ...]
+    """
+    now = now or datetime.now(timezone.utc)
+    step = timedelta(seconds=CANDLE_UNITS[unit][1])
+    # 현재 진행 중인 캔들의 시작 시각 (하루를 나누어 떨어지는 단위만 사용)
+    elapsed = timedelta(hours=now.hour, minutes=now.minute, seconds=now.second, microseconds=now.microsecond)
+    current = now - elapsed % step
+
+    pages: List[Dict[str, Any]] = []
+    for offset in range(0, count, CANDLES_MAX_PER_REQUEST):
+        page: Dict[str, Any] = {'count': min(CANDLES_MAX_PER_REQUEST, count - offset), 'to': None}
+        if offset > 0:
+            # to는 배타적이므로 offset 단위 전 캔들까지 포함되도록 한 단위 뒤를 커서로 사용
+            cursor = current - step * (offset - 1)
+            page['to'] = cursor.strftime("%Y-%m-%dT%H:%M:%SZ")
+        pages.append(page)
+    return pages
+
+
+def merge_candle_pages(pages: List[List[Dict]], count: int) -> List[Dict]:
+    """
+    페이지별 일봉 데이터를 하나의 최신순 시계열로 합치고 중복을 제거
+
+    Args:
+        pages (List[List[Dict]]): 페이지별 일봉 데이터
+        count (int): 최대 반환 개수
+
+    Returns:
+        List[Dict]: 일봉 데이터 리스트 (최신순)
+    """
+    candles_by_time = {}
+    for page in pages:
+        for candle in page:
+            candles_by_time[candle.get('candle_date_time_utc', '')] = candle
+
+    merged = sorted(candles_by_time.values(), key=lambda c: c.get('candle_date_time_utc', ''), reverse=True)
+    return merged[:count]
+
+
+def _fetch_candle_page(market: str, page: Dict[str, Any],
+                       transport: Optional[Transport] = None, unit: str = "days") -> Optional[List[Dict]]:
+    """캔들 한 페이지를 조회 (실패시 None, 데이터가 없는 기간은 빈 리스트)"""
+    params = {"market": market, "count": page['count']}
+    if page['to']:
+        params["to"] = page['to']
+    candles = make_api_request(API_ENDPOINTS[CANDLE_UNITS[unit][0]], params, transport=transport)
+    # 캔들 API는 캔들 객체 배열을 반환
+    return cast(Optional[List[Dict]], candles)
+
 
-    response_data = make_api_request(url, params)
+def _fetch_historical_data(market: str, count: int,
+                           transport: Optional[Transport] = None, unit: str = "days") -> Optional[List[Dict]]:
+    """
+    API에서 과거 캔들 데이터를 조회 (저장소를 거치지 않음)
+    요청당 최대 개수(200개)를 넘으면 to 커서로 나눈 페이지를 동시에 조회하여 합침
+
+    Args:
+        market (str): 마켓 코드 (예: 'KRW-BTC')
+        count (int): 조회할 캔들 수
+        transport (Transport, optional): 전송 방식
+        unit (str): 캔들 단위 ('days' 또는 'minutes/1')
+
+    Returns:
+        List[Dict]: 캔들 데이터 리스트 (최신순, 데이터가 없으면 빈 리스트)
+        None: 조회 실패시
+    """
+    pages = plan_candle_pages(count, unit=unit)
+
+    if len(pages) == 1:
+        return _fetch_candle_page(market, pages[0], transport, unit)
 
-    if not response_data or len(response_data) == 0:
+    with ThreadPoolExecutor(max_workers=min(len(pages), HISTORY_MAX_CONCURRENCY)) as executor:
+        results = list(executor.map(lambda page: _fetch_candle_page(market, page, transport, unit), pages))
+
+    fetched = [result for result in results if result is not None]
+    if len(fetched) < len(results):
+        print(f"❌ {market} 과거 데이터 일부 페이지 조회에 실패했습니다.")
         return None
 
-    return float(response_data[0].get('trade_price', 0))
+    return merge_candle_pages(fetched, count)
+
+
+def _covers_recent_window(stored: List[Dict], window_start: int, history_start: Optional[str],
+                          step: int, unit: str) -> bool:
+    """
+    저장된 캔들(최신순)이 구간 시작부터 마지막 저장 캔들까지 빠짐없이 있는지 확인
+
+    Args:
+        stored (List[Dict]): 저장소에서 읽은 캔들 (최신순)
+        window_start (int): 필요한 첫 캔들 위치 (UTC epoch 초 // step)
+        history_start (str, optional): 상장 시점 캔들의 UTC 시각 (그 이전은 필요 없음)
+        step (int): 캔들 단위 (초)
+        unit (str): 캔들 단위
+
+    Returns:
+        bool: 마지막 저장 캔들 이후만 받으면 되는지 여부
+    """
+    if history_start is not None:
+        window_start = max(window_start, parse_candle_time(history_start) // step)
+    positions = [parse_candle_time(candle['candle_date_time_utc']) // step for candle in stored]
+    latest = positions[0]
+    if latest < window_start:
+        # 저장된 캔들이 모두 구간보다 과거이면 구간 전체를 새로 받게 됨
+        return True
+    if unit != "days":
+        # 분봉은 거래가 없던 분이 비어 있으므로 가장 오래된 캔들이 구간 시작 이전인지만 확인
+        return positions[-1] <= window_start
+    return sum(1 for position in positions if position >= window_start) == latest - window_start + 1
+
+
+def _sync_candle_store(market: str, count: int, transport: Optional[Transport] = None,
+                       unit: str = "days") -> bool:
+    """
+    저장소에 최근 count개 단위의 캔들이 있도록 필요한 부분만 API에서 받아 저장
 
+    Args:
+        market (str): 마켓 코드
+        count (int): 필요한 캔들 수 (일봉이면 일수, 1분봉이면 분 수)
+        transport (Transport, optional): 전송 방식
+        unit (str): 캔들 단위 ('days' 또는 'minutes/1')
 
-def get_historical_data(market: str, count: int) -> Optional[List[Dict]]:
+    Returns:
+        bool: 동기화 성공 여부 (실패해도 저장된 데이터는 그대로 사용 가능)
+    """
+    store = get_candle_store()
+    stored = store.load(market, unit, count)
+    history_start = store.get_history_start(market, unit)
+    step = CANDLE_UNITS[unit][1]
+    now = int(datetime.now(timezone.utc).timestamp()) // step
+
+    if stored and _covers_recent_window(stored, now - count + 1, history_start, step, unit):
+        # 마지막 저장 캔들(당시 진행 중이었을 수 있음)부터 현재까지 빠짐없이 조회
+        # (count로 자르면 마지막 저장 캔들과 새 캔들 사이에 구멍이 남음)
+        latest = parse_candle_time(stored[0]['candle_date_time_utc']) // step
+        fetch_count = max(1, now - latest + 1)
+    else:
+        fetch_count = count
+
+    candles = _fetch_historical_data(market, fetch_count, transport, unit)
+    if candles is None:
+        return False
+
+    # 요청보다 적게 받았다면 상장 시점까지 모두 받은 것 (분봉은 빈 분이 있어 판단하지 않음)
+    start = None
+    if unit == "days" and candles and len(candles) < fetch_count:
+        start = candles[-1]['candle_date_time_utc']
+    store.save(market, unit, candles, history_start=start)
+    return True
+
+
+def _get_candles(market: str, count: int, transport: Optional[Transport], unit: str) -> Optional[List[Dict]]:
+    """저장소를 거쳐 캔들을 조회 (get_historical_data / get_minute_candles 공통)"""
+    if not CANDLE_STORE_ENABLED:
+        candles = _fetch_historical_data(market, count, transport, unit)
+        return candles if candles else None
+
+    if not _sync_candle_store(market, count, transport, unit):
+        print(f"⚠️  {market} 최신 캔들을 받지 못해 저장된 데이터를 사용합니다.")
+        _observe_fallback('candles', 'stored_candles')
+
+    candles = get_candle_store().load(market, unit, count)
+    return candles if candles else None
+
+
+def get_historical_data(market: str, count: int, transport: Optional[Transport] = None) -> Optional[List[Dict]]:
     """
     암호화폐의 과거 일봉 데이터를 조회하는 함수
+    로컬 캔들 저장소를 먼저 확인하고, 마지막 저장 캔들 이후의 데이터만 API에서 받아옴
+    API 조회에 실패하면 저장된 데이터를 반환
 
     Args:
         market (str): 마켓 코드 (예: 'KRW-BTC')
         count (int): 조회할 일수
+        transport (Transport, optional): 전송 방식 (기본값: 전역 전송 방식)
 
     Returns:
         List[Dict]: 일봉 데이터 리스트 (최신순)
         None: 조회 실패시
     """
-    url = API_ENDPOINTS["candles_days"]
-    params = {
-        "market": market,
-        "count": count
-    }
+    return _get_candles(market, count, transport, "days")
+
+
+def get_historical_series(market: str, count: int,
+                          transport: Optional[Transport] = None) -> Optional[CandleSeries]:
+    """
+    암호화폐의 과거 일봉을 열 단위 시계열로 조회하는 함수
+    get_historical_data와 같은 경로(저장소, 대체 경로)로 조회한 뒤 배열로 변환
+
+    Args:
+        market (str): 마켓 코드 (예: 'KRW-BTC')
+        count (int): 조회할 일수
+        transport (Transport, optional): 전송 방식 (기본값: 전역 전송 방식)
+
+    Returns:
+        CandleSeries: 과거순 일봉 시계열
+        None: 조회 실패시
+    """
+    candles = get_historical_data(market, count, transport)
+    return CandleSeries.from_candles(candles, market) if candles else None
+
+
+def get_minute_candles(market: str, count: int, transport: Optional[Transport] = None) -> Optional[List[Dict]]:
+    """
+    암호화폐의 최근 1분봉 데이터를 조회하는 함수
+    일봉과 같이 로컬 캔들 저장소를 거치며, 마지막 저장 분 이후의 분봉만 API에서 받아옴
+
+    Args:
+        market (str): 마켓 코드 (예: 'KRW-BTC')
+        count (int): 조회할 분 수 (거래가 없던 분은 빠져 있을 수 있음)
+        transport (Transport, optional): 전송 방식 (기본값: 전역 전송 방식)
+
+    Returns:
+        List[Dict]: 1분봉 데이터 리스트 (최신순)
+        None: 조회 실패시
+    """
+    return _get_candles(market, count, transport, MINUTE_UNIT)
+
+
+_resamplers: Dict[str, CandleResampler] = {}
+
+
+def clear_resamplers() -> None:
+    """마켓별 리샘플러를 모두 비움 (다음 조회 때 1분봉으로 다시 만듦)"""
+    _resamplers.clear()
+
+
+def get_resampled_series(market: str, timeframe: str, count: int,
+                         transport: Optional[Transport] = None) -> Optional[CandleSeries]:
+    """
+    1분봉으로 만든 시간 단위 캔들 시계열을 조회하는 함수
+    마켓별 리샘플러를 유지하여, 다시 호출하면 새로 받은 1분봉만 반영
+    (한 번 받은 1분봉으로 5m/15m/1h/4h/1d/1w 캔들을 모두 만듦)
+
+    Args:
+        market (str): 마켓 코드 (예: 'KRW-BTC')
+        timeframe (str): 시간 단위 (RESAMPLE_TIMEFRAMES 중 하나, 예: '1h')
+        count (int): 조회할 캔들 수
+        transport (Transport, optional): 전송 방식 (기본값: 전역 전송 방식)
+
+    Returns:
+        CandleSeries: 과거순 캔들 시계열 (마지막 캔들은 진행 중일 수 있음)
+        None: 조회 실패시
+    """
+    if timeframe not in RESAMPLE_TIMEFRAMES:
+        print(f"❌ 지원하지 않는 시간 단위입니다: {timeframe}")
+        return None
+
+    minutes_needed = count * TIMEFRAME_SECONDS[timeframe] // 60
+    candles = get_minute_candles(market, minutes_needed, transport)
+    if not candles:
+        return None
+
+    minutes = CandleSeries.from_candles(candles, market, MINUTE_UNIT)
+    resampler = _resamplers.get(market)
+    if (resampler is None or resampler.first_timestamp is None or resampler.last_timestamp is None
+            or resampler.first_timestamp > minutes[0].timestamp
+            or minutes[0].timestamp > resampler.last_timestamp + 60):
+        # 처음 조회하거나, 더 과거 분봉이 필요하거나, 마지막 반영 분과 이어지지 않으면 새로 만듦
+        resampler = CandleResampler(market)
+        _resamplers[market] = resampler
+    resampler.add(minutes.between(resampler.last_timestamp))
+
+    series = resampler.series(timeframe)
+    return series[max(0, len(series) - count):]
+
+
+def sync_candle_archive(market: str, count: int, unit: str = "days",
+                        transport: Optional[Transport] = None) -> Optional[int]:
+    """
+    캔들 아카이브에 최근 count개 단위의 캔들이 있도록 필요한 부분만 API에서 받아 추가
+    수년치 분봉처럼 큰 이력을 SQLite 저장소를 거치지 않고 바이너리 아카이브에 바로 보관
+
+    Args:
+        market (str): 마켓 코드 (예: 'KRW-BTC')
+        count (int): 보관할 캔들 수 (일봉이면 일수, 1분봉이면 분 수)
+        unit (str): 캔들 단위 ('days' 또는 'minutes/1')
+        transport (Transport, optional): 전송 방식 (기본값: 전역 전송 방식)
+
+    Returns:
+        int: 추가되거나 교체된 캔들 수
+        None: 조회 실패시
+    """
+    archive = get_candle_archive()
+    info = archive.info(market, unit)
+    step = CANDLE_UNITS[unit][1]
+    now = int(datetime.now(timezone.utc).timestamp()) // step
 
-    response_data = make_api_request(url, params)
+    fetch_count = count
+    if info is not None and info.first_timestamp is not None and info.last_timestamp is not None:
+        # 필요한 기간의 시작까지 이미 있거나 상장 시점부터 있으면 마지막 캔들 이후만 조회
+        # (count로 자르면 마지막 캔들 뒤에 바로 이어 붙여 그 사이 구간이 영영 빠짐)
+        if info.history_start or info.first_timestamp // step <= now - count + 1:
+            fetch_count = max(1, now - info.last_timestamp // step + 1)
 
-    if not response_data:
+    candles = _fetch_historical_data(market, fetch_count, transport, unit)
+    if candles is None:
         return None
 
-    return response_data
\ No newline at end of file
+    # 일봉을 요청보다 적게 받았다면 상장 시점까지 모두 받은 것 (분봉은 빈 분이 있어 판단하지 않음)
+    history_start = unit == "days" and len(candles) < fetch_count
+    return archive.append(CandleSeries.from_candles(candles, market, unit), history_start=history_start)
@@ -0,0 +1,334 @@
+"""
+업비트 API 비동기 클라이언트
+api_client의 asyncio 버전으로, 하나의 이벤트 루프에서 많은 요청을 동시에 처리
+동기 클라이언트와 같은 현재가 캐시와 캔들 저장소를 거침
+
+HTTP 요청(requests)과 캔들 저장소(SQLite)는 블로킹 코드이므로 작업 스레드 풀에서 실행됨
+따라서 실제로 동시에 진행되는 요청 수는 ASYNC_MAX_CONCURRENCY개 스레드로 제한됨
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+import requests
+
+from config.settings import (
+    API_ENDPOINTS,
+    ASYNC_MAX_CONCURRENCY,
+    RATE_LIMIT_ENABLED,
+    PRICE_BATCH_ENABLED,
+    PRICE_CACHE_ENABLED,
+    CANDLE_STORE_ENABLED
+)
+from utils.rate_limiter import get_rate_limiter, get_endpoint_group
+from utils.retry_policy import get_retry_policy, get_circuit_breaker, get_error_status
+from utils.json_decoder import Decoder, decode_ticker_prices
+from utils.metrics import get_api_metrics
+from utils.price_batcher import get_price_batcher
+from utils.price_cache import get_price_cache
+from utils.api_client import (
+    _get_candles,
+    _perform_request,
+    _resolve_transport,
+    _observe_fallback,
+    is_rejected_status,
+    parse_ticker_prices,
+    plan_candle_pages,
+    merge_candle_pages
+)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """공유 세션으로 요청을 보낼 작업 스레드 풀을 반환"""
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=ASYNC_MAX_CONCURRENCY,
+                thread_name_prefix="upbit-async"
+            )
+        return _executor
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """현재 이벤트 루프의 동시 요청 제한 세마포어를 반환"""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(ASYNC_MAX_CONCURRENCY)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+def close_async_client() -> None:
+    """작업 스레드 풀을 정리 (다음 요청시 다시 생성됨)"""
+    global _executor
+
+    with _executor_lock:
+        executor = _executor
+        _executor = None
+
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def _request_json(url: str, params: Optional[Dict[str, Any]] = None,
+                        decoder: Optional[Decoder] = None) -> Tuple[Optional[Any], Optional[int]]:
+    """
+    재시도 정책과 회로 차단기를 적용하여 비동기 API 요청을 수행하고 실패시 마지막 상태 코드를 함께 반환
+    동시 요청 수는 ASYNC_MAX_CONCURRENCY로 제한되며 재시도 대기 중에는 슬롯을 반납
+    속도 제한 대기는 작업 스레드가 아닌 이벤트 루프에서 수행
+
+    Args:
+        url (str): 요청할 API URL
+        params (dict, optional): 요청 파라미터
+        decoder (Callable, optional): 응답 바이트를 읽는 함수
+
+    Returns:
+        Tuple[Any, int]: (응답 데이터, None) 또는 실패시 (None, 마지막 상태 코드)
+    """
+    loop = asyncio.get_running_loop()
+    policy = get_retry_policy()
+    group = get_endpoint_group(url)
+    breaker = get_circuit_breaker(url, group)
+    # 동기 클라이언트와 같이 전송 방식으로 속도 제한 여부를 정함 (기록된 응답 재생은 제한하지 않음)
+    transport = _resolve_transport()
+    started_at = time.monotonic()
+    status = None
+
+    for attempt in range(policy.max_retries):
+        if not breaker.allow_request():
+            print(f"⚡ {group} API 장애로 요청을 잠시 차단합니다 (회로 차단기 열림)")
+            return None, status
+
+        try:
+            async with _get_semaphore():
+                if RATE_LIMIT_ENABLED and transport.rate_limited:
+                    await get_rate_limiter().acquire_async(group)
+                response_data = await loop.run_in_executor(
+                    _get_executor(), _perform_request, url, params, decoder, transport
+                )
+            breaker.record_success()
+            return response_data, None
+        except requests.exceptions.RequestException as e:
+            status = get_error_status(e)
+            print(f"API 요청 실패 (시도 {attempt + 1}/{policy.max_retries}): {e}")
+            if policy.is_upstream_failure(e):
+                breaker.record_failure()
+            elif status == 429:
+                breaker.release()
+            else:
+                breaker.record_success()
+
+            delay = policy.get_retry_delay(attempt, e, started_at)
+            if delay is None:
+                break
+            metrics = get_api_metrics()
+            if metrics is not None:
+                metrics.observe_retry(group)
+            await asyncio.sleep(delay)
+
+    print("API 요청을 포기합니다.")
+    return None, status
+
+
+async def make_api_request(url: str, params: Optional[Dict[str, Any]] = None,
+                           decoder: Optional[Decoder] = None) -> Optional[Any]:
+    """
+    API 요청을 비동기로 수행하는 기본 함수
+
+    Args:
+        url (str): 요청할 API URL
+        params (dict, optional): 요청 파라미터
+        decoder (Callable, optional): 응답 바이트를 읽는 함수
+
+    Returns:
+        Any: API 응답 데이터 (JSON 또는 decoder 결과)
+        None: 요청 실패시
+    """
+    response_data, _ = await _request_json(url, params, decoder)
+    return response_data
+
+
+async def _bisect_ticker_prices(markets: List[str], prices: Dict[str, float], rejected: List[str]) -> None:
+    """
+    마켓 목록을 한 번에 조회하고, 거부되면 두 절반을 동시에 다시 조회
+
+    Args:
+        markets (List[str]): 조회할 마켓 코드 리스트
+        prices (Dict[str, float]): 조회된 현재가를 채울 딕셔너리
+        rejected (List[str]): 서버가 거부한 마켓을 채울 리스트
+    """
+    url = API_ENDPOINTS["ticker"]
+    response_data, status = await _request_json(url, {"markets": ','.join(markets)}, decode_ticker_prices)
+
+    if response_data is not None:
+        batch_prices = parse_ticker_prices(response_data)
+        prices.update(batch_prices)
+
+        missing_markets = [market for market in markets if market not in batch_prices]
+        if missing_markets and batch_prices:
+            _observe_fallback('ticker', 'missing_markets')
+            await _bisect_ticker_prices(missing_markets, prices, rejected)
+        return
+
+    if not is_rejected_status(status):
+        return
+
+    if len(markets) == 1:
+        rejected.append(markets[0])
+        return
+
+    _observe_fallback('ticker', 'bisect')
+    middle = len(markets) // 2
+    await asyncio.gather(
+        _bisect_ticker_prices(markets[:middle], prices, rejected),
+        _bisect_ticker_prices(markets[middle:], prices, rejected)
+    )
+
+
+async def get_current_prices_with_rejected(markets: List[str]) -> Tuple[Dict[str, float], List[str]]:
+    """
+    여러 암호화폐의 현재가를 비동기로 조회하고 서버가 거부한 마켓 코드를 함께 반환
+
+    Args:
+        markets (List[str]): 조회할 마켓 코드 리스트
+
+    Returns:
+        Tuple[Dict[str, float], List[str]]: (마켓별 현재가, 거부된 마켓 리스트)
+    """
+    prices: Dict[str, float] = {}
+    rejected: List[str] = []
+
+    if not markets:
+        return prices, rejected
+
+    unique_markets = list(dict.fromkeys(markets))
+    if not PRICE_CACHE_ENABLED:
+        await _bisect_ticker_prices(unique_markets, prices, rejected)
+        return prices, rejected
+
+    loop = asyncio.get_running_loop()
+
+    def load_prices(missing_markets: List[str]) -> Dict[str, float]:
+        loaded: Dict[str, float] = {}
+        # 캐시에 없는 마켓은 이벤트 루프에서 조회하고 이 스레드는 결과만 기다림
+        asyncio.run_coroutine_threadsafe(
+            _bisect_ticker_prices(missing_markets, loaded, rejected), loop
+        ).result()
+        return loaded
+
+    # 현재가 캐시는 다른 호출자의 조회를 스레드에서 기다리므로 작업 스레드에서 실행
+    # (요청용 풀을 기다림으로 채우지 않도록 이벤트 루프 기본 풀 사용)
+    prices = await loop.run_in_executor(None, get_price_cache().get_many, unique_markets, load_prices)
+    return prices, rejected
+
+
+async def get_current_prices(markets: List[str]) -> Dict[str, float]:
+    """
+    여러 암호화폐의 현재가를 비동기로 조회
+    일괄 조회가 거부되면 분할 조회로 잘못된 마켓만 제외
+
+    Args:
+        markets (List[str]): 조회할 마켓 코드 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+
+    Returns:
+        Dict[str, float]: 마켓별 현재가 딕셔너리
+    """
+    if not markets:
+        return {}
+
+    if len(markets) == 1:
+        price = await get_single_price(markets[0])
+        return {markets[0]: price} if price is not None else {}
+
+    prices, rejected = await get_current_prices_with_rejected(markets)
+
+    if rejected:
+        print(f"⚠️  존재하지 않는 마켓을 제외했습니다: {', '.join(rejected)}")
+
+    return prices
+
+
+async def get_single_price(market: str) -> Optional[float]:
+    """
+    단일 암호화폐의 현재가를 비동기로 조회
+    같은 마켓을 짧은 시간 안에 다시 조회하면 현재가 캐시의 값을 재사용
+    PRICE_BATCH_ENABLED면 동시에 들어온 다른 마켓 요청과 묶어 한 번에 조회
+
+    Args:
+        market (str): 조회할 마켓 코드 (예: 'KRW-BTC')
+
+    Returns:
+        float: 현재가
+        None: 조회 실패시
+    """
+    if PRICE_BATCH_ENABLED:
+        return await get_price_batcher().get_async(market)
+
+    prices, _ = await get_current_prices_with_rejected([market])
+    return prices.get(market)
+
+
+async def _fetch_candle_page(market: str, page: Dict[str, Any]) -> Optional[List[Dict]]:
+    """일봉 한 페이지를 비동기로 조회 (실패시 None, 데이터가 없는 기간은 빈 리스트)"""
+    params = {"market": market, "count": page['count']}
+    if page['to']:
+        params["to"] = page['to']
+    return await make_api_request(API_ENDPOINTS["candles_days"], params)
+
+
+async def get_historical_data(market: str, count: int) -> Optional[List[Dict]]:
+    """
+    암호화폐의 과거 일봉 데이터를 비동기로 조회
+    CANDLE_STORE_ENABLED면 동기 클라이언트와 같은 로컬 캔들 저장소를 거쳐
+    마지막 저장 캔들 이후의 데이터만 받아옴 (저장소 입출력과 조회는 작업 스레드에서 수행)
+    저장소를 쓰지 않으면 요청당 최대 개수(200개)를 넘는 페이지를 동시에 조회하여 합침
+
+    Args:
+        market (str): 마켓 코드 (예: 'KRW-BTC')
+        count (int): 조회할 일수
+
+    Returns:
+        List[Dict]: 일봉 데이터 리스트 (최신순)
+        None: 조회 실패시
+    """
+    if CANDLE_STORE_ENABLED:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), _get_candles, market, count, None, "days")
+
+    pages = plan_candle_pages(count)
+    results = await asyncio.gather(*(_fetch_candle_page(market, page) for page in pages))
+
+    fetched = [result for result in results if result is not None]
+    if len(fetched) < len(results):
+        return None
+
+    merged = merge_candle_pages(fetched, count)
+    return merged if merged else None
+
+
+async def gather_historical_data(markets: List[str], count: int) -> Dict[str, Optional[List[Dict]]]:
+    """
+    여러 마켓의 과거 일봉 데이터를 동시에 조회
+
+    Args:
+        markets (List[str]): 마켓 코드 리스트
+        count (int): 조회할 일수
+
+    Returns:
+        Dict[str, Optional[List[Dict]]]: 마켓별 일봉 데이터 (실패한 마켓은 None)
+    """
+    results = await asyncio.gather(*(get_historical_data(market, count) for market in markets))
+    return dict(zip(markets, results))
@@ -0,0 +1,281 @@
+"""
+메모리 매핑 캔들 아카이브
+마켓/캔들 단위마다 고정 길이 레코드 파일 하나에 캔들을 보관하고 mmap으로 열어
+파일 전체를 읽지 않고 배열처럼 사용 (실제로 접근한 페이지만 메모리에 올라옴)
+
+파일 형식 (리틀 엔디언):
+    헤더 64바이트: 매직(8) 버전(H) 레코드 크기(H) 플래그(I) 레코드 수(Q) 마켓(16) 캔들 단위(16) 예약(8)
+    레코드 48바이트: 시작 시각 int64(UTC epoch 초), 시가/고가/저가/종가/거래량 float64
+    레코드는 시각순으로 정렬되어 있으며 시각 조회는 이진 탐색으로 처리
+"""
+
+import os
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from typing import BinaryIO, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from config.settings import CANDLE_ARCHIVE_DIR
+from utils.candle_series import CandleSeries
+
+MAGIC = b"UPBTCNDL"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sHHIQ16s16s8x")
+_RECORD = struct.Struct("<qddddd")
+HEADER_SIZE = _HEADER.size  # 64
+RECORD_SIZE = _RECORD.size  # 48
+_FIELDS = RECORD_SIZE // 8  # 레코드당 8바이트 값 개수
+
+# 레코드 수 위치 (추가할 때 헤더 전체를 다시 쓰지 않고 이 값만 갱신)
+_COUNT_OFFSET = 16
+
+# 첫 레코드가 상장 시점 캔들임 (더 과거 캔들이 없음)
+FLAG_HISTORY_START = 1
+
+
+class ArchiveInfo(NamedTuple):
+    """아카이브 파일 정보 (헤더와 첫/마지막 레코드만 읽어서 만듦)"""
+    market: str
+    unit: str
+    record_count: int
+    first_timestamp: Optional[int]
+    last_timestamp: Optional[int]
+    path: str
+    history_start: bool = False  # 첫 레코드가 상장 시점 캔들인지
+
+
+def _series_from_rows(market: str, unit: str, rows: Iterable[Sequence]) -> CandleSeries:
+    """(시각, 시가, 고가, 저가, 종가, 거래량) 행들로 배열을 새로 만든 시계열"""
+    rows = list(rows)
+    columns = [array('q', (row[0] for row in rows))]
+    columns += [array('d', (row[index] for row in rows)) for index in range(1, _FIELDS)]
+    return CandleSeries(market, unit, *columns)
+
+
+def _encode_name(value: str) -> bytes:
+    encoded = value.encode("ascii")
+    if len(encoded) > 16:
+        raise ValueError(f"아카이브 헤더에 넣기에는 너무 긴 이름입니다: {value}")
+    return encoded
+
+
+class CandleArchive:
+    """
+    마켓/캔들 단위별 고정 길이 바이너리 캔들 아카이브
+
+    - append(series): 캔들 추가 (마지막 캔들과 같은 시각이면 교체, 더 과거 캔들이 섞이면 파일을 다시 씀)
+    - open(market, unit): mmap으로 연 CandleSeries (배열을 복사하지 않는 뷰)
+    - info(market, unit) / entries(): 헤더만 읽은 파일 정보
+
+    리틀 엔디언 환경(x86, ARM)에서만 mmap 뷰를 그대로 사용할 수 있음
+
+    Args:
+        root (str): 아카이브 디렉토리 (마켓별 하위 디렉토리에 단위별 파일 생성)
+    """
+
+    def __init__(self, root: str = CANDLE_ARCHIVE_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+
+    def path(self, market: str, unit: str) -> str:
+        """마켓/캔들 단위의 아카이브 파일 경로 (예: KRW-BTC/minutes-1.candles)"""
+        return os.path.join(self.root, market, unit.replace("/", "-") + ".candles")
+
+    def _read_header(self, handle: BinaryIO, path: str) -> Tuple[int, int]:
+        """(플래그, 레코드 수)를 반환"""
+        header = handle.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"아카이브 헤더가 손상되었습니다: {path}")
+        magic, version, record_size, flags, count, _, _ = _HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+            raise ValueError(f"지원하지 않는 아카이브 형식입니다: {path}")
+        return flags, count
+
+    def open(self, market: str, unit: str = "days") -> Optional[CandleSeries]:
+        """
+        아카이브를 mmap으로 열어 시계열로 반환
+        데이터를 읽어 들이지 않으므로 수년치 분봉도 바로 열리며, 접근한 구간만 디스크에서 읽음
+
+        Args:
+            market (str): 마켓 코드
+            unit (str): 캔들 단위 (예: 'days', 'minutes/1', '1h')
+
+        Returns:
+            CandleSeries: 과거순 시계열 (열은 같은 매핑을 가리키는 memoryview)
+            None: 아카이브가 없는 경우
+
+        Raises:
+            ValueError: 파일 형식이 잘못된 경우
+        """
+        path = self.path(market, unit)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "rb") as handle:
+            _, count = self._read_header(handle, path)
+            if count == 0:
+                return CandleSeries.empty(market, unit)
+            if os.fstat(handle.fileno()).st_size < HEADER_SIZE + count * RECORD_SIZE:
+                raise ValueError(f"아카이브 레코드가 헤더보다 적습니다: {path}")
+            # 파일을 닫아도 매핑은 이 시계열(memoryview)이 남아 있는 동안 유지됨
+            mapped = mmap.mmap(handle.fileno(), HEADER_SIZE + count * RECORD_SIZE, access=mmap.ACCESS_READ)
+
+        records = memoryview(mapped)[HEADER_SIZE:]
+        if sys.byteorder != "little":
+            # 빅 엔디언 환경은 복사본을 만들어 바이트 순서를 맞춤
+            return _series_from_rows(market, unit, _RECORD.iter_unpack(records))
+
+        integers, floats = records.cast("q"), records.cast("d")
+        columns = [integers[0::_FIELDS]] + [floats[index::_FIELDS] for index in range(1, _FIELDS)]
+        return CandleSeries(market, unit, *columns)
+
+    def info(self, market: str, unit: str = "days") -> Optional[ArchiveInfo]:
+        """
+        아카이브 파일 정보를 반환 (헤더와 첫/마지막 레코드 시각만 읽음)
+
+        Args:
+            market (str): 마켓 코드
+            unit (str): 캔들 단위
+
+        Returns:
+            ArchiveInfo: 파일 정보
+            None: 아카이브가 없는 경우
+        """
+        path = self.path(market, unit)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "rb") as handle:
+            flags, count = self._read_header(handle, path)
+            first = last = None
+            if count:
+                first = _RECORD.unpack(handle.read(RECORD_SIZE))[0]
+                handle.seek(HEADER_SIZE + (count - 1) * RECORD_SIZE)
+                last = _RECORD.unpack(handle.read(RECORD_SIZE))[0]
+        return ArchiveInfo(market, unit, count, first, last, path, bool(flags & FLAG_HISTORY_START))
+
+    def entries(self) -> List[ArchiveInfo]:
+        """아카이브에 있는 모든 마켓/캔들 단위의 파일 정보 (마켓, 단위순)"""
+        found: List[ArchiveInfo] = []
+        if not os.path.isdir(self.root):
+            return found
+        for market in sorted(os.listdir(self.root)):
+            directory = os.path.join(self.root, market)
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if name.endswith(".candles"):
+                    info = self.info(market, name[:-len(".candles")].replace("-", "/"))
+                    if info is not None:
+                        found.append(info)
+        return found
+
+    def append(self, series: CandleSeries, history_start: bool = False) -> int:
+        """
+        시계열의 캔들을 아카이브에 추가
+
+        마지막 레코드 이후 캔들은 파일 끝에 덧붙이고, 마지막 레코드와 같은 시각의 캔들은
+        (진행 중이던 캔들이므로) 교체함. 더 과거 캔들이 섞여 있으면 합쳐서 파일을 새로 씀
+
+        Args:
+            series (CandleSeries): 추가할 캔들 (market, unit으로 파일을 정함)
+            history_start (bool): series의 첫 캔들이 상장 시점 캔들인지 (더 과거를 다시 받지 않도록 기록)
+
+        Returns:
+            int: 추가되거나 교체된 레코드 수
+        """
+        if not len(series):
+            return 0
+
+        market, unit = series.market, series.unit
+        path = self.path(market, unit)
+        with self._lock:
+            info = self.info(market, unit)
+            # 레코드가 없는 파일은 첫/마지막 시각도 없음
+            if info is None or info.first_timestamp is None or info.last_timestamp is None:
+                self._rewrite(path, market, unit, series, FLAG_HISTORY_START if history_start else 0)
+                return len(series)
+
+            first = series[0].timestamp
+            if first < info.last_timestamp:
+                # 상장 시점 여부는 합친 뒤의 첫 캔들을 준 쪽을 따름
+                if first < info.first_timestamp:
+                    starts_at_listing = history_start
+                else:
+                    starts_at_listing = info.history_start or (history_start and first == info.first_timestamp)
+                return self._merge(path, market, unit, series, FLAG_HISTORY_START if starts_at_listing else 0)
+
+            newer = series.between(info.last_timestamp)
+            with open(path, "r+b") as handle:
+                count = info.record_count
+                if newer[0].timestamp == info.last_timestamp:
+                    count -= 1
+                handle.seek(HEADER_SIZE + count * RECORD_SIZE)
+                handle.write(self._encode_records(newer))
+                handle.truncate()
+                # 레코드를 모두 쓴 뒤에 개수를 갱신하여 읽는 쪽이 덜 쓴 레코드를 보지 않도록 함
+                handle.seek(_COUNT_OFFSET)
+                handle.write(struct.pack("<Q", count + len(newer)))
+            return len(newer)
+
+    def _merge(self, path: str, market: str, unit: str, series: CandleSeries, flags: int) -> int:
+        existing = self.open(market, unit) or CandleSeries.empty(market, unit)
+        merged = {candle.timestamp: candle for candle in existing}
+        changed = sum(1 for candle in series if merged.get(candle.timestamp) != candle)
+        merged.update((candle.timestamp, candle) for candle in series)
+        rows = _series_from_rows(market, unit, (merged[timestamp] for timestamp in sorted(merged)))
+        del existing, merged  # 파일을 교체하기 전에 이 함수가 연 매핑을 놓음
+
+        self._rewrite(path, market, unit, rows, flags)
+        return changed
+
+    def _rewrite(self, path: str, market: str, unit: str, series: CandleSeries, flags: int = 0) -> None:
+        """임시 파일에 전체를 쓰고 교체 (이미 열린 매핑은 이전 파일을 계속 가리킴)"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        header = _HEADER.pack(MAGIC, VERSION, RECORD_SIZE, flags, len(series),
+                              _encode_name(market), _encode_name(unit))
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as handle:
+            handle.write(header)
+            handle.write(self._encode_records(series))
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _encode_records(series: CandleSeries) -> bytes:
+        return b"".join(map(_RECORD.pack, series.timestamps, series.open, series.high,
+                            series.low, series.close, series.volume))
+
+
+_candle_archive: Optional[CandleArchive] = None
+_candle_archive_lock = threading.Lock()
+
+
+def get_candle_archive() -> CandleArchive:
+    """프로세스 전역 캔들 아카이브를 반환"""
+    global _candle_archive
+
+    with _candle_archive_lock:
+        if _candle_archive is None:
+            _candle_archive = CandleArchive(CANDLE_ARCHIVE_DIR)
+        return _candle_archive
+
+
+def set_candle_archive(candle_archive: Optional[CandleArchive]) -> Optional[CandleArchive]:
+    """
+    프로세스 전역 캔들 아카이브를 교체
+
+    Args:
+        candle_archive (CandleArchive, optional): 새 아카이브 (None이면 다음 호출시 기본 경로로 생성)
+
+    Returns:
+        CandleArchive: 이전 아카이브
+    """
+    global _candle_archive
+
+    with _candle_archive_lock:
+        previous = _candle_archive
+        _candle_archive = candle_archive
+        return previous
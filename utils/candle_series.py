@@ -0,0 +1,286 @@
+"""
+열(column) 단위 캔들 시계열
+캔들마다 딕셔너리를 두는 대신 시각/시가/고가/저가/종가/거래량을 연속된 배열에 저장하여
+메모리를 줄이고, 슬라이싱과 기간 조회는 배열을 복사하지 않는 뷰로 처리
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union, overload
+
+from utils.date_utils import INVALID_TIMESTAMP, parse_candle_timestamps, parse_upbit_timestamp
+from utils.json_decoder import loads
+
+KST = timezone(timedelta(hours=9))
+
+# 시각 인자로 받을 수 있는 값 (epoch 초, datetime, date, 'YYYY-MM-DD[THH:MM:SS]' 문자열)
+Moment = Union[int, float, str, date, datetime]
+
+# 열 이름과 업비트 캔들 응답 필드
+_PRICE_FIELDS = (
+    ("open", "opening_price"),
+    ("high", "high_price"),
+    ("low", "low_price"),
+    ("close", "trade_price"),
+    ("volume", "candle_acc_trade_volume"),
+)
+_COLUMNS = ("timestamps",) + tuple(column for column, _ in _PRICE_FIELDS)
+
+
+class Candle(NamedTuple):
+    """캔들 하나 (CandleSeries에서 인덱스로 꺼낸 값)"""
+    timestamp: int  # 캔들 시작 시각 (UTC epoch 초)
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+    @property
+    def kst_date(self) -> str:
+        """캔들 시작 시각의 KST 날짜 (YYYY-MM-DD, 업비트 candle_date_time_kst와 같은 날짜)"""
+        return datetime.fromtimestamp(self.timestamp, KST).strftime("%Y-%m-%d")
+
+
+def parse_candle_time(value: str) -> int:
+    """
+    업비트 candle_date_time_utc 문자열을 UTC epoch 초로 변환
+
+    Args:
+        value (str): 예) '2024-01-01T00:00:00' (뒤의 소수 초, 'Z'는 무시)
+
+    Returns:
+        int: UTC epoch 초
+    """
+    return parse_upbit_timestamp(value)
+
+
+def to_timestamp(moment: Moment, tz: tzinfo = timezone.utc) -> int:
+    """
+    시각 인자를 UTC epoch 초로 변환
+
+    - date 또는 'YYYY-MM-DD': 그 날짜의 일봉 시작 시각
+      (업비트 일봉은 UTC 00:00 = KST 09:00에 시작하므로 KST 날짜와 UTC 날짜가 같은 일봉을 가리킴)
+    - 시간대가 있는 datetime, 'Z'/'+09:00'이 붙은 문자열: 그 시각
+    - 시간대가 없는 datetime, 'YYYY-MM-DDTHH:MM:SS': tz 기준 시각
+
+    Args:
+        moment: 변환할 시각
+        tz (tzinfo): 시간대가 없는 시각을 해석할 기준 (기본값: UTC, KST 시각이면 KST)
+
+    Returns:
+        int: UTC epoch 초
+    """
+    if isinstance(moment, str):
+        moment = datetime.fromisoformat(moment.replace("Z", "+00:00")) if "T" in moment \
+            else date.fromisoformat(moment)
+    if isinstance(moment, datetime):
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=tz)
+        return int(moment.timestamp())
+    if isinstance(moment, date):
+        return int(datetime(moment.year, moment.month, moment.day, tzinfo=timezone.utc).timestamp())
+    return int(moment)
+
+
+def _view(column: Any) -> memoryview:
+    return column if isinstance(column, memoryview) else memoryview(column)
+
+
+class CandleSeries:
+    """
+    과거순으로 정렬된 캔들 시계열
+
+    - timestamps: array('q') 캔들 시작 시각 (UTC epoch 초)
+    - open/high/low/close/volume: array('d')
+    - series[i]: Candle, series[a:b]: 같은 배열을 공유하는 CandleSeries 뷰
+    - between(start, end): 기간에 해당하는 뷰 (이진 탐색)
+
+    Args:
+        market (str): 마켓 코드
+        unit (str): 캔들 단위 (예: 'days')
+        timestamps: 캔들 시작 시각 배열 (과거순)
+        open, high, low, close, volume: 가격/거래량 배열 (timestamps와 같은 길이)
+    """
+
+    __slots__ = ("market", "unit") + _COLUMNS
+
+    def __init__(self, market: str, unit: str, timestamps, open, high, low, close, volume):
+        self.market = market
+        self.unit = unit
+        columns = (timestamps, open, high, low, close, volume)
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("캔들 열의 길이가 서로 다릅니다")
+        # memoryview 슬라이스는 원본 배열을 복사하지 않음
+        self.timestamps: memoryview = _view(timestamps)
+        self.open: memoryview = _view(open)
+        self.high: memoryview = _view(high)
+        self.low: memoryview = _view(low)
+        self.close: memoryview = _view(close)
+        self.volume: memoryview = _view(volume)
+
+    @classmethod
+    def from_candles(cls, candles: List[Dict[str, Any]], market: Optional[str] = None,
+                     unit: str = "days") -> "CandleSeries":
+        """
+        API 응답 형식의 캔들 딕셔너리 리스트로 시계열을 생성
+
+        Args:
+            candles (List[Dict]): 캔들 리스트 (최신순 또는 과거순)
+            market (str, optional): 마켓 코드 (기본값: 첫 캔들의 market 필드)
+            unit (str): 캔들 단위
+
+        Returns:
+            CandleSeries: 과거순 시계열
+        """
+        if market is None:
+            market = candles[0].get('market', '') if candles else ''
+
+        parsed = parse_candle_timestamps(candles)
+        if parsed.errors:
+            index, value = parsed.errors[0]
+            print(f"⚠️  {market} 캔들 {len(parsed.errors)}개의 시각을 읽지 못해 제외했습니다 "
+                  f"(첫 오류: {index}번째 {value!r})")
+
+        stamps = parsed.timestamps
+        order = sorted((i for i in range(len(stamps)) if stamps[i] != INVALID_TIMESTAMP), key=stamps.__getitem__)
+        rows = [candles[i] for i in order]
+        timestamps = array('q', (stamps[i] for i in order))
+        prices = [
+            array('d', (float(candle.get(field) or 0.0) for candle in rows))
+            for _, field in _PRICE_FIELDS
+        ]
+        return cls(market, unit, timestamps, *prices)
+
+    @classmethod
+    def from_payload(cls, content: bytes, market: Optional[str] = None, unit: str = "days") -> "CandleSeries":
+        """
+        캔들 API 응답 본문(JSON 바이트)으로 시계열을 생성
+
+        Args:
+            content (bytes): 캔들 API 응답 본문
+            market (str, optional): 마켓 코드
+            unit (str): 캔들 단위
+
+        Returns:
+            CandleSeries: 과거순 시계열
+        """
+        return cls.from_candles(loads(content), market, unit)
+
+    @classmethod
+    def empty(cls, market: str = "", unit: str = "days") -> "CandleSeries":
+        """빈 시계열을 생성"""
+        return cls(market, unit, array('q'), *(array('d') for _ in _PRICE_FIELDS))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @overload
+    def __getitem__(self, index: int) -> Candle: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CandleSeries": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Candle, "CandleSeries"]:
+        if isinstance(index, slice):
+            return CandleSeries(self.market, self.unit, *(getattr(self, name)[index] for name in _COLUMNS))
+        return Candle(*(getattr(self, name)[index] for name in _COLUMNS))
+
+    def __iter__(self) -> Iterator[Candle]:
+        return map(Candle, self.timestamps, self.open, self.high, self.low, self.close, self.volume)
+
+    def __repr__(self) -> str:
+        if not self:
+            return f"CandleSeries({self.market!r}, {self.unit!r}, 0 candles)"
+        first, last = self[0].kst_date, self[-1].kst_date
+        return f"CandleSeries({self.market!r}, {self.unit!r}, {len(self)} candles, {first} ~ {last})"
+
+    @property
+    def nbytes(self) -> int:
+        """시계열이 참조하는 배열 구간의 바이트 수"""
+        return sum(getattr(self, name).nbytes for name in _COLUMNS)
+
+    def index_of(self, moment: Moment, tz: tzinfo = timezone.utc) -> int:
+        """
+        시각 이후 첫 캔들의 위치를 반환 (이진 탐색)
+
+        Args:
+            moment: 시각 (to_timestamp 참고)
+            tz (tzinfo): 시간대가 없는 시각을 해석할 기준
+
+        Returns:
+            int: moment보다 이르지 않은 첫 캔들의 인덱스 (없으면 len(series))
+        """
+        return bisect_left(self.timestamps, to_timestamp(moment, tz))
+
+    def at_or_before(self, moment: Moment, tz: tzinfo = timezone.utc) -> Optional[Candle]:
+        """
+        시각 또는 그 이전에 시작한 마지막 캔들을 반환 (O(log n))
+        날짜를 넘기면 그 날짜의 일봉, 없으면(거래 공백) 직전 거래일 일봉
+
+        Args:
+            moment: 시각 (to_timestamp 참고)
+            tz (tzinfo): 시간대가 없는 시각을 해석할 기준
+
+        Returns:
+            Candle: 해당 캔들
+            None: moment 이전 캔들이 없는 경우
+        """
+        index = bisect_right(self.timestamps, to_timestamp(moment, tz)) - 1
+        return self[index] if index >= 0 else None
+
+    def first_after(self, moment: Moment, tz: tzinfo = timezone.utc) -> Optional[Candle]:
+        """
+        시각 이후에 시작한 첫 캔들을 반환 (O(log n))
+        날짜를 넘기면 그 날짜 다음의 첫 거래일 일봉
+
+        Args:
+            moment: 시각 (to_timestamp 참고)
+            tz (tzinfo): 시간대가 없는 시각을 해석할 기준
+
+        Returns:
+            Candle: 해당 캔들
+            None: moment 이후 캔들이 없는 경우
+        """
+        index = bisect_right(self.timestamps, to_timestamp(moment, tz))
+        return self[index] if index < len(self) else None
+
+    def between(self, start: Optional[Moment] = None, end: Optional[Moment] = None,
+                tz: tzinfo = timezone.utc) -> "CandleSeries":
+        """
+        시작 시각이 [start, end) 구간에 있는 캔들의 뷰를 반환 (배열을 복사하지 않음)
+
+        Args:
+            start: 구간 시작 (None이면 처음부터)
+            end: 구간 끝, 포함하지 않음 (None이면 끝까지)
+            tz (tzinfo): 시간대가 없는 시각을 해석할 기준
+
+        Returns:
+            CandleSeries: 기간 뷰
+        """
+        lo = 0 if start is None else self.index_of(start, tz)
+        hi = len(self) if end is None else self.index_of(end, tz)
+        return self[lo:max(lo, hi)]
+
+    def to_candles(self) -> List[Dict[str, Any]]:
+        """
+        API 응답 형식의 캔들 딕셔너리 리스트로 변환 (최신순)
+
+        Returns:
+            List[Dict]: 캔들 리스트
+        """
+        candles = []
+        for candle in reversed(list(self)):
+            start = datetime.fromtimestamp(candle.timestamp, timezone.utc)
+            candles.append({
+                'market': self.market,
+                'candle_date_time_utc': start.strftime("%Y-%m-%dT%H:%M:%S"),
+                'candle_date_time_kst': start.astimezone(KST).strftime("%Y-%m-%dT%H:%M:%S"),
+                'opening_price': candle.open,
+                'high_price': candle.high,
+                'low_price': candle.low,
+                'trade_price': candle.close,
+                'candle_acc_trade_volume': candle.volume
+            })
+        return candles
@@ -0,0 +1,155 @@
+"""
+로컬 캔들 저장소
+과거 캔들은 바뀌지 않으므로 SQLite에 보관하고 이후에는 새로 생긴 캔들만 조회
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import List, Dict, Optional
+
+from config.settings import CANDLE_STORE_PATH
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candles (
+    market TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    candle_date_time_utc TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (market, unit, candle_date_time_utc)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS history_start (
+    market TEXT NOT NULL,
+    unit TEXT NOT NULL,
+    candle_date_time_utc TEXT NOT NULL,
+    PRIMARY KEY (market, unit)
+) WITHOUT ROWID;
+"""
+
+
+class CandleStore:
+    """
+    마켓/캔들 단위별 캔들 저장소 (SQLite, WAL 모드)
+    연결은 호출마다 새로 열어 여러 스레드/프로세스가 동시에 읽을 수 있음
+
+    Args:
+        path (str): SQLite 파일 경로
+    """
+
+    def __init__(self, path: str = CANDLE_STORE_PATH):
+        self.path = path
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                    connection.executescript(_SCHEMA)
+                    self._initialized = True
+        return connection
+
+    def load(self, market: str, unit: str, count: int) -> List[Dict]:
+        """
+        저장된 캔들을 최신순으로 조회
+
+        Args:
+            market (str): 마켓 코드
+            unit (str): 캔들 단위 (예: 'days')
+            count (int): 최대 조회 개수
+
+        Returns:
+            List[Dict]: 캔들 리스트 (최신순, API 응답과 같은 형식)
+        """
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT payload FROM candles WHERE market = ? AND unit = ? "
+                "ORDER BY candle_date_time_utc DESC LIMIT ?",
+                (market, unit, count)
+            ).fetchall()
+        finally:
+            connection.close()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_history_start(self, market: str, unit: str) -> Optional[str]:
+        """마켓의 첫 캔들(상장 시점) UTC 시각을 반환 (아직 모르면 None)"""
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT candle_date_time_utc FROM history_start WHERE market = ? AND unit = ?",
+                (market, unit)
+            ).fetchone()
+        finally:
+            connection.close()
+        return row[0] if row else None
+
+    def save(self, market: str, unit: str, candles: List[Dict], history_start: Optional[str] = None) -> None:
+        """
+        캔들을 저장 (같은 시각의 캔들은 덮어씀)
+
+        Args:
+            market (str): 마켓 코드
+            unit (str): 캔들 단위
+            candles (List[Dict]): API 응답 캔들 리스트
+            history_start (str, optional): 더 과거 캔들이 없다고 확인된 첫 캔들 시각
+        """
+        rows = [
+            (market, unit, candle['candle_date_time_utc'], json.dumps(candle, ensure_ascii=False))
+            for candle in candles
+            if candle.get('candle_date_time_utc')
+        ]
+
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO candles (market, unit, candle_date_time_utc, payload) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                if history_start:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO history_start (market, unit, candle_date_time_utc) "
+                        "VALUES (?, ?, ?)",
+                        (market, unit, history_start)
+                    )
+        finally:
+            connection.close()
+
+
+_candle_store: Optional[CandleStore] = None
+_candle_store_lock = threading.Lock()
+
+
+def get_candle_store() -> CandleStore:
+    """프로세스 전역 캔들 저장소를 반환 (최초 호출시 디렉토리 생성)"""
+    global _candle_store
+
+    with _candle_store_lock:
+        if _candle_store is None:
+            os.makedirs(os.path.dirname(CANDLE_STORE_PATH), exist_ok=True)
+            _candle_store = CandleStore(CANDLE_STORE_PATH)
+        return _candle_store
+
+
+def set_candle_store(candle_store: Optional[CandleStore]) -> Optional[CandleStore]:
+    """
+    프로세스 전역 캔들 저장소를 교체
+
+    Args:
+        candle_store (CandleStore, optional): 새 저장소 (None이면 다음 호출시 기본 경로로 생성)
+
+    Returns:
+        CandleStore: 이전 저장소
+    """
+    global _candle_store
+
+    with _candle_store_lock:
+        previous = _candle_store
+        _candle_store = candle_store
+        return previous
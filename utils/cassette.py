@@ -0,0 +1,231 @@
+"""
+API 응답 기록/재생(cassette) 유틸리티
+실제 API 응답을 압축 파일에 기록해 두고, 이후 네트워크 없이 같은 순서로 재생하여
+분석기/알림/수익률 계산을 같은 데이터로 반복 실행할 수 있게 함
+"""
+
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config.settings import (
+    API_CASSETTE_MODE,
+    API_CASSETTE_PATH,
+    API_CASSETTE_REPLAY_LATENCY
+)
+
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+# 재생에 필요한 응답 헤더 (나머지 헤더는 기록하지 않음)
+_RECORDED_HEADERS = ("Content-Type", "Remaining-Req")
+
+
+class CassetteMissError(requests.exceptions.RequestException):
+    """재생 모드에서 기록되지 않은 요청을 보낸 경우 (재시도하지 않음)"""
+
+
+def make_request_key(url: str, params: Optional[Dict[str, Any]] = None,
+                     ignore: Tuple[str, ...] = ()) -> str:
+    """
+    요청을 식별하는 키를 생성 (호스트와 파라미터 순서는 무시)
+
+    Args:
+        url (str): 요청 URL
+        params (dict, optional): 요청 파라미터
+        ignore (Tuple[str, ...]): 키에서 제외할 파라미터 이름
+
+    Returns:
+        str: 예) '/v1/candles/days?count=200&market=KRW-BTC'
+    """
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items() if k not in ignore)
+    path = urlparse(url).path
+    return f"{path}?{urlencode(items)}" if items else path
+
+
+# 일봉 페이지의 to 커서는 실행 날짜에 따라 바뀌므로 정확한 키가 없을 때는 to를 빼고 찾음
+_LOOSE_IGNORED_PARAMS = ("to",)
+
+
+class Cassette:
+    """
+    API 응답 기록/재생기
+
+    - record: 응답(상태 코드, 필요한 헤더, 본문, 지연 시간)을 gzip JSON Lines 파일에 추가
+    - replay: 같은 요청 키의 응답을 기록된 순서대로 반환 (끝나면 마지막 응답을 반복)
+
+    Args:
+        path (str): cassette 파일 경로
+        mode (str): 'record' 또는 'replay'
+        replay_latency (bool): 재생시 기록된 지연 시간만큼 대기할지 여부
+    """
+
+    def __init__(self, path: str, mode: str, replay_latency: bool = False):
+        if mode not in (MODE_RECORD, MODE_REPLAY):
+            raise ValueError(f"지원하지 않는 cassette 모드: {mode}")
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.stats = {'recorded': 0, 'replayed': 0, 'misses': 0}
+        self._lock = threading.Lock()
+        self._writer: Optional[gzip.GzipFile] = None
+        self._entries: Optional[Dict[str, List[Dict]]] = None
+        self._loose_entries: Dict[str, List[Dict]] = {}
+        self._cursors: Dict[str, int] = {}
+
+    def record(self, url: str, params: Optional[Dict[str, Any]], response: requests.Response) -> None:
+        """
+        실제 응답을 cassette에 기록
+
+        Args:
+            url (str): 요청 URL
+            params (dict, optional): 요청 파라미터
+            response (requests.Response): 받은 응답
+        """
+        entry = {
+            'key': make_request_key(url, params),
+            'loose_key': make_request_key(url, params, _LOOSE_IGNORED_PARAMS),
+            'status': response.status_code,
+            'headers': {name: response.headers[name] for name in _RECORDED_HEADERS if name in response.headers},
+            'elapsed': round(response.elapsed.total_seconds(), 4),
+            'body': response.content.decode('utf-8', errors='replace')
+        }
+        line = (json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+        with self._lock:
+            if self._writer is None:
+                # 기록을 시작할 때 이전 내용을 지우고 새 cassette를 만듦
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                self._writer = gzip.open(self.path, 'wb')
+            self._writer.write(line)
+            self._writer.flush()
+            self.stats['recorded'] += 1
+
+    def _load(self) -> Dict[str, List[Dict]]:
+        entries: Dict[str, List[Dict]] = {}
+        loose_entries: Dict[str, List[Dict]] = {}
+        if os.path.exists(self.path):
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    entries.setdefault(entry['key'], []).append(entry)
+                    loose_entries.setdefault(entry['loose_key'], []).append(entry)
+        self._entries = entries
+        self._loose_entries = loose_entries
+        return entries
+
+    def _next_entry(self, key: str, loose_key: str) -> Optional[Dict]:
+        with self._lock:
+            entries = self._entries if self._entries is not None else self._load()
+
+            for cursor_key, candidates in ((key, entries.get(key)),
+                                           ("~" + loose_key, self._loose_entries.get(loose_key))):
+                if candidates:
+                    index = self._cursors.get(cursor_key, 0)
+                    self._cursors[cursor_key] = index + 1
+                    self.stats['replayed'] += 1
+                    return candidates[min(index, len(candidates) - 1)]
+
+            self.stats['misses'] += 1
+            return None
+
+    def replay(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """
+        기록된 응답을 requests.Response로 만들어 반환
+
+        Args:
+            url (str): 요청 URL
+            params (dict, optional): 요청 파라미터
+
+        Returns:
+            requests.Response: 기록된 응답
+
+        Raises:
+            CassetteMissError: 기록되지 않은 요청인 경우
+        """
+        key = make_request_key(url, params)
+        entry = self._next_entry(key, make_request_key(url, params, _LOOSE_IGNORED_PARAMS))
+        if entry is None:
+            raise CassetteMissError(f"cassette에 기록되지 않은 요청입니다: {key}")
+
+        if self.replay_latency and entry['elapsed'] > 0:
+            time.sleep(entry['elapsed'])
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = entry['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = url
+        response.reason = "Replayed"
+        return response
+
+    def close(self) -> None:
+        """기록 중인 파일을 닫음"""
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+_cassette: Optional[Cassette] = None
+_cassette_loaded = False
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """
+    설정(API_CASSETTE_MODE)에 따른 프로세스 전역 cassette를 반환
+
+    Returns:
+        Cassette: 기록/재생 중인 cassette
+        None: 기록/재생을 사용하지 않는 경우
+    """
+    global _cassette, _cassette_loaded
+
+    if _cassette_loaded:
+        return _cassette
+
+    with _cassette_lock:
+        if not _cassette_loaded:
+            if API_CASSETTE_MODE != MODE_OFF:
+                _cassette = Cassette(API_CASSETTE_PATH, API_CASSETTE_MODE, API_CASSETTE_REPLAY_LATENCY)
+                print(f"📼 API cassette {API_CASSETTE_MODE} 모드: {API_CASSETTE_PATH}")
+            _cassette_loaded = True
+        return _cassette
+
+
+def set_cassette(cassette: Optional[Cassette]) -> Optional[Cassette]:
+    """
+    프로세스 전역 cassette를 교체
+
+    Args:
+        cassette (Cassette, optional): 새 cassette (None이면 실제 API 사용)
+
+    Returns:
+        Cassette: 이전 cassette
+    """
+    global _cassette, _cassette_loaded
+
+    with _cassette_lock:
+        previous = _cassette
+        _cassette = cassette
+        _cassette_loaded = True
+        return previous
+
+
+@atexit.register
+def _close_cassette() -> None:
+    if _cassette is not None:
+        _cassette.close()
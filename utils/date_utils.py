@@ -2,9 +2,16 @@
 날짜 및 시간 처리 유틸리티 함수들
 """
 
-from datetime import datetime, timedelta
+from array import array
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
 from config.settings import DATETIME_FORMAT, TIME_FORMAT
 
+# 읽지 못한 시각 자리에 넣는 값 (errors에 위치와 원래 값이 함께 기록됨)
+INVALID_TIMESTAMP = -(2 ** 63)
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 
 def get_current_time() -> str:
     """
@@ -59,18 +66,137 @@ def parse_upbit_datetime(upbit_date_str: str) -> datetime:
     업비트 API는 ISO 8601 형식을 사용 (예: "2024-01-01T00:00:00")
 
     Args:
-        upbit_date_str (str): 업비트 API 날짜 문자열
+        upbit_date_str (str): 업비트 API 날짜 문자열 ('Z'나 '+09:00' 같은 타임존 정보는 무시)
 
     Returns:
-        datetime: 변환된 datetime 객체
-    """
-    try:
-        # 'T'로 날짜와 시간이 구분되고, 'Z'나 '+09:00' 같은 타임존 정보 제거
-        date_part = upbit_date_str.split('T')[0]
-        time_part = upbit_date_str.split('T')[1].split('+')[0].split('Z')[0]
-
-        datetime_str = f"{date_part} {time_part}"
-        return datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
-    except (ValueError, IndexError) as e:
-        print(f"날짜 파싱 오류: {upbit_date_str}, 에러: {e}")
-        return datetime.now()
\ No newline at end of file
+        datetime: 문자열에 적힌 시각 그대로의 datetime 객체 (시간대 정보 없음)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    seconds = parse_upbit_timestamp(upbit_date_str)
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(tzinfo=None)
+
+
+class ParsedTimestamps(NamedTuple):
+    """일괄 변환 결과"""
+    timestamps: array  # array('q') UTC epoch 초 (실패한 자리는 INVALID_TIMESTAMP)
+    errors: List[Tuple[int, Any]]  # (위치, 원래 값)
+
+
+# 날짜/시각 부분별 변환 캐시 (일봉은 날짜마다, 분봉은 하루 안의 시각마다 같은 값이 반복됨)
+_DAY_SECONDS: Dict[str, int] = {}
+_CLOCK_SECONDS: Dict[str, int] = {}
+_CACHE_LIMIT = 100000
+
+
+def _day_seconds(text: str) -> int:
+    """'YYYY-MM-DD'를 1970-01-01부터의 초로 변환 (캐시에 없을 때만 호출)"""
+    if len(text) != 10 or text[4] != '-' or text[7] != '-':
+        raise ValueError(f"날짜 형식이 아닙니다: {text!r}")
+    seconds = (date(int(text[0:4]), int(text[5:7]), int(text[8:10])).toordinal() - _EPOCH_ORDINAL) * 86400
+    if len(_DAY_SECONDS) >= _CACHE_LIMIT:
+        _DAY_SECONDS.clear()
+    _DAY_SECONDS[text] = seconds
+    return seconds
+
+
+def _clock_seconds(text: str) -> int:
+    """'HH:MM:SS'를 자정부터의 초로 변환 (캐시에 없을 때만 호출)"""
+    if len(text) != 8 or text[2] != ':' or text[5] != ':':
+        raise ValueError(f"시각 형식이 아닙니다: {text!r}")
+    hour, minute, second = int(text[0:2]), int(text[3:5]), int(text[6:8])
+    if hour > 23 or minute > 59 or second > 59:
+        raise ValueError(f"잘못된 시각입니다: {text!r}")
+    seconds = hour * 3600 + minute * 60 + second
+    _CLOCK_SECONDS[text] = seconds
+    return seconds
+
+
+def _parse_naive_seconds(value: str) -> int:
+    """
+    'YYYY-MM-DDTHH:MM:SS'(뒤의 소수 초, 'Z' 무시)를 시간대 없는 epoch 초로 변환
+    strptime 대신 고정 위치를 잘라 읽고, 날짜와 시각 부분은 캐시된 값을 사용
+    """
+    if value[10:11] not in ('T', ' '):
+        raise ValueError(f"업비트 시각 형식이 아닙니다: {value!r}")
+    day = _DAY_SECONDS.get(value[:10])
+    if day is None:
+        day = _day_seconds(value[:10])
+    clock = _CLOCK_SECONDS.get(value[11:19])
+    if clock is None:
+        clock = _clock_seconds(value[11:19])
+    return day + clock
+
+
+def _utc_offset_seconds(tz: tzinfo) -> int:
+    offset = tz.utcoffset(None)
+    if offset is None:
+        raise ValueError(f"고정된 UTC 오프셋이 없는 시간대입니다: {tz!r}")
+    return int(offset.total_seconds())
+
+
+def parse_upbit_timestamp(value: str, tz: tzinfo = timezone.utc) -> int:
+    """
+    업비트 시각 문자열 하나를 UTC epoch 초로 변환
+
+    Args:
+        value (str): 예) '2024-01-01T09:00:00'
+        tz (tzinfo): 문자열의 기준 시간대 (candle_date_time_utc는 UTC, candle_date_time_kst는 KST)
+
+    Returns:
+        int: UTC epoch 초
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    return _parse_naive_seconds(value) - _utc_offset_seconds(tz)
+
+
+def parse_upbit_timestamps(values: Iterable[Any], tz: tzinfo = timezone.utc) -> ParsedTimestamps:
+    """
+    업비트 시각 문자열을 한 번에 UTC epoch 초 배열로 변환
+    행마다 출력하지 않고 실패한 위치와 값을 errors로 모아 반환
+
+    Args:
+        values (Iterable[str]): 시각 문자열들
+        tz (tzinfo): 문자열의 기준 시간대 (고정 오프셋)
+
+    Returns:
+        ParsedTimestamps: (timestamps, errors)
+    """
+    offset = _utc_offset_seconds(tz)
+    days, clocks = _DAY_SECONDS, _CLOCK_SECONDS
+    timestamps = array('q')
+    append = timestamps.append
+    errors: List[Tuple[int, Any]] = []
+
+    for index, value in enumerate(values):
+        # 캐시에 있는 날짜/시각은 사전 조회 두 번으로 끝냄 (_parse_naive_seconds를 펼친 형태)
+        try:
+            day = days.get(value[:10])
+            clock = clocks.get(value[11:19])
+            if day is None or clock is None or value[10] not in 'T ':
+                append(_parse_naive_seconds(value) - offset)
+            else:
+                append(day + clock - offset)
+        except (TypeError, ValueError, IndexError):
+            append(INVALID_TIMESTAMP)
+            errors.append((index, value))
+    return ParsedTimestamps(timestamps, errors)
+
+
+def parse_candle_timestamps(candles: List[Dict[str, Any]],
+                            field: str = "candle_date_time_utc") -> ParsedTimestamps:
+    """
+    캔들 응답 전체의 시각 필드를 UTC epoch 초 배열로 변환
+
+    Args:
+        candles (List[Dict]): 캔들 API 응답
+        field (str): 'candle_date_time_utc' 또는 'candle_date_time_kst' (KST 필드는 9시간을 빼서 UTC로 맞춤)
+
+    Returns:
+        ParsedTimestamps: (timestamps, errors)
+    """
+    tz = timezone(timedelta(hours=9)) if field.endswith("_kst") else timezone.utc
+    return parse_upbit_timestamps([candle.get(field) for candle in candles], tz)
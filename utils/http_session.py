@@ -0,0 +1,118 @@
+"""
+HTTP 세션 풀 관리 유틸리티
+모든 API 호출이 공유하는 keep-alive 세션을 생성하고 정리
+"""
+
+import atexit
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config.settings import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_POOL_BLOCK,
+    HTTP_KEEP_ALIVE
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def create_session(pool_connections: int = HTTP_POOL_CONNECTIONS,
+                   pool_maxsize: int = HTTP_POOL_MAXSIZE,
+                   pool_block: bool = HTTP_POOL_BLOCK,
+                   keep_alive: bool = HTTP_KEEP_ALIVE) -> requests.Session:
+    """
+    연결 풀이 설정된 새 세션을 생성
+
+    Args:
+        pool_connections (int): 캐싱할 호스트별 연결 풀 개수
+        pool_maxsize (int): 호스트당 최대 동시 연결 수
+        pool_block (bool): 연결이 모두 사용 중일 때 대기할지 여부
+        keep_alive (bool): keep-alive 연결 재사용 여부
+
+    Returns:
+        requests.Session: 설정된 세션
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive" if keep_alive else "close"
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    프로세스 전역 공유 세션을 반환 (최초 호출시 생성)
+
+    Returns:
+        requests.Session: 공유 세션
+    """
+    global _session
+
+    session = _session
+    if session is not None:
+        return session
+
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def configure_session(pool_connections: int = HTTP_POOL_CONNECTIONS,
+                      pool_maxsize: int = HTTP_POOL_MAXSIZE,
+                      pool_block: bool = HTTP_POOL_BLOCK,
+                      keep_alive: bool = HTTP_KEEP_ALIVE) -> requests.Session:
+    """
+    공유 세션을 새 설정으로 교체 (기존 세션은 정리)
+
+    Args:
+        pool_connections (int): 캐싱할 호스트별 연결 풀 개수
+        pool_maxsize (int): 호스트당 최대 동시 연결 수
+        pool_block (bool): 연결이 모두 사용 중일 때 대기할지 여부
+        keep_alive (bool): keep-alive 연결 재사용 여부
+
+    Returns:
+        requests.Session: 새로 설정된 공유 세션
+    """
+    global _session
+
+    new_session = create_session(pool_connections, pool_maxsize, pool_block, keep_alive)
+    with _session_lock:
+        old_session = _session
+        _session = new_session
+
+    if old_session is not None:
+        old_session.close()
+    return new_session
+
+
+def close_session() -> None:
+    """
+    공유 세션과 열린 연결을 모두 정리
+    이후 get_session() 호출시 새 세션이 생성됨
+    """
+    global _session
+
+    with _session_lock:
+        session = _session
+        _session = None
+
+    if session is not None:
+        session.close()
+
+
+atexit.register(close_session)
@@ -0,0 +1,151 @@
+"""
+API 응답 JSON 디코딩 유틸리티
+호출자가 실제로 쓰는 필드만 응답 바이트에서 바로 읽어 작은 레코드로 만들고,
+그럴 수 없는 응답은 전체를 파싱 (orjson이 설치되어 있으면 orjson 사용)
+"""
+
+import json
+import re
+from types import ModuleType
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from config.settings import JSON_BACKEND
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+Decoder = Callable[[bytes], Any]
+
+
+class TickerPrice(NamedTuple):
+    """현재가 조회에 필요한 티커 필드"""
+    market: str
+    trade_price: float
+
+
+class CandleClose(NamedTuple):
+    """수익률 계산에 필요한 일봉 필드"""
+    candle_date_time_kst: str
+    trade_price: float
+
+
+def get_json_backend() -> str:
+    """
+    사용할 JSON 파서 이름을 반환
+
+    Returns:
+        str: 'orjson' 또는 'json' (JSON_BACKEND가 'auto'면 설치 여부로 결정)
+    """
+    if JSON_BACKEND == "json" or orjson is None:
+        return "json"
+    return "orjson"
+
+
+def loads(content: bytes) -> Any:
+    """
+    응답 바이트 전체를 파싱
+
+    Args:
+        content (bytes): UTF-8 JSON 바이트
+
+    Returns:
+        Any: 파싱된 JSON 데이터
+    """
+    if orjson is not None and get_json_backend() == "orjson":
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# 이스케이프가 없는 문자열만 빠른 경로로 읽음 (이스케이프가 있으면 개수가 맞지 않아 전체 파싱)
+_STRING_VALUE = rb'"([^"\\]*)"'
+_NUMBER_VALUE = rb'(-?\d[\d.eE+-]*)'
+
+
+def _field_pattern(name: str, kind: type) -> "re.Pattern":
+    value = _STRING_VALUE if kind is str else _NUMBER_VALUE
+    return re.compile(b'"' + name.encode() + rb'"\s*:\s*' + value)
+
+
+def _string(raw: bytes) -> str:
+    return raw.decode("utf-8")
+
+
+def _scan_records(content: bytes, patterns: Sequence[Tuple["re.Pattern", Callable]],
+                  record_type: type) -> Optional[list]:
+    """
+    평평한 객체 배열에서 필드 값만 정규식으로 읽어 레코드 리스트를 만듦
+    배열이 닫혀 있고 모든 객체에 필드가 정확히 하나씩 있을 때만 결과를 반환 (아니면 None)
+    """
+    if not content.lstrip().startswith(b"[") or not content.rstrip().endswith(b"]"):
+        return None
+
+    # 중괄호 짝이 맞지 않으면 (잘린 본문 등) 전체 파싱에서 오류를 내도록 함
+    objects = content.count(b"{")
+    if content.count(b"}") != objects:
+        return None
+    columns = []
+    for pattern, convert in patterns:
+        values = pattern.findall(content)
+        if len(values) != objects:
+            return None
+        columns.append(map(convert, values))
+
+    return [record_type(*values) for values in zip(*columns)]
+
+
+def _decode_records(content: bytes, record_type: type,
+                    patterns: Sequence[Tuple["re.Pattern", Callable]]) -> List[Any]:
+    try:
+        records = _scan_records(content, patterns, record_type)
+    except (ValueError, UnicodeDecodeError):
+        records = None
+    if records is not None:
+        return records
+
+    # 중첩 객체, null 값 등 빠른 경로로 읽을 수 없는 응답은 전체 파싱 후 필요한 필드만 추출
+    fields = record_type.__annotations__
+    return [
+        record_type(*(convert(item[field]) for field, convert in fields.items()))
+        for item in loads(content)
+        if isinstance(item, dict) and all(item.get(field) is not None for field in fields)
+    ]
+
+
+_TICKER_PATTERNS = (
+    (_field_pattern("market", str), _string),
+    (_field_pattern("trade_price", float), float)
+)
+
+_CANDLE_CLOSE_PATTERNS = (
+    (_field_pattern("candle_date_time_kst", str), _string),
+    (_field_pattern("trade_price", float), float)
+)
+
+
+def decode_ticker_prices(content: bytes) -> List[TickerPrice]:
+    """
+    티커 응답에서 마켓 코드와 현재가만 읽음
+
+    Args:
+        content (bytes): 티커 API 응답 바이트
+
+    Returns:
+        List[TickerPrice]: (market, trade_price) 레코드 리스트
+    """
+    return _decode_records(content, TickerPrice, _TICKER_PATTERNS)
+
+
+def decode_candle_closes(content: bytes) -> List[CandleClose]:
+    """
+    일봉 응답에서 캔들 시각(KST)과 종가만 읽음
+
+    Args:
+        content (bytes): 캔들 API 응답 바이트
+
+    Returns:
+        List[CandleClose]: (candle_date_time_kst, trade_price) 레코드 리스트 (최신순)
+    """
+    return _decode_records(content, CandleClose, _CANDLE_CLOSE_PATTERNS)
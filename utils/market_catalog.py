@@ -0,0 +1,205 @@
+"""
+업비트 마켓 목록 유틸리티
+market/all 응답을 메모리와 디스크에 캐싱하고 마켓 정보를 O(1)로 조회
+"""
+
+import json
+import os
+import threading
+import time
+from typing import List, Dict, Optional, cast
+
+from config.settings import (
+    API_ENDPOINTS,
+    MARKET_CATALOG_PATH,
+    MARKET_CATALOG_TTL,
+    MARKET_CATALOG_RETRY_INTERVAL
+)
+from utils.api_client import make_api_request
+
+_catalog: Optional[Dict[str, Dict[str, str]]] = None
+_fetched_at = 0.0
+_failed_at: Optional[float] = None
+_catalog_lock = threading.Lock()
+
+
+def _build_catalog(markets: List[Dict]) -> Dict[str, Dict[str, str]]:
+    """market/all 응답을 마켓 코드 기준 딕셔너리로 변환"""
+    catalog = {}
+    for item in markets:
+        market = item.get('market')
+        if not market or '-' not in market:
+            continue
+        catalog[market] = {
+            'korean_name': item.get('korean_name', ''),
+            'english_name': item.get('english_name', ''),
+            'quote_currency': market.split('-')[0]
+        }
+    return catalog
+
+
+def _read_disk_cache(path: str) -> Optional[Dict]:
+    """디스크 캐시 파일을 읽음 (없거나 손상된 경우 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if isinstance(cached.get('markets'), list):
+            return cached
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def _write_disk_cache(path: str, markets: List[Dict], fetched_at: float) -> None:
+    """마켓 목록을 디스크 캐시 파일에 원자적으로 기록"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fetched_at': fetched_at, 'markets': markets}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"⚠️  마켓 목록 캐시 저장 실패: {e}")
+
+
+def load_market_catalog(force_refresh: bool = False) -> Optional[Dict[str, Dict[str, str]]]:
+    """
+    마켓 목록을 조회 (메모리 캐시 → 디스크 캐시 → API 순서)
+    API 조회에 실패하면 만료된 캐시라도 반환하고, 재시도는 일정 시간 뒤에만 수행
+
+    Args:
+        force_refresh (bool): 캐시를 무시하고 API에서 다시 조회할지 여부
+
+    Returns:
+        Dict[str, Dict[str, str]]: 마켓 코드별 정보
+            {'KRW-BTC': {'korean_name': '비트코인', 'english_name': 'Bitcoin', 'quote_currency': 'KRW'}}
+        None: 캐시도 없고 조회에도 실패한 경우
+    """
+    global _catalog, _fetched_at, _failed_at
+
+    with _catalog_lock:
+        now = time.time()
+
+        if not force_refresh:
+            if _catalog is not None and now - _fetched_at < MARKET_CATALOG_TTL:
+                return _catalog
+
+            cached = _read_disk_cache(MARKET_CATALOG_PATH)
+            if cached and now - cached.get('fetched_at', 0) < MARKET_CATALOG_TTL:
+                _catalog = _build_catalog(cached['markets'])
+                _fetched_at = cached['fetched_at']
+                return _catalog
+
+            if _failed_at is not None and now - _failed_at < MARKET_CATALOG_RETRY_INTERVAL:
+                return _catalog
+
+        # market/all은 마켓 객체 배열을 반환
+        markets = cast(Optional[List[Dict]],
+                       make_api_request(API_ENDPOINTS["market_all"], {"isDetails": "false"}))
+
+        if not markets:
+            _failed_at = now
+            if _catalog is None:
+                # 만료된 디스크 캐시라도 없는 것보다는 나음
+                cached = _read_disk_cache(MARKET_CATALOG_PATH)
+                if cached:
+                    _catalog = _build_catalog(cached['markets'])
+                    _fetched_at = cached.get('fetched_at', 0)
+            return _catalog
+
+        _catalog = _build_catalog(markets)
+        _fetched_at = now
+        _failed_at = None
+        _write_disk_cache(MARKET_CATALOG_PATH, markets, now)
+        return _catalog
+
+
+def clear_market_catalog() -> None:
+    """메모리에 캐싱된 마켓 목록을 초기화 (디스크 캐시는 유지)"""
+    global _catalog, _fetched_at, _failed_at
+
+    with _catalog_lock:
+        _catalog = None
+        _fetched_at = 0.0
+        _failed_at = None
+
+
+def get_market_info(market: str) -> Optional[Dict[str, str]]:
+    """
+    마켓 정보를 조회
+
+    Args:
+        market (str): 마켓 코드 (예: 'KRW-BTC')
+
+    Returns:
+        Dict[str, str]: 한글명, 영문명, 기준 통화
+        None: 목록에 없거나 목록을 불러오지 못한 경우
+    """
+    catalog = load_market_catalog()
+    if catalog is None:
+        return None
+    return catalog.get(market)
+
+
+def is_known_market(market: str) -> bool:
+    """
+    업비트에 상장된 마켓인지 확인
+
+    Args:
+        market (str): 마켓 코드
+
+    Returns:
+        bool: 마켓 목록에 있으면 True (목록을 불러오지 못하면 False)
+    """
+    return get_market_info(market) is not None
+
+
+def find_unknown_markets(markets: List[str]) -> List[str]:
+    """
+    마켓 목록에 없는 마켓 코드를 찾음
+    마켓 목록을 불러오지 못하면 판단할 수 없으므로 빈 리스트를 반환
+
+    Args:
+        markets (List[str]): 확인할 마켓 코드 리스트
+
+    Returns:
+        List[str]: 상장되지 않은 마켓 코드 리스트
+    """
+    catalog = load_market_catalog()
+    if catalog is None:
+        return []
+    return [market for market in markets if market not in catalog]
+
+
+def get_korean_name(market: str) -> Optional[str]:
+    """마켓의 한글명을 반환 (예: 'KRW-BTC' → '비트코인')"""
+    info = get_market_info(market)
+    return info['korean_name'] if info else None
+
+
+def get_english_name(market: str) -> Optional[str]:
+    """마켓의 영문명을 반환 (예: 'KRW-BTC' → 'Bitcoin')"""
+    info = get_market_info(market)
+    return info['english_name'] if info else None
+
+
+def get_quote_currency(market: str) -> Optional[str]:
+    """마켓의 기준 통화를 반환 (예: 'KRW-BTC' → 'KRW')"""
+    info = get_market_info(market)
+    return info['quote_currency'] if info else None
+
+
+def get_markets_by_quote(quote_currency: str = "KRW") -> List[str]:
+    """
+    기준 통화별 상장 마켓 목록을 반환
+
+    Args:
+        quote_currency (str): 기준 통화 (예: 'KRW', 'BTC', 'USDT')
+
+    Returns:
+        List[str]: 마켓 코드 리스트 (목록을 불러오지 못하면 빈 리스트)
+    """
+    catalog = load_market_catalog()
+    if catalog is None:
+        return []
+    return [market for market, info in catalog.items() if info['quote_currency'] == quote_currency]
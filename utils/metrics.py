@@ -0,0 +1,190 @@
+"""
+API 요청 지표 수집 유틸리티
+엔드포인트 그룹별 응답 시간 히스토그램, 상태 코드, 재시도, 수신 바이트, 대체 경로 횟수를 모아
+딕셔너리 스냅샷과 Prometheus 텍스트 형식으로 제공
+비활성화 상태에서는 get_api_metrics()가 None을 반환하여 호출부가 바로 건너뜀
+"""
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import METRICS_ENABLED, METRICS_LATENCY_BUCKETS
+
+_METRIC_PREFIX = "upbit_api"
+
+
+class _EndpointMetrics:
+    """엔드포인트 그룹 하나의 지표"""
+
+    def __init__(self, bucket_count: int):
+        self.bucket_counts = [0] * (bucket_count + 1)  # 마지막 칸은 +Inf
+        self.latency_sum = 0.0
+        self.requests = 0
+        self.statuses: Dict[str, int] = {}
+        self.retries = 0
+        self.bytes_received = 0
+        self.fallbacks: Dict[str, int] = {}
+
+
+class ApiMetrics:
+    """
+    엔드포인트 그룹별 API 요청 지표
+
+    Args:
+        buckets (Tuple[float, ...]): 응답 시간 히스토그램 구간 상한(초)
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = METRICS_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints: Dict[str, _EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, group: str) -> _EndpointMetrics:
+        endpoint = self._endpoints.get(group)
+        if endpoint is None:
+            endpoint = _EndpointMetrics(len(self.buckets))
+            self._endpoints[group] = endpoint
+        return endpoint
+
+    def observe_request(self, group: str, status: Optional[int], seconds: float, bytes_received: int) -> None:
+        """
+        요청 한 번의 결과를 기록
+
+        Args:
+            group (str): 엔드포인트 그룹
+            status (int, optional): HTTP 상태 코드 (응답을 받지 못했으면 None)
+            seconds (float): 응답 시간(초)
+            bytes_received (int): 수신한 본문 크기
+        """
+        status_key = str(status) if status is not None else "error"
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            endpoint = self._get(group)
+            endpoint.requests += 1
+            endpoint.latency_sum += seconds
+            endpoint.bucket_counts[index] += 1
+            endpoint.statuses[status_key] = endpoint.statuses.get(status_key, 0) + 1
+            endpoint.bytes_received += bytes_received
+
+    def observe_retry(self, group: str) -> None:
+        """재시도 한 번을 기록"""
+        with self._lock:
+            self._get(group).retries += 1
+
+    def observe_fallback(self, group: str, reason: str) -> None:
+        """
+        대체 경로 사용을 기록
+
+        Args:
+            group (str): 엔드포인트 그룹
+            reason (str): 대체 경로 종류 (예: 'bisect', 'missing_markets', 'stored_candles')
+        """
+        with self._lock:
+            fallbacks = self._get(group).fallbacks
+            fallbacks[reason] = fallbacks.get(reason, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        현재 지표를 딕셔너리로 반환
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 그룹별 {'requests', 'latency': {'count', 'sum', 'buckets'},
+                                       'statuses', 'retries', 'bytes_received', 'fallbacks'}
+                                       (buckets는 구간 상한 → 누적 개수, 마지막 키는 '+Inf')
+        """
+        with self._lock:
+            result = {}
+            for group, endpoint in self._endpoints.items():
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip(self.buckets + (float('inf'),), endpoint.bucket_counts):
+                    cumulative += count
+                    buckets['+Inf' if bound == float('inf') else bound] = cumulative
+                result[group] = {
+                    'requests': endpoint.requests,
+                    'latency': {'count': endpoint.requests, 'sum': endpoint.latency_sum, 'buckets': buckets},
+                    'statuses': dict(endpoint.statuses),
+                    'retries': endpoint.retries,
+                    'bytes_received': endpoint.bytes_received,
+                    'fallbacks': dict(endpoint.fallbacks)
+                }
+            return result
+
+    def to_prometheus(self) -> str:
+        """
+        현재 지표를 Prometheus 텍스트 형식으로 반환
+
+        Returns:
+            str: Prometheus exposition 형식 문자열
+        """
+        snapshot = self.snapshot()
+        name = f"{_METRIC_PREFIX}_request_duration_seconds"
+        lines: List[str] = [
+            f"# HELP {name} API 요청 응답 시간",
+            f"# TYPE {name} histogram"
+        ]
+        for group, data in snapshot.items():
+            for bound, count in data['latency']['buckets'].items():
+                lines.append(f'{name}_bucket{{endpoint="{group}",le="{bound}"}} {count}')
+            lines.append(f'{name}_sum{{endpoint="{group}"}} {data["latency"]["sum"]:.6f}')
+            lines.append(f'{name}_count{{endpoint="{group}"}} {data["latency"]["count"]}')
+
+        counters = [
+            ("responses_total", "API 응답 수 (status=error는 응답 없음)",
+             lambda data: [(f'status="{status}"', count) for status, count in data['statuses'].items()]),
+            ("retries_total", "API 요청 재시도 수", lambda data: [("", data['retries'])]),
+            ("response_bytes_total", "수신한 응답 본문 크기", lambda data: [("", data['bytes_received'])]),
+            ("fallbacks_total", "대체 경로 사용 수",
+             lambda data: [(f'reason="{reason}"', count) for reason, count in data['fallbacks'].items()]),
+        ]
+        for suffix, help_text, samples in counters:
+            name = f"{_METRIC_PREFIX}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for group, data in snapshot.items():
+                for labels, value in samples(data):
+                    label_text = f'endpoint="{group}"' + (f",{labels}" if labels else "")
+                    lines.append(f"{name}{{{label_text}}} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """모든 지표를 초기화"""
+        with self._lock:
+            self._endpoints.clear()
+
+
+_api_metrics: Optional[ApiMetrics] = ApiMetrics() if METRICS_ENABLED else None
+
+
+def get_api_metrics() -> Optional[ApiMetrics]:
+    """프로세스 전역 API 지표를 반환 (비활성화 상태면 None)"""
+    return _api_metrics
+
+
+def set_api_metrics(api_metrics: Optional[ApiMetrics]) -> Optional[ApiMetrics]:
+    """
+    프로세스 전역 API 지표를 교체
+
+    Args:
+        api_metrics (ApiMetrics, optional): 새 지표 수집기 (None이면 수집 중지)
+
+    Returns:
+        ApiMetrics: 이전 지표 수집기
+    """
+    global _api_metrics
+
+    previous = _api_metrics
+    _api_metrics = api_metrics
+    return previous
+
+
+def get_metrics_snapshot() -> Dict[str, Dict[str, Any]]:
+    """프로세스 전역 API 지표 스냅샷을 반환 (비활성화 상태면 빈 딕셔너리)"""
+    return _api_metrics.snapshot() if _api_metrics is not None else {}
+
+
+def export_prometheus_metrics() -> str:
+    """프로세스 전역 API 지표를 Prometheus 텍스트로 반환 (비활성화 상태면 빈 문자열)"""
+    return _api_metrics.to_prometheus() if _api_metrics is not None else ""
@@ -0,0 +1,210 @@
+"""
+현재가 요청 묶음 처리(micro-batching) 유틸리티
+짧은 시간 안에 들어온 단일 마켓 현재가 요청을 모아 한 번의 티커 요청으로 처리하고
+결과를 각 호출자에게 나누어 줌 (스레드와 asyncio 모두 지원)
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+from config.settings import (
+    PRICE_BATCH_WINDOW,
+    PRICE_BATCH_MAX_SIZE,
+    PRICE_BATCH_WAIT_TIMEOUT
+)
+
+BatchLoader = Callable[[List[str]], Dict[str, float]]
+
+
+class PriceBatcher:
+    """
+    단일 마켓 현재가 요청 묶음 처리기
+
+    - 첫 요청이 들어온 뒤 window초 동안(또는 max_batch개가 모일 때까지) 요청을 모음
+    - 모인 마켓을 loader로 한 번에 조회하고 각 요청의 Future에 결과를 전달
+    - 조회 중에 들어온 요청은 다음 묶음으로 처리
+
+    Args:
+        loader (Callable): 여러 마켓의 현재가를 한 번에 조회하는 함수
+        window (float): 묶음을 모으는 최대 시간(초)
+        max_batch (int): 한 묶음의 최대 마켓 수
+    """
+
+    def __init__(self, loader: BatchLoader, window: float = PRICE_BATCH_WINDOW,
+                 max_batch: int = PRICE_BATCH_MAX_SIZE):
+        self.loader = loader
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[str, List[Future]] = {}
+        self._batch_started = 0.0
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+        self._stats = {'requests': 0, 'batches': 0, 'markets': 0}
+        self._batch_sizes: Dict[int, int] = {}
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="price-batcher", daemon=True)
+            self._worker.start()
+
+    def submit(self, market: str) -> Future:
+        """
+        현재가 요청을 다음 묶음에 추가
+
+        Args:
+            market (str): 마켓 코드
+
+        Returns:
+            Future: 현재가(float) 또는 조회 실패시 None이 설정되는 Future
+        """
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("PriceBatcher가 종료되었습니다")
+            if not self._pending:
+                self._batch_started = time.monotonic()
+            self._pending.setdefault(market, []).append(future)
+            self._stats['requests'] += 1
+            self._ensure_worker()
+            self._condition.notify()
+        return future
+
+    def get(self, market: str, timeout: Optional[float] = PRICE_BATCH_WAIT_TIMEOUT) -> Optional[float]:
+        """
+        현재가를 묶음 조회로 가져옴 (스레드용)
+
+        Args:
+            market (str): 마켓 코드
+            timeout (float, optional): 최대 대기 시간(초)
+
+        Returns:
+            float: 현재가
+            None: 조회 실패 또는 시간 초과시
+        """
+        try:
+            return self.submit(market).result(timeout)
+        except Exception:
+            return None
+
+    async def get_async(self, market: str) -> Optional[float]:
+        """
+        현재가를 묶음 조회로 가져옴 (이벤트 루프를 막지 않음)
+
+        Args:
+            market (str): 마켓 코드
+
+        Returns:
+            float: 현재가
+            None: 조회 실패시
+        """
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(self.submit(market)), PRICE_BATCH_WAIT_TIMEOUT)
+        except Exception:
+            return None
+
+    def _next_batch(self) -> Optional[Dict[str, List[Future]]]:
+        with self._condition:
+            while not self._pending and not self._closed:
+                self._condition.wait()
+            if not self._pending:
+                return None
+
+            deadline = self._batch_started + self.window
+            while len(self._pending) < self.max_batch and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            markets = list(self._pending)[:self.max_batch]
+            batch = {market: self._pending.pop(market) for market in markets}
+            if self._pending:
+                # 크기 제한으로 남은 요청은 바로 다음 묶음으로 처리
+                self._batch_started = time.monotonic() - self.window
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            try:
+                prices = self.loader(list(batch))
+            except Exception as e:
+                print(f"❌ 현재가 묶음 조회 실패: {e}")
+                prices = {}
+
+            with self._condition:
+                size = len(batch)
+                self._stats['batches'] += 1
+                self._stats['markets'] += size
+                self._batch_sizes[size] = self._batch_sizes.get(size, 0) + 1
+
+            for market, futures in batch.items():
+                for future in futures:
+                    future.set_result(prices.get(market))
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        묶음 처리 통계를 반환
+
+        Returns:
+            Dict: requests(요청 수), batches(티커 조회 수), markets(조회한 마켓 수),
+                  average_batch_size, max_batch_size, batch_sizes(묶음 크기별 횟수)
+        """
+        with self._condition:
+            counts = dict(self._stats)
+            batch_sizes = dict(sorted(self._batch_sizes.items()))
+        batches = counts['batches']
+        stats: Dict[str, object] = dict(counts)
+        stats['average_batch_size'] = counts['markets'] / batches if batches else 0.0
+        stats['max_batch_size'] = max(batch_sizes) if batch_sizes else 0
+        stats['batch_sizes'] = batch_sizes
+        return stats
+
+    def close(self) -> None:
+        """남은 요청을 처리한 뒤 작업 스레드를 종료"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join()
+
+
+_price_batcher: Optional[PriceBatcher] = None
+_price_batcher_lock = threading.Lock()
+
+
+def get_price_batcher() -> PriceBatcher:
+    """프로세스 전역 현재가 묶음 처리기를 반환 (최초 호출시 생성)"""
+    global _price_batcher
+
+    with _price_batcher_lock:
+        if _price_batcher is None:
+            from utils.api_client import get_current_prices_with_rejected
+            _price_batcher = PriceBatcher(lambda markets: get_current_prices_with_rejected(markets)[0])
+        return _price_batcher
+
+
+def set_price_batcher(price_batcher: Optional[PriceBatcher]) -> Optional[PriceBatcher]:
+    """
+    프로세스 전역 현재가 묶음 처리기를 교체
+
+    Args:
+        price_batcher (PriceBatcher, optional): 새 묶음 처리기 (None이면 다음 호출시 기본 설정으로 생성)
+
+    Returns:
+        PriceBatcher: 이전 묶음 처리기
+    """
+    global _price_batcher
+
+    with _price_batcher_lock:
+        previous = _price_batcher
+        _price_batcher = price_batcher
+        return previous
@@ -0,0 +1,163 @@
+"""
+현재가 캐시 유틸리티
+티커 조회 결과를 TTL 동안 재사용하고, 같은 마켓에 대한 동시 요청을 하나로 합침
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config.settings import (
+    PRICE_CACHE_TTL,
+    PRICE_CACHE_MAX_STALENESS,
+    PRICE_CACHE_WAIT_TIMEOUT
+)
+
+PriceLoader = Callable[[List[str]], Dict[str, float]]
+
+
+class PriceCache:
+    """
+    마켓별 현재가 TTL 캐시 (single-flight)
+
+    - TTL 이내의 가격은 요청 없이 반환 (hit)
+    - 다른 호출자가 이미 조회 중인 마켓은 그 결과를 기다려 공유 (coalesced)
+    - 조회에 실패하면 max_staleness 이내의 이전 가격을 반환 (stale)
+
+    Args:
+        ttl (float): 캐시된 가격을 그대로 사용할 시간(초)
+        max_staleness (float): 조회 실패시 이전 가격을 허용할 최대 경과 시간(초)
+    """
+
+    def __init__(self, ttl: float = PRICE_CACHE_TTL, max_staleness: float = PRICE_CACHE_MAX_STALENESS):
+        self.ttl = ttl
+        self.max_staleness = max_staleness
+        self._entries: Dict[str, Tuple[float, float]] = {}  # 마켓 → (가격, 조회 시각)
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'stale': 0, 'requests': 0}
+
+    def _lookup(self, market: str, max_age: float, now: float) -> Optional[float]:
+        entry = self._entries.get(market)
+        if entry is not None and now - entry[1] <= max_age:
+            return entry[0]
+        return None
+
+    def get_many(self, markets: List[str], loader: PriceLoader) -> Dict[str, float]:
+        """
+        여러 마켓의 현재가를 캐시를 거쳐 조회
+
+        Args:
+            markets (List[str]): 조회할 마켓 코드 리스트
+            loader (Callable): 캐시에 없는 마켓들을 한 번에 조회하는 함수
+
+        Returns:
+            Dict[str, float]: 마켓별 현재가 (조회하지 못한 마켓은 제외)
+        """
+        prices: Dict[str, float] = {}
+        owned: List[str] = []
+        waiting: Dict[str, threading.Event] = {}
+
+        with self._lock:
+            now = time.monotonic()
+            for market in dict.fromkeys(markets):
+                price = self._lookup(market, self.ttl, now)
+                if price is not None:
+                    self._stats['hits'] += 1
+                    prices[market] = price
+                elif market in self._in_flight:
+                    self._stats['coalesced'] += 1
+                    waiting[market] = self._in_flight[market]
+                else:
+                    self._stats['misses'] += 1
+                    self._in_flight[market] = threading.Event()
+                    owned.append(market)
+            if owned:
+                self._stats['requests'] += 1
+
+        if owned:
+            fetched: Dict[str, float] = {}
+            try:
+                fetched = loader(owned)
+            finally:
+                with self._lock:
+                    now = time.monotonic()
+                    for market in owned:
+                        if market in fetched:
+                            self._entries[market] = (fetched[market], now)
+                        self._in_flight.pop(market).set()
+
+            for market in owned:
+                if market in fetched:
+                    prices[market] = fetched[market]
+
+        for market, event in waiting.items():
+            event.wait(PRICE_CACHE_WAIT_TIMEOUT)
+            with self._lock:
+                price = self._lookup(market, self.ttl, time.monotonic())
+            if price is not None:
+                prices[market] = price
+
+        # 조회하지 못한 마켓은 허용 범위 내의 이전 가격으로 대체
+        missing = [market for market in dict.fromkeys(markets) if market not in prices]
+        if missing:
+            with self._lock:
+                now = time.monotonic()
+                for market in missing:
+                    price = self._lookup(market, self.max_staleness, now)
+                    if price is not None:
+                        self._stats['stale'] += 1
+                        prices[market] = price
+
+        return prices
+
+    def invalidate(self, market: Optional[str] = None) -> None:
+        """
+        캐시된 가격을 삭제
+
+        Args:
+            market (str, optional): 삭제할 마켓 (없으면 전체 삭제)
+        """
+        with self._lock:
+            if market is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(market, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        캐시 사용 통계를 반환
+
+        Returns:
+            Dict[str, int]: hits, misses, coalesced, stale, requests(실제 조회 횟수),
+                            saved_requests(캐시로 절약한 마켓 조회 수)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['saved_requests'] = stats['hits'] + stats['coalesced']
+        return stats
+
+    def reset_stats(self) -> None:
+        """캐시 사용 통계를 0으로 초기화"""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+_price_cache = PriceCache()
+
+
+def get_price_cache() -> PriceCache:
+    """프로세스 전역 현재가 캐시를 반환"""
+    return _price_cache
+
+
+def get_price_cache_stats() -> Dict[str, int]:
+    """프로세스 전역 현재가 캐시의 사용 통계를 반환"""
+    return _price_cache.get_stats()
+
+
+def clear_price_cache() -> None:
+    """프로세스 전역 현재가 캐시의 가격과 통계를 초기화"""
+    _price_cache.invalidate()
+    _price_cache.reset_stats()
@@ -0,0 +1,420 @@
+"""
+프로세스 내 현재가 발행/구독(pub/sub) 허브
+하나의 상위 시세원(폴링 또는 WebSocket 스트림)만 유지하고 받은 가격을
+여러 구독자(콜백, 큐, async iterator)에게 나누어 줌
+느린 구독자는 마켓별 최신 가격만 받음 (중간 값은 버리고 버퍼가 쌓이지 않음)
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from config.settings import PRICE_HUB_SOURCE, PRICE_HUB_POLL_INTERVAL, PRICE_HUB_SNAPSHOT_TIMEOUT
+
+SOURCE_POLL = "poll"
+SOURCE_STREAM = "stream"
+
+
+class PriceUpdate(NamedTuple):
+    """구독자에게 전달되는 가격 갱신"""
+    market: str
+    price: float
+    timestamp: float  # time.time() 기준 수신 시각
+
+
+class Subscription:
+    """
+    허브 구독 하나 (기본은 마켓별 최신 가격 한 칸씩만 보관)
+
+    - get(): 다음 가격 갱신을 기다려 반환 (스레드용)
+    - for update in subscription: 구독이 닫힐 때까지 반복
+    - async for update in subscription: 이벤트 루프를 막지 않고 반복
+
+    Args:
+        hub (PriceHub): 구독한 허브
+        markets (Iterable[str]): 구독할 마켓 코드
+        conflate (bool): False면 덮어쓰지 않고 모든 갱신을 순서대로 보관 (체결마다 확인해야 하는 알림용)
+    """
+
+    def __init__(self, hub: "PriceHub", markets: Iterable[str], conflate: bool = True):
+        self.hub = hub
+        self.markets: FrozenSet[str] = frozenset(markets)
+        self.conflate = conflate
+        self.dropped = 0  # 읽기 전에 새 가격으로 덮어쓴 횟수
+        self.closed = False
+        self._pending: Dict[str, PriceUpdate] = {}
+        self._backlog: Deque[PriceUpdate] = deque()
+        self._condition = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    def _offer(self, update: PriceUpdate) -> None:
+        with self._condition:
+            if self.closed:
+                return
+            if not self.conflate:
+                self._backlog.append(update)
+            else:
+                if update.market in self._pending:
+                    self.dropped += 1
+                self._pending[update.market] = update
+            self._condition.notify()
+            waiters, self._async_waiters = self._async_waiters, []
+        self._wake_async(waiters)
+
+    @staticmethod
+    def _wake_async(waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]) -> None:
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:  # 이미 닫힌 이벤트 루프
+                pass
+
+    def _pop(self) -> Optional[PriceUpdate]:
+        if self._backlog:
+            return self._backlog.popleft()
+        if not self._pending:
+            return None
+        market = next(iter(self._pending))
+        return self._pending.pop(market)
+
+    def get(self, timeout: Optional[float] = None) -> Optional[PriceUpdate]:
+        """
+        다음 가격 갱신을 반환
+
+        Args:
+            timeout (float, optional): 최대 대기 시간(초), None이면 갱신이 올 때까지 대기
+
+        Returns:
+            PriceUpdate: 가격 갱신
+            None: 시간 초과 또는 구독 종료시
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not self._pending and not self._backlog and not self.closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._condition.wait(remaining)
+            return self._pop()
+
+    def __iter__(self):
+        while True:
+            update = self.get()
+            if update is None:
+                return
+            yield update
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> PriceUpdate:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._condition:
+                update = self._pop()
+                if update is not None:
+                    return update
+                if self.closed:
+                    raise StopAsyncIteration
+                event = asyncio.Event()
+                self._async_waiters.append((loop, event))
+            await event.wait()
+
+    def close(self) -> None:
+        """구독을 해지 (대기 중인 호출자는 None/반복 종료)"""
+        self.hub.unsubscribe(self)
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        self._wake_async(waiters)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class PriceHub:
+    """
+    현재가 발행/구독 허브
+
+    Args:
+        source (str): 'poll'(현재가 API 주기 조회) 또는 'stream'(WebSocket 체결 시세)
+        interval (float): 폴링 간격(초), 스트림 모드에서는 구독 변경 확인 간격
+        fetcher (Callable, optional): 폴링 모드에서 여러 마켓 현재가를 조회하는 함수
+        stream_factory (Callable, optional): 스트림 모드에서 마켓 목록으로 TickerStream을 만드는 함수
+    """
+
+    def __init__(self, source: str = PRICE_HUB_SOURCE, interval: float = PRICE_HUB_POLL_INTERVAL,
+                 fetcher: Optional[Callable[[List[str]], Dict[str, float]]] = None,
+                 stream_factory: Optional[Callable[[List[str]], object]] = None):
+        if source not in (SOURCE_POLL, SOURCE_STREAM):
+            raise ValueError(f"지원하지 않는 시세원: {source}")
+        self.source = source
+        self.interval = interval
+        self.fetcher = fetcher
+        self.stream_factory = stream_factory
+        self._subscriptions: List[Subscription] = []
+        self._latest: Dict[str, PriceUpdate] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+        self._poll_rounds = 0  # 끝난 폴링 조회 횟수 (snapshot이 조회 실패를 알아채는 데 사용)
+        self._stats = {'upstream_requests': 0, 'published': 0}
+
+    def subscribe(self, markets: Iterable[str],
+                  callback: Optional[Callable[[PriceUpdate], None]] = None,
+                  conflate: bool = True) -> Subscription:
+        """
+        마켓 가격 갱신을 구독
+
+        Args:
+            markets (Iterable[str]): 구독할 마켓 코드
+            callback (Callable, optional): 갱신마다 호출할 함수 (구독별 전용 스레드에서 호출)
+            conflate (bool): True면 읽기 전에 온 갱신을 마켓별 최신 값으로 덮어씀,
+                             False면 모든 갱신을 순서대로 받음
+
+        Returns:
+            Subscription: 구독 (get / for / async for로 갱신을 읽고 close로 해지)
+        """
+        subscription = Subscription(self, markets, conflate)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PriceHub가 종료되었습니다")
+            self._subscriptions.append(subscription)
+            # 이미 받은 가격이 있으면 바로 전달
+            for market in subscription.markets:
+                if market in self._latest:
+                    subscription._offer(self._latest[market])
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="price-hub", daemon=True)
+                self._worker.start()
+        self._wakeup.set()
+
+        if callback is not None:
+            threading.Thread(
+                target=self._dispatch, args=(subscription, callback), name="price-hub-callback", daemon=True
+            ).start()
+        return subscription
+
+    @staticmethod
+    def _dispatch(subscription: Subscription, callback: Callable[[PriceUpdate], None]) -> None:
+        for update in subscription:
+            try:
+                callback(update)
+            except Exception as e:
+                print(f"❌ 가격 구독 콜백 오류: {e}")
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """구독을 허브에서 제거"""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def get_markets(self) -> List[str]:
+        """현재 구독 중인 모든 마켓 코드 (정렬됨)"""
+        with self._lock:
+            return sorted(set().union(*(s.markets for s in self._subscriptions)))
+
+    def get_latest(self, market: str) -> Optional[PriceUpdate]:
+        """마켓의 마지막 가격 갱신을 반환 (아직 없으면 None)"""
+        with self._lock:
+            return self._latest.get(market)
+
+    def snapshot(self, markets: Iterable[str],
+                 timeout: float = PRICE_HUB_SNAPSHOT_TIMEOUT) -> Dict[str, float]:
+        """
+        마켓들의 현재가를 한 번 받아 반환 (잠시 구독했다가 해지)
+        같은 허브의 다른 구독자와 상위 조회를 함께 쓰며, 오래된 가격은 쓰지 않음
+        폴링 모드에서는 구독 마켓이 포함된 조회가 한 번 끝나면 받지 못한 마켓을 더 기다리지 않음
+
+        Args:
+            markets (Iterable[str]): 조회할 마켓 코드
+            timeout (float): 최대 대기 시간(초)
+
+        Returns:
+            Dict[str, float]: 마켓별 가격 (받지 못한 마켓은 빠짐)
+        """
+        wanted = set(markets)
+        prices: Dict[str, float] = {}
+        if not wanted:
+            return prices
+
+        deadline = time.monotonic() + timeout
+        fresh_after = time.time() - self.interval
+        with self._lock:
+            # 구독 시점에 진행 중인 조회에는 새 마켓이 빠져 있을 수 있으므로 그 다음 조회까지 기다림
+            last_round = self._poll_rounds + 2
+        with self.subscribe(wanted) as subscription:
+            while len(prices) < len(wanted):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                update = subscription.get(timeout=min(remaining, 0.05))
+                if update is not None:
+                    if update.timestamp >= fresh_after:
+                        prices[update.market] = update.price
+                elif self.source == SOURCE_POLL and self._poll_rounds >= last_round:
+                    break
+        return prices
+
+    def publish(self, market: str, price: float) -> None:
+        """
+        가격 갱신을 해당 마켓 구독자들에게 전달
+
+        Args:
+            market (str): 마켓 코드
+            price (float): 가격
+        """
+        update = PriceUpdate(market, price, time.time())
+        with self._lock:
+            self._latest[market] = update
+            self._stats['published'] += 1
+            subscribers = [s for s in self._subscriptions if market in s.markets]
+        for subscription in subscribers:
+            subscription._offer(update)
+
+    def _fetch(self, markets: List[str]) -> Dict[str, float]:
+        if self.fetcher is not None:
+            return self.fetcher(markets)
+        from utils.api_client import get_current_prices_with_rejected
+        return get_current_prices_with_rejected(markets)[0]
+
+    def _open_stream(self, markets: List[str]):
+        if self.stream_factory is not None:
+            return self.stream_factory(markets)
+        from utils.websocket_client import TickerStream
+        return TickerStream(markets)
+
+    def _run(self) -> None:
+        if self.source == SOURCE_STREAM:
+            self._run_stream()
+        else:
+            self._run_poll()
+
+    def _run_poll(self) -> None:
+        while not self._closed:
+            self._wakeup.clear()
+            markets = self.get_markets()
+            if markets:
+                try:
+                    prices = self._fetch(markets)
+                except Exception as e:
+                    print(f"❌ 가격 허브 조회 실패: {e}")
+                    prices = {}
+                for market, price in prices.items():
+                    self.publish(market, price)
+                with self._lock:
+                    self._stats['upstream_requests'] += 1
+                    self._poll_rounds += 1
+                self._wakeup.wait(self.interval)
+            else:
+                self._wakeup.wait()
+
+    def _run_stream(self) -> None:
+        stream = None
+        stream_markets: List[str] = []
+        try:
+            while not self._closed:
+                self._wakeup.clear()
+                markets = self.get_markets()
+                if markets != stream_markets:
+                    # 구독 마켓이 바뀌면 새 목록으로 다시 구독
+                    if stream is not None:
+                        stream.close()
+                    stream = self._open_stream(markets) if markets else None
+                    stream_markets = markets
+                    if stream is not None:
+                        with self._lock:
+                            self._stats['upstream_requests'] += 1
+
+                if stream is None:
+                    self._wakeup.wait()
+                    continue
+
+                tick = stream.read_tick(timeout=self.interval)
+                if tick is not None:
+                    self.publish(tick['market'], float(tick['trade_price']))
+        finally:
+            if stream is not None:
+                stream.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        허브 통계를 반환
+
+        Returns:
+            Dict[str, int]: upstream_requests(폴링 조회/스트림 구독 수), published(발행한 갱신 수),
+                            subscribers(구독 수), dropped(느린 구독자에서 덮어쓴 갱신 수)
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['subscribers'] = len(self._subscriptions)
+            stats['dropped'] = sum(s.dropped for s in self._subscriptions)
+        return stats
+
+    def close(self) -> None:
+        """모든 구독을 닫고 상위 시세원을 종료"""
+        with self._lock:
+            self._closed = True
+            subscriptions = list(self._subscriptions)
+            worker = self._worker
+        for subscription in subscriptions:
+            subscription.close()
+        self._wakeup.set()
+        if worker is not None:
+            worker.join(self.interval + 1)
+
+
+_price_hubs: Dict[str, PriceHub] = {}
+_price_hub_lock = threading.Lock()
+
+
+def get_price_hub(source: Optional[str] = None) -> PriceHub:
+    """
+    프로세스 전역 가격 허브를 반환 (시세원별로 하나씩, 최초 호출시 생성)
+
+    Args:
+        source (str, optional): 'poll' 또는 'stream', None이면 PRICE_HUB_SOURCE 설정
+
+    Returns:
+        PriceHub: 해당 시세원의 허브
+    """
+    source = source or PRICE_HUB_SOURCE
+    with _price_hub_lock:
+        if source not in _price_hubs:
+            _price_hubs[source] = PriceHub(source)
+        return _price_hubs[source]
+
+
+def set_price_hub(price_hub: Optional[PriceHub], source: Optional[str] = None) -> Optional[PriceHub]:
+    """
+    프로세스 전역 가격 허브를 교체
+
+    Args:
+        price_hub (PriceHub, optional): 새 허브 (None이면 다음 호출시 기본 설정으로 생성)
+        source (str, optional): 교체할 시세원, None이면 새 허브의 시세원 또는 PRICE_HUB_SOURCE 설정
+
+    Returns:
+        PriceHub: 이전 허브
+    """
+    source = source or (price_hub.source if price_hub is not None else PRICE_HUB_SOURCE)
+    with _price_hub_lock:
+        previous = _price_hubs.pop(source, None)
+        if price_hub is not None:
+            _price_hubs[source] = price_hub
+        return previous
+
+
+def close_price_hubs() -> None:
+    """모든 전역 가격 허브를 닫고 비움 (다음 호출시 새로 생성)"""
+    with _price_hub_lock:
+        hubs = list(_price_hubs.values())
+        _price_hubs.clear()
+    for hub in hubs:
+        hub.close()
@@ -0,0 +1,232 @@
+"""
+API 요청 속도 제한 유틸리티
+엔드포인트 그룹별 토큰 버킷으로 요청을 대기열에 세우고,
+업비트 Remaining-Req 응답 헤더를 반영하여 남은 요청 수를 조정
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from config.settings import (
+    RATE_LIMITS,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_BLOCK_SECONDS
+)
+
+
+def get_endpoint_group(url: str) -> str:
+    """
+    요청 URL이 속한 업비트 요청 제한 그룹을 반환
+
+    Args:
+        url (str): API URL
+
+    Returns:
+        str: 'ticker', 'candles', 'market', 'default' 중 하나
+    """
+    path = urlparse(url).path
+    if path.endswith('/ticker'):
+        return 'ticker'
+    if '/candles/' in path:
+        return 'candles'
+    if '/market/' in path:
+        return 'market'
+    return 'default'
+
+
+def parse_remaining_req(header: Optional[str]) -> Optional[Dict[str, str]]:
+    """
+    Remaining-Req 헤더를 파싱 (예: 'group=default; min=1800; sec=29')
+
+    Args:
+        header (str, optional): Remaining-Req 헤더 값
+
+    Returns:
+        Dict[str, str]: {'group': 'default', 'min': '1800', 'sec': '29'}
+        None: 헤더가 없거나 형식이 잘못된 경우
+    """
+    if not header:
+        return None
+
+    values: Dict[str, str] = {}
+    for part in header.split(';'):
+        key, _, value = part.strip().partition('=')
+        if key and value:
+            values[key] = value
+    return values if 'sec' in values else None
+
+
+class TokenBucket:
+    """
+    예약 방식의 토큰 버킷
+    토큰이 부족하면 음수로 예약하여 호출자가 도착 순서대로 대기하게 함
+
+    Args:
+        rate (float): 초당 허용 요청 수
+        capacity (float): 한 번에 몰아서 보낼 수 있는 최대 요청 수
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 기다려야 하는 시간을 반환
+
+        Returns:
+            float: 요청 전에 대기해야 하는 시간(초)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def limit_remaining(self, remaining: int) -> None:
+        """
+        서버가 알려준 남은 요청 수보다 많은 토큰을 갖지 않도록 조정
+
+        Args:
+            remaining (int): 현재 구간에 남은 요청 수
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, float(remaining))
+
+    def block(self, seconds: float) -> None:
+        """
+        지정한 시간 동안 새 토큰이 생기지 않도록 버킷을 비움
+
+        Args:
+            seconds (float): 차단할 시간(초)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RateLimiter:
+    """
+    엔드포인트 그룹별 토큰 버킷 모음 (스레드/asyncio 공용)
+
+    Args:
+        limits (Dict[str, float]): 그룹별 초당 요청 수
+        burst (float): 그룹별 최대 연속 요청 수
+    """
+
+    def __init__(self, limits: Optional[Dict[str, float]] = None, burst: float = RATE_LIMIT_BURST):
+        self.limits: Dict[str, float] = dict(RATE_LIMITS) if limits is None else dict(limits)
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.throttled = 0
+
+    def _get_bucket(self, group: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(group)
+            if bucket is None:
+                rate = self.limits.get(group, self.limits.get('default', 8))
+                bucket = TokenBucket(rate, min(self.burst, rate))
+                self._buckets[group] = bucket
+            return bucket
+
+    def acquire(self, group: str) -> float:
+        """
+        요청 슬롯을 얻을 때까지 현재 스레드를 대기
+
+        Args:
+            group (str): 엔드포인트 그룹
+
+        Returns:
+            float: 실제로 대기한 시간(초)
+        """
+        wait = self._get_bucket(group).reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, group: str) -> float:
+        """
+        요청 슬롯을 얻을 때까지 이벤트 루프를 막지 않고 대기
+
+        Args:
+            group (str): 엔드포인트 그룹
+
+        Returns:
+            float: 실제로 대기한 시간(초)
+        """
+        wait = self._get_bucket(group).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def observe(self, group: str, status_code: int, remaining_header: Optional[str]) -> None:
+        """
+        응답 상태와 Remaining-Req 헤더를 버킷에 반영
+        헤더에 group 값이 있으면 URL로 추정한 그룹 대신 서버가 알려준 그룹의 버킷을 조정
+
+        Args:
+            group (str): URL로 추정한 엔드포인트 그룹
+            status_code (int): HTTP 상태 코드
+            remaining_header (str, optional): Remaining-Req 헤더 값
+        """
+        remaining = parse_remaining_req(remaining_header)
+        if remaining is not None:
+            group = remaining.get('group', group)
+        bucket = self._get_bucket(group)
+
+        if status_code == 429:
+            self.throttled += 1
+            bucket.block(RATE_LIMIT_BLOCK_SECONDS)
+            return
+
+        if remaining is None:
+            return
+
+        try:
+            sec_remaining = int(remaining['sec'])
+        except ValueError:
+            return
+
+        if sec_remaining <= 0:
+            # 현재 1초 구간의 요청을 모두 사용했으므로 다음 구간까지 대기
+            bucket.block(RATE_LIMIT_BLOCK_SECONDS)
+        else:
+            bucket.limit_remaining(sec_remaining)
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 전역 요청 속도 제한기를 반환"""
+    return _rate_limiter
+
+
+def set_rate_limiter(rate_limiter: RateLimiter) -> RateLimiter:
+    """
+    프로세스 전역 요청 속도 제한기를 교체
+
+    Args:
+        rate_limiter (RateLimiter): 새 속도 제한기
+
+    Returns:
+        RateLimiter: 이전 속도 제한기
+    """
+    global _rate_limiter
+
+    previous = _rate_limiter
+    _rate_limiter = rate_limiter
+    return previous
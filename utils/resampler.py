@@ -0,0 +1,175 @@
+"""
+분봉 리샘플링 엔진
+1분봉을 한 번 받아 5분/15분/1시간/4시간/일/주 캔들을 로컬에서 만들고,
+새 1분봉이 들어오면 마지막 캔들만 갱신 (전체를 다시 계산하지 않음)
+"""
+
+import threading
+from array import array
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from config.settings import RESAMPLE_TIMEFRAMES
+from utils.candle_series import Candle, CandleSeries
+
+# 시간 단위별 길이(초)
+TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "5m": 5 * 60,
+    "15m": 15 * 60,
+    "1h": 60 * 60,
+    "4h": 4 * 60 * 60,
+    "1d": 24 * 60 * 60,
+    "1w": 7 * 24 * 60 * 60,
+}
+
+# 1970-01-01은 목요일이므로 주봉은 4일 밀어서 월요일 00:00 UTC(09:00 KST)에 시작
+_WEEK_OFFSET = 4 * 24 * 60 * 60
+
+
+def bucket_start(timestamp: int, seconds: int) -> int:
+    """
+    시각이 속한 캔들의 시작 시각을 반환
+    일봉 이하는 UTC 00:00(= KST 09:00) 기준, 주봉은 월요일 기준 (업비트 캔들과 같은 경계)
+
+    Args:
+        timestamp (int): UTC epoch 초
+        seconds (int): 캔들 길이(초)
+
+    Returns:
+        int: 캔들 시작 시각 (UTC epoch 초)
+    """
+    offset = _WEEK_OFFSET if seconds == TIMEFRAME_SECONDS["1w"] else 0
+    return (timestamp - offset) // seconds * seconds + offset
+
+
+class _Bars:
+    """시간 단위 하나의 완성된 캔들 배열과 진행 중인 캔들"""
+
+    __slots__ = ("seconds", "timestamps", "open", "high", "low", "close", "volume", "current")
+
+    def __init__(self, seconds: int):
+        self.seconds = seconds
+        self.timestamps = array('q')
+        self.open, self.high, self.low, self.close, self.volume = (array('d') for _ in range(5))
+        self.current: Optional[list] = None  # [시작, 시가, 고가, 저가, 종가, 거래량]
+
+    def fold(self, candle: Candle) -> None:
+        start = bucket_start(candle.timestamp, self.seconds)
+        current = self.current
+        if current is not None and start == current[0]:
+            if candle.high > current[2]:
+                current[2] = candle.high
+            if candle.low < current[3]:
+                current[3] = candle.low
+            current[4] = candle.close
+            current[5] += candle.volume
+            return
+
+        if current is not None:
+            self._close_current(current)
+        self.current = [start, candle.open, candle.high, candle.low, candle.close, candle.volume]
+
+    def _close_current(self, current: list) -> None:
+        start, opening, high, low, close, volume = current
+        self.timestamps.append(start)
+        self.open.append(opening)
+        self.high.append(high)
+        self.low.append(low)
+        self.close.append(close)
+        self.volume.append(volume)
+
+    def copy(self) -> "_Bars":
+        bars = _Bars(self.seconds)
+        for name in ("timestamps", "open", "high", "low", "close", "volume"):
+            setattr(bars, name, array(getattr(self, name).typecode, getattr(self, name)))
+        bars.current = list(self.current) if self.current is not None else None
+        return bars
+
+    def to_series(self, market: str, timeframe: str) -> CandleSeries:
+        # 진행 중인 캔들까지 포함 (이 객체는 copy()로 만든 것이므로 배열을 넘겨도 됨)
+        if self.current is not None:
+            self._close_current(self.current)
+            self.current = None
+        return CandleSeries(market, timeframe, self.timestamps, self.open, self.high,
+                            self.low, self.close, self.volume)
+
+
+class CandleResampler:
+    """
+    1분봉으로 여러 시간 단위 캔들을 만드는 리샘플러
+
+    - add(): 1분봉을 과거순으로 추가 (이미 반영한 분은 건너뛰고, 마지막 분은 새 값으로 교체)
+    - series(timeframe): 해당 시간 단위 캔들 시계열 (진행 중인 마지막 캔들 포함)
+
+    마지막 1분봉은 아직 진행 중일 수 있으므로 다음 분이 들어올 때 확정하여 반영함
+
+    Args:
+        market (str): 마켓 코드
+        timeframes (Tuple[str, ...]): 만들 시간 단위 (TIMEFRAME_SECONDS의 키)
+    """
+
+    def __init__(self, market: str, timeframes: Tuple[str, ...] = RESAMPLE_TIMEFRAMES):
+        unknown = [timeframe for timeframe in timeframes if timeframe not in TIMEFRAME_SECONDS]
+        if unknown:
+            raise ValueError(f"지원하지 않는 시간 단위: {', '.join(unknown)}")
+        self.market = market
+        self.timeframes = tuple(timeframes)
+        self.first_timestamp: Optional[int] = None
+        self._bars: Dict[str, _Bars] = {
+            timeframe: _Bars(TIMEFRAME_SECONDS[timeframe]) for timeframe in self.timeframes
+        }
+        self._pending: Optional[Candle] = None
+        self._lock = threading.Lock()
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """마지막으로 받은 1분봉의 시작 시각 (없으면 None)"""
+        pending = self._pending
+        return pending.timestamp if pending is not None else None
+
+    def add(self, candles: Union[CandleSeries, Iterable[Candle]]) -> int:
+        """
+        1분봉을 추가
+
+        Args:
+            candles (CandleSeries | Iterable[Candle]): 과거순 1분봉
+
+        Returns:
+            int: 새로 반영한 분 수 (마지막 분 교체 포함)
+        """
+        added = 0
+        with self._lock:
+            for candle in candles:
+                pending = self._pending
+                if pending is None:
+                    self.first_timestamp = candle.timestamp
+                elif candle.timestamp > pending.timestamp:
+                    for bars in self._bars.values():
+                        bars.fold(pending)
+                elif candle.timestamp < pending.timestamp:
+                    continue  # 이미 반영한 분
+                self._pending = candle
+                added += 1
+        return added
+
+    def series(self, timeframe: str) -> CandleSeries:
+        """
+        시간 단위 캔들 시계열을 반환
+
+        Args:
+            timeframe (str): 시간 단위 (예: '15m', '1h', '1d')
+
+        Returns:
+            CandleSeries: 과거순 캔들 (마지막 캔들은 진행 중일 수 있음)
+
+        Raises:
+            ValueError: 리샘플러가 만들지 않는 시간 단위인 경우
+        """
+        if timeframe not in self._bars:
+            raise ValueError(f"리샘플링하지 않는 시간 단위: {timeframe} (사용 가능: {', '.join(self.timeframes)})")
+
+        with self._lock:
+            bars = self._bars[timeframe].copy()
+            if self._pending is not None:
+                bars.fold(self._pending)
+        return bars.to_series(self.market, timeframe)
@@ -0,0 +1,262 @@
+"""
+API 재시도 정책 및 회로 차단기
+오류를 분류하여 재시도 여부를 정하고(지수 백오프 + 지터, 전체 마감 시간),
+장애가 이어지는 엔드포인트는 일정 시간 동안 요청을 바로 실패시킴
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from config.settings import (
+    MAX_RETRIES,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    RETRY_MAX_ELAPSED,
+    RETRY_JITTER,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RECOVERY_TIMEOUT
+)
+
+# 응답을 받지 못했지만 다시 시도하면 성공할 수 있는 오류
+_TRANSIENT_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.InvalidJSONError  # 본문이 잘린 응답
+)
+
+
+def get_error_status(error: Exception) -> Optional[int]:
+    """
+    요청 예외에서 HTTP 상태 코드를 추출
+
+    Args:
+        error (Exception): 요청 중 발생한 예외
+
+    Returns:
+        int: HTTP 상태 코드
+        None: 응답을 받지 못한 경우 (연결 실패, 타임아웃 등)
+    """
+    response = getattr(error, 'response', None)
+    return response.status_code if response is not None else None
+
+
+class RetryPolicy:
+    """
+    요청 재시도 정책
+
+    Args:
+        max_retries (int): 최대 시도 횟수 (첫 시도 포함)
+        base_delay (float): 첫 재시도 대기 시간(초), 이후 2배씩 증가
+        max_delay (float): 재시도 한 번의 최대 대기 시간(초)
+        max_elapsed (float): 첫 시도부터 포기까지의 최대 시간(초)
+        jitter (float): 대기 시간을 무작위로 줄이는 비율 (0: 없음, 1: 0~대기 시간 전체)
+    """
+
+    def __init__(self, max_retries: int = MAX_RETRIES, base_delay: float = RETRY_BASE_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY, max_elapsed: float = RETRY_MAX_ELAPSED,
+                 jitter: float = RETRY_JITTER):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.jitter = jitter
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        다시 시도할 가치가 있는 오류인지 분류
+
+        Args:
+            error (Exception): 요청 중 발생한 예외
+
+        Returns:
+            bool: 429, 5xx, 연결 실패, 타임아웃이면 True / 그 외 4xx 등은 False
+        """
+        status = get_error_status(error)
+        if status is not None:
+            return status == 429 or status >= 500
+        return isinstance(error, _TRANSIENT_ERRORS)
+
+    def is_upstream_failure(self, error: Exception) -> bool:
+        """
+        서버 장애로 볼 수 있는 오류인지 확인 (회로 차단기 집계용)
+
+        Args:
+            error (Exception): 요청 중 발생한 예외
+
+        Returns:
+            bool: 5xx, 연결 실패, 타임아웃이면 True (4xx, 429는 서버가 살아있는 것)
+        """
+        status = get_error_status(error)
+        if status is not None:
+            return status >= 500
+        return isinstance(error, _TRANSIENT_ERRORS)
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        재시도 전 대기 시간을 계산 (지수 백오프 + 지터)
+
+        Args:
+            attempt (int): 실패한 시도 번호 (0부터 시작)
+
+        Returns:
+            float: 대기 시간(초)
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (1 - self.jitter * random.random())
+
+    def get_retry_delay(self, attempt: int, error: Exception, started_at: float) -> Optional[float]:
+        """
+        재시도 여부와 대기 시간을 결정
+
+        Args:
+            attempt (int): 실패한 시도 번호 (0부터 시작)
+            error (Exception): 요청 중 발생한 예외
+            started_at (float): 첫 시도 시각 (time.monotonic 기준)
+
+        Returns:
+            float: 재시도 전 대기 시간(초)
+            None: 재시도하지 않음 (재시도 불가 오류, 횟수 초과, 마감 시간 초과)
+        """
+        if not self.is_retryable(error) or attempt >= self.max_retries - 1:
+            return None
+
+        delay = self.get_backoff(attempt)
+        if time.monotonic() + delay - started_at > self.max_elapsed:
+            return None
+        return delay
+
+
+class CircuitBreaker:
+    """
+    엔드포인트별 회로 차단기
+
+    - closed: 정상, 연속 실패가 failure_threshold에 도달하면 open
+    - open: recovery_timeout 동안 요청을 바로 실패시킴
+    - half_open: 복구 확인용 요청 하나만 허용, 성공하면 closed / 실패하면 다시 open
+
+    Args:
+        failure_threshold (int): open으로 바뀌는 연속 실패 횟수
+        recovery_timeout (float): open 상태 유지 시간(초)
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                 recovery_timeout: float = CIRCUIT_BREAKER_RECOVERY_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        요청을 보내도 되는지 확인 (half_open에서는 한 요청만 통과)
+
+        Returns:
+            bool: 요청 허용 여부
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """요청 성공을 기록하고 회로를 닫음"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """서버 장애로 인한 실패를 기록"""
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """성공/실패로 판단할 수 없는 응답(429 등) 후 복구 확인 슬롯을 반납"""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+_retry_policy = RetryPolicy()
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """프로세스 전역 재시도 정책을 반환"""
+    return _retry_policy
+
+
+def set_retry_policy(retry_policy: RetryPolicy) -> RetryPolicy:
+    """
+    프로세스 전역 재시도 정책을 교체
+
+    Args:
+        retry_policy (RetryPolicy): 새 재시도 정책
+
+    Returns:
+        RetryPolicy: 이전 재시도 정책
+    """
+    global _retry_policy
+
+    previous = _retry_policy
+    _retry_policy = retry_policy
+    return previous
+
+
+def get_circuit_breaker(url: str, group: str) -> CircuitBreaker:
+    """
+    호스트와 엔드포인트 그룹별 회로 차단기를 반환 (없으면 생성)
+
+    Args:
+        url (str): 요청 URL
+        group (str): 엔드포인트 그룹 (예: 'ticker', 'candles')
+
+    Returns:
+        CircuitBreaker: 회로 차단기
+    """
+    key = f"{urlparse(url).netloc}/{group}"
+    with _breakers_lock:
+        breaker = _circuit_breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            _circuit_breakers[key] = breaker
+        return breaker
+
+
+def get_circuit_breaker_states() -> Dict[str, str]:
+    """엔드포인트별 회로 차단기 상태를 반환 (예: {'api.upbit.com/ticker': 'closed'})"""
+    with _breakers_lock:
+        return {key: breaker.state for key, breaker in _circuit_breakers.items()}
+
+
+def reset_circuit_breakers() -> None:
+    """모든 회로 차단기를 초기화"""
+    with _breakers_lock:
+        _circuit_breakers.clear()
@@ -0,0 +1,183 @@
+"""
+API 요청 전송 계층(transport) 유틸리티
+API 클라이언트는 전송 방식과 무관하게 Transport.get()으로 응답을 받음
+전역 기본값(API_TRANSPORT)을 두고, 호출마다 다른 전송 방식을 넘겨 같은 작업으로 비교할 수 있음
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+from config.settings import API_TRANSPORT, REQUEST_TIMEOUT
+from utils.http_session import get_session
+from utils.cassette import MODE_REPLAY, Cassette
+
+
+class Transport(ABC):
+    """
+    API 요청 전송 방식의 기본 클래스
+
+    하위 클래스는 get()을 구현하여 requests.Response를 반환하고,
+    연결 실패 등은 requests.exceptions.RequestException으로 알려야 함
+    """
+
+    name = "base"
+
+    @property
+    def rate_limited(self) -> bool:
+        """실제 서버로 요청을 보내는지 여부 (False면 속도 제한을 적용하지 않음)"""
+        return True
+
+    @abstractmethod
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            timeout: float = REQUEST_TIMEOUT) -> requests.Response:
+        """
+        GET 요청을 보내고 응답을 반환
+
+        Args:
+            url (str): 요청 URL
+            params (dict, optional): 요청 파라미터
+            timeout (float): 요청 제한 시간(초)
+
+        Returns:
+            requests.Response: 받은 응답 (상태 코드 확인은 호출부에서 수행)
+
+        Raises:
+            requests.exceptions.RequestException: 요청 실패시
+        """
+
+    def close(self) -> None:
+        """전송 방식이 가진 연결 등을 정리"""
+
+
+class SessionTransport(Transport):
+    """
+    keep-alive 연결 풀을 재사용하는 전송 방식 (기본값)
+
+    Args:
+        session (requests.Session, optional): 사용할 세션 (기본값: 프로세스 전역 공유 세션)
+    """
+
+    name = "session"
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            timeout: float = REQUEST_TIMEOUT) -> requests.Response:
+        session = self.session or get_session()
+        return session.get(url, params=params, timeout=timeout)
+
+    def close(self) -> None:
+        # 공유 세션은 http_session 모듈이 정리하므로 직접 받은 세션만 닫음
+        if self.session is not None:
+            self.session.close()
+
+
+class PlainTransport(Transport):
+    """
+    요청마다 새 연결을 여는 전송 방식 (연결 재사용 효과를 비교하기 위한 기준)
+    """
+
+    name = "plain"
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            timeout: float = REQUEST_TIMEOUT) -> requests.Response:
+        return requests.get(url, params=params, timeout=timeout,
+                            headers={"Accept": "application/json", "Connection": "close"})
+
+
+class CassetteTransport(Transport):
+    """
+    cassette 기록/재생 전송 방식
+
+    - record 모드: 내부 전송 방식으로 요청하고 응답을 cassette에 기록
+    - replay 모드: 네트워크 없이 기록된 응답을 반환 (속도 제한을 적용하지 않음)
+
+    Args:
+        cassette (Cassette): 기록/재생할 cassette
+        inner (Transport, optional): 기록 모드에서 실제로 요청할 전송 방식 (기본값: 전역 전송 방식)
+    """
+
+    name = "cassette"
+
+    def __init__(self, cassette: Cassette, inner: Optional[Transport] = None):
+        self.cassette = cassette
+        self.inner = inner
+
+    @property
+    def rate_limited(self) -> bool:
+        return self.cassette.mode != MODE_REPLAY
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            timeout: float = REQUEST_TIMEOUT) -> requests.Response:
+        if self.cassette.mode == MODE_REPLAY:
+            return self.cassette.replay(url, params)
+
+        response = (self.inner or get_transport()).get(url, params, timeout)
+        self.cassette.record(url, params, response)
+        return response
+
+
+# API_TRANSPORT 설정값으로 선택할 수 있는 전송 방식
+TRANSPORTS: Dict[str, Callable[[], Transport]] = {
+    SessionTransport.name: SessionTransport,
+    PlainTransport.name: PlainTransport,
+}
+
+
+def create_transport(name: str) -> Transport:
+    """
+    이름으로 전송 방식을 생성
+
+    Args:
+        name (str): 전송 방식 이름 ('session', 'plain')
+
+    Returns:
+        Transport: 생성된 전송 방식
+
+    Raises:
+        ValueError: 지원하지 않는 이름인 경우
+    """
+    factory = TRANSPORTS.get(name)
+    if factory is None:
+        raise ValueError(f"지원하지 않는 전송 방식: {name} (사용 가능: {', '.join(TRANSPORTS)})")
+    return factory()
+
+
+_transport: Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> Transport:
+    """프로세스 전역 전송 방식을 반환 (최초 호출시 API_TRANSPORT 설정으로 생성)"""
+    global _transport
+
+    transport = _transport
+    if transport is not None:
+        return transport
+
+    with _transport_lock:
+        if _transport is None:
+            _transport = create_transport(API_TRANSPORT)
+        return _transport
+
+
+def set_transport(transport: Optional[Transport]) -> Optional[Transport]:
+    """
+    프로세스 전역 전송 방식을 교체
+
+    Args:
+        transport (Transport, optional): 새 전송 방식 (None이면 다음 호출시 설정값으로 생성)
+
+    Returns:
+        Transport: 이전 전송 방식
+    """
+    global _transport
+
+    with _transport_lock:
+        previous = _transport
+        _transport = transport
+        return previous
@@ -0,0 +1,396 @@
+"""
+업비트 WebSocket 시세 스트리밍 클라이언트
+폴링 대신 서버가 보내주는 체결 시세(ticker)를 받아오며,
+연결이 끊기면 다시 연결하고 구독을 복구함 (표준 라이브러리만 사용)
+"""
+
+import base64
+import hashlib
+import json
+import os
+import socket
+import ssl
+import struct
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from config.settings import (
+    UPBIT_WEBSOCKET_URL,
+    REQUEST_TIMEOUT,
+    WEBSOCKET_PING_INTERVAL,
+    WEBSOCKET_RECONNECT_DELAY,
+    WEBSOCKET_MAX_RECONNECT_DELAY
+)
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+_WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class WebSocketError(Exception):
+    """WebSocket 프로토콜 오류"""
+
+
+def _apply_mask(payload: bytes, mask_key: bytes) -> bytes:
+    """RFC 6455 마스킹 (같은 함수로 마스킹/해제 모두 수행)"""
+    if not payload:
+        return payload
+    length = len(payload)
+    repeated = (mask_key * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, 'big') ^ int.from_bytes(repeated, 'big')).to_bytes(length, 'big')
+
+
+def encode_frame(opcode: int, payload: bytes = b"", mask: bool = True) -> bytes:
+    """
+    WebSocket 프레임을 인코딩 (클라이언트 → 서버 프레임은 반드시 마스킹)
+
+    Args:
+        opcode (int): 프레임 종류
+        payload (bytes): 데이터
+        mask (bool): 마스킹 여부
+
+    Returns:
+        bytes: 인코딩된 프레임
+    """
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    length = len(payload)
+
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 65536:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", length)
+
+    if mask:
+        mask_key = os.urandom(4)
+        return bytes(header) + mask_key + _apply_mask(payload, mask_key)
+    return bytes(header) + payload
+
+
+def read_frame(recv_exact: Callable[[int], bytes]) -> Tuple[int, bool, bytes]:
+    """
+    WebSocket 프레임 하나를 읽음
+
+    Args:
+        recv_exact (Callable): 정확히 n바이트를 읽어 반환하는 함수
+
+    Returns:
+        Tuple[int, bool, bytes]: (opcode, FIN 여부, 데이터)
+    """
+    first, second = recv_exact(2)
+    opcode = first & 0x0F
+    fin = bool(first & 0x80)
+    length = second & 0x7F
+
+    if length == 126:
+        length = struct.unpack("!H", recv_exact(2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", recv_exact(8))[0]
+
+    mask_key = recv_exact(4) if second & 0x80 else None
+    payload = recv_exact(length) if length else b""
+    if mask_key:
+        payload = _apply_mask(payload, mask_key)
+    return opcode, fin, payload
+
+
+def create_accept_key(key: str) -> str:
+    """Sec-WebSocket-Key에 대한 Sec-WebSocket-Accept 값을 계산"""
+    digest = hashlib.sha1((key + _WEBSOCKET_GUID).encode()).digest()
+    return base64.b64encode(digest).decode()
+
+
+class WebSocketConnection:
+    """
+    하나의 WebSocket 연결 (핸드셰이크, 프레임 송수신)
+
+    Args:
+        url (str): ws:// 또는 wss:// 주소
+        timeout (float): 연결 및 핸드셰이크 타임아웃(초)
+    """
+
+    def __init__(self, url: str, timeout: float = REQUEST_TIMEOUT):
+        parsed = urlparse(url)
+        secure = parsed.scheme == "wss"
+        host = parsed.hostname or ""
+        port = parsed.port or (443 if secure else 80)
+        path = parsed.path or "/"
+        if parsed.query:
+            path += f"?{parsed.query}"
+
+        sock = socket.create_connection((host, port), timeout=timeout)
+        if secure:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=host)
+        self._sock = sock
+        self._buffer = b""
+
+        try:
+            self._handshake(host, port, path)
+        except Exception:
+            self.close()
+            raise
+
+    def _handshake(self, host: str, port: int, path: str) -> None:
+        key = base64.b64encode(os.urandom(16)).decode()
+        request = (
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        )
+        self._sock.sendall(request.encode())
+
+        while b"\r\n\r\n" not in self._buffer:
+            chunk = self._sock.recv(4096)
+            if not chunk:
+                raise WebSocketError("핸드셰이크 중 연결이 끊겼습니다")
+            self._buffer += chunk
+
+        head, self._buffer = self._buffer.split(b"\r\n\r\n", 1)
+        lines = head.decode("latin-1").split("\r\n")
+        if " 101 " not in f"{lines[0]} ":
+            raise WebSocketError(f"핸드셰이크 실패: {lines[0]}")
+
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if headers.get("sec-websocket-accept") != create_accept_key(key):
+            raise WebSocketError("핸드셰이크 응답 키가 올바르지 않습니다")
+
+    def _recv_exact(self, size: int) -> bytes:
+        while len(self._buffer) < size:
+            chunk = self._sock.recv(max(4096, size - len(self._buffer)))
+            if not chunk:
+                raise WebSocketError("연결이 끊겼습니다")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def send(self, opcode: int, payload: bytes = b"") -> None:
+        """프레임 하나를 전송"""
+        self._sock.sendall(encode_frame(opcode, payload, mask=True))
+
+    def send_text(self, text: str) -> None:
+        """텍스트 메시지를 전송"""
+        self.send(OPCODE_TEXT, text.encode("utf-8"))
+
+    def receive(self, timeout: Optional[float]) -> Tuple[int, bytes]:
+        """
+        메시지 하나를 수신 (조각난 메시지는 합쳐서 반환)
+
+        Args:
+            timeout (float, optional): 첫 바이트를 기다릴 최대 시간(초)
+
+        Returns:
+            Tuple[int, bytes]: (opcode, 데이터)
+
+        Raises:
+            socket.timeout: timeout 동안 아무 프레임도 오지 않은 경우
+        """
+        if not self._buffer:
+            self._sock.settimeout(timeout)
+            chunk = self._sock.recv(4096)
+            if not chunk:
+                raise WebSocketError("연결이 끊겼습니다")
+            self._buffer += chunk
+
+        # 프레임이 시작된 뒤에는 나머지를 끝까지 읽음
+        self._sock.settimeout(REQUEST_TIMEOUT)
+        opcode, fin, payload = read_frame(self._recv_exact)
+        while not fin:
+            _, fin, more = read_frame(self._recv_exact)
+            payload += more
+        return opcode, payload
+
+    def close(self) -> None:
+        """연결 종료 (close 프레임 전송 후 소켓 정리)"""
+        try:
+            self._sock.sendall(encode_frame(OPCODE_CLOSE, struct.pack("!H", 1000), mask=True))
+        except OSError:
+            pass
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+
+
+class TickerStream:
+    """
+    업비트 WebSocket 체결 시세 구독 스트림
+
+    - 연결이 끊기거나 응답이 없으면 지수 백오프로 다시 연결하고 같은 구독을 다시 요청
+    - ping_interval 동안 메시지가 없으면 ping을 보내고, 다음 구간에도 응답이 없으면 재연결
+
+    Args:
+        markets (List[str]): 구독할 마켓 코드 리스트
+        url (str, optional): WebSocket 주소 (기본값: UPBIT_WEBSOCKET_URL)
+        ping_interval (float): 유휴 상태 확인 간격(초)
+        reconnect_delay (float): 첫 재연결 대기 시간(초)
+        max_reconnect_delay (float): 최대 재연결 대기 시간(초)
+    """
+
+    def __init__(self, markets: List[str], url: Optional[str] = None,
+                 ping_interval: float = WEBSOCKET_PING_INTERVAL,
+                 reconnect_delay: float = WEBSOCKET_RECONNECT_DELAY,
+                 max_reconnect_delay: float = WEBSOCKET_MAX_RECONNECT_DELAY):
+        self.markets = list(markets)
+        self.url = url or UPBIT_WEBSOCKET_URL
+        self.ping_interval = ping_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.connections = 0
+        self.reconnects = 0
+        self._connection: Optional[WebSocketConnection] = None
+        self._closed = False
+        self._ping_pending = False
+        self._failures = 0
+        self._next_connect_at = 0.0
+
+    def _subscription_message(self) -> str:
+        return json.dumps([
+            {"ticket": str(uuid.uuid4())},
+            {"type": "ticker", "codes": self.markets, "isOnlyRealtime": True}
+        ])
+
+    def _connect(self) -> bool:
+        """연결 및 구독을 시도하고 실패하면 다음 시도 시각을 예약"""
+        try:
+            connection = WebSocketConnection(self.url)
+            connection.send_text(self._subscription_message())
+        except (OSError, WebSocketError) as e:
+            self._failures += 1
+            delay = min(self.max_reconnect_delay, self.reconnect_delay * (2 ** (self._failures - 1)))
+            self._next_connect_at = time.monotonic() + delay
+            print(f"⚠️  WebSocket 연결 실패 ({e}), {delay:.1f}초 후 재시도")
+            return False
+
+        if self.connections > 0:
+            self.reconnects += 1
+        self.connections += 1
+        self._connection = connection
+        self._failures = 0
+        self._ping_pending = False
+        return True
+
+    def _drop(self) -> None:
+        """현재 연결을 버리고 재연결을 예약"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._next_connect_at = time.monotonic() + self.reconnect_delay
+
+    @staticmethod
+    def _normalize(message: Dict) -> Optional[Dict]:
+        """시세 메시지에 'market' 키를 추가 (ticker가 아니면 None)"""
+        market = message.get('code') or message.get('cd')
+        if not market:
+            return None
+        tick = dict(message)
+        tick['market'] = market
+        if 'trade_price' not in tick and 'tp' in tick:
+            tick['trade_price'] = tick['tp']
+        return tick
+
+    def read_tick(self, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        다음 체결 시세를 기다려 반환
+
+        Args:
+            timeout (float, optional): 최대 대기 시간(초), None이면 시세가 올 때까지 대기
+
+        Returns:
+            Dict: 시세 메시지 ('market', 'trade_price' 포함)
+            None: timeout 동안 시세가 없거나 스트림이 닫힌 경우
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while not self._closed:
+            now = time.monotonic()
+            remaining = None if deadline is None else deadline - now
+            if remaining is not None and remaining <= 0:
+                return None
+
+            if self._connection is None:
+                wait = self._next_connect_at - now
+                if wait > 0:
+                    time.sleep(wait if remaining is None else min(wait, remaining))
+                    continue
+                self._connect()
+                continue
+
+            wait = self.ping_interval if remaining is None else min(self.ping_interval, remaining)
+            try:
+                opcode, payload = self._connection.receive(wait)
+            except socket.timeout:
+                if remaining is not None and wait >= remaining:
+                    return None
+                if self._ping_pending:
+                    print("⚠️  WebSocket 응답이 없어 다시 연결합니다")
+                    self._drop()
+                else:
+                    self._ping_pending = True
+                    try:
+                        self._connection.send(OPCODE_PING)
+                    except OSError:
+                        self._drop()
+                continue
+            except (OSError, WebSocketError):
+                self._drop()
+                continue
+
+            self._ping_pending = False
+
+            if opcode == OPCODE_PING:
+                try:
+                    self._connection.send(OPCODE_PONG, payload)
+                except OSError:
+                    self._drop()
+                continue
+            if opcode == OPCODE_CLOSE:
+                self._drop()
+                continue
+            if opcode not in (OPCODE_TEXT, OPCODE_BINARY):
+                continue
+
+            try:
+                message = json.loads(payload)
+            except ValueError:
+                continue
+            tick = self._normalize(message) if isinstance(message, dict) else None
+            if tick is not None:
+                return tick
+
+        return None
+
+    def __iter__(self):
+        while not self._closed:
+            tick = self.read_tick()
+            if tick is not None:
+                yield tick
+
+    def close(self) -> None:
+        """스트림을 닫음 (재연결하지 않음)"""
+        self._closed = True
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> "TickerStream":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()